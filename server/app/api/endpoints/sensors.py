@@ -1,16 +1,18 @@
 import logging
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, HTTPException, Query, Path, Depends, Request
+from fastapi import APIRouter, HTTPException, Query, Path, Depends, Request, Response
 from datetime import datetime, timedelta
 
 from app.models.sensor import (
     SensorReading,
     SensorDefinition,
     SensorProviderStatus,
+    SourceStatistics,
     SensorCategory,
     HardwareType,
     DataQuality,
 )
+from app.services.frame_encoder import SnapshotEncoder
 from app.services.sensor_manager import SensorManager
 from app.core.config import get_settings
 
@@ -27,6 +29,15 @@ def get_sensor_manager(request: Request) -> SensorManager:
     return sensor_manager
 
 
+def get_snapshot_encoder(request: Request) -> SnapshotEncoder:
+    """Retrieve the shared snapshot encoder from FastAPI app state."""
+    encoder = getattr(request.app.state, "snapshot_encoder", None)
+    if encoder is None:
+        encoder = SnapshotEncoder()
+        request.app.state.snapshot_encoder = encoder
+    return encoder
+
+
 # Real-time sensor data endpoints using SensorManager
 
 
@@ -48,6 +59,26 @@ async def get_sensor_status(
         )
 
 
+@router.get("/statistics", response_model=Dict[str, SourceStatistics])
+async def get_source_statistics(
+    sensor_manager: SensorManager = Depends(get_sensor_manager),
+) -> Dict[str, SourceStatistics]:
+    """
+    Get collection statistics (updates, errors, timeouts, staleness) per source.
+    """
+    return sensor_manager.get_source_statistics()
+
+
+@router.get("/providers/diagnostics", response_model=Dict[str, Any])
+async def get_provider_diagnostics(
+    sensor_manager: SensorManager = Depends(get_sensor_manager),
+) -> Dict[str, Any]:
+    """
+    Get per-provider diagnostics, such as hardware update timings and backoff.
+    """
+    return sensor_manager.get_provider_diagnostics()
+
+
 @router.get("/definitions", response_model=List[SensorDefinition])
 async def get_sensor_definitions(
     source: Optional[str] = Query(None, description="Filter by sensor source ID"),
@@ -62,16 +93,22 @@ async def get_sensor_definitions(
 @router.get("/data/all", response_model=Dict[str, List[SensorReading]])
 async def get_all_sensor_data(
     sensor_manager: SensorManager = Depends(get_sensor_manager),
-) -> Dict[str, List[SensorReading]]:
+    encoder: SnapshotEncoder = Depends(get_snapshot_encoder),
+) -> Response:
     """
     Get current data readings from all active sensors, grouped by source.
+    Served from the same pre-encoded snapshot bytes used for broadcasts.
     """
     logger.info("Fetching all current sensor data")
 
     try:
-        all_data = await sensor_manager.get_all_sensor_data()
-        logger.info(f"Retrieved data from {len(all_data)} sensor sources")
-        return all_data
+        snapshot = await sensor_manager.get_latest_snapshot()
+        if snapshot is None:
+            return Response(content=b"{}", media_type="application/json")
+        logger.info(f"Retrieved data from {len(snapshot.readings)} sensor sources")
+        return Response(
+            content=encoder.encode(snapshot).sources, media_type="application/json"
+        )
 
     except Exception as e:
         logger.error(f"Error retrieving all sensor data: {e}", exc_info=True)
@@ -153,15 +190,8 @@ async def get_sensor_data(
     logger.info("Fetching data for sensor_id: %s with limit: %s", sensor_id, limit)
 
     try:
-        # Get all current sensor data
-        all_data = await sensor_manager.get_all_sensor_data()
-
-        # Find readings for the specific sensor
-        sensor_readings = []
-        for source_id, readings in all_data.items():
-            for reading in readings:
-                if reading.sensor_id == sensor_id:
-                    sensor_readings.append(reading)
+        # History is kept newest-first in per-sensor ring buffers
+        sensor_readings = await sensor_manager.get_sensor_history(sensor_id, limit)
 
         if not sensor_readings:
             logger.info(
@@ -169,12 +199,7 @@ async def get_sensor_data(
             )
             return []
 
-        # Sort by timestamp descending to get the most recent readings
-        sorted_readings = sorted(
-            sensor_readings, key=lambda r: r.timestamp, reverse=True
-        )
-
-        return sorted_readings[:limit]
+        return sensor_readings
 
     except Exception as e:
         logger.error(
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 
@@ -24,6 +25,15 @@ class AppSettings(BaseSettings):
             raise ValueError(f"Invalid log level: {v}")
         return level
 
+    @field_validator("sensor_collector_mode")
+    @classmethod
+    def validate_sensor_collector_mode(cls, v: str) -> str:
+        """Validate the sensor collector mode."""
+        mode = v.lower()
+        if mode not in ["inprocess", "process"]:
+            raise ValueError(f"Invalid sensor collector mode: {v}")
+        return mode
+
     # LibreHardwareMonitor (LHM) sensor configuration
     lhm_enable_cpu: bool = True
     lhm_enable_gpu: bool = True
@@ -35,10 +45,62 @@ class AppSettings(BaseSettings):
     lhm_update_interval: int = 2000  # milliseconds
     lhm_include_null_sensors: bool = False
     lhm_float_precision: int = 2
+    lhm_update_budget_ms: float = 50.0  # Per-hardware Update() cost before backing off; 0 disables
+    lhm_max_update_backoff: int = 8  # Slowest backed-off node updates every Nth poll
+
+    # HWiNFO64 shared memory ("Shared Memory Support" must be on in HWiNFO)
+    hwinfo_enabled: bool = False
+    hwinfo_shm_path: Optional[str] = None  # Map this file instead, e.g. an emulated segment
+
+    # Linux hwmon/thermal sysfs provider (used when the root has any sensors)
+    hwmon_enabled: bool = True
+    hwmon_sysfs_root: str = "/sys"  # Point at a fake tree for tests and benchmarks
+    hwmon_include_thermal_zones: bool = True
+
+    # MockSensor: >0 replaces its fixed sensors with this many synthetic ones
+    # (cycling through categories and hardware types) for capacity testing, and
+    # loads MockSensor even when hardware providers (e.g. hwmon, procfs) did
+    mock_sensor_count: int = 0
+
+    # Linux procfs CPU/memory/disk/network load provider
+    procfs_enabled: bool = True
+    procfs_root: str = "/proc"  # Point at fixture files for tests
+    procfs_sysfs_root: str = "/sys"  # class/block tells disks from partitions
 
     # General sensor configuration
     sensor_poll_interval_seconds: int = 5  # How often to poll sensors
+    sensor_idle_poll_interval_seconds: float = 60.0  # Cadence with no clients; 0 pauses polling
     sensor_update_interval: int = 2  # Sensor update interval in seconds
+    sensor_history_size: int = 300  # Samples kept per sensor for history queries
+    sensor_provider_timeout_seconds: float = 3.0  # Per-provider collection deadline
+
+    # Where providers run: "inprocess", or "process" for a separate collector
+    # process publishing through shared memory
+    sensor_collector_mode: str = "inprocess"
+    sensor_collector_capacity: int = 4096  # Max sensors in the shared buffer
+    sensor_collector_start_timeout_seconds: float = 30.0
+
+    # Watchdog: restart providers that produce no data for the deadline
+    sensor_watchdog_enabled: bool = True
+    sensor_watchdog_deadline_seconds: float = 15.0
+    sensor_watchdog_backoff_seconds: float = 5.0  # Doubles per failed attempt
+    sensor_watchdog_max_backoff_seconds: float = 300.0
+
+    # Per-category polling schedule (off: everything at sensor_poll_interval_seconds)
+    sensor_schedule_enabled: bool = False
+    sensor_category_intervals: Dict[str, float] = {}  # e.g. {"temperature": 5, "load": 0.5}
+    sensor_interval_overrides: Dict[str, float] = {}  # Per sensor_id, in seconds
+    sensor_schedule_adaptive: bool = False  # Stretch/shrink cadences by observed change
+
+    # WebSocket streaming configuration
+    ws_keyframe_interval: int = 30  # Delta stream: full keyframe every N frames
+    ws_outbox_size: int = 2  # Sensor frames queued per client before dropping the oldest
+    ws_max_lag_seconds: float = 30.0  # Disconnect clients that keep dropping frames this long
+    ws_replay_buffer_size: int = 120  # Snapshots kept for clients resuming a stream
+
+    # Process metrics configuration
+    metrics_sample_interval_seconds: float = 2.0  # Process/system metrics sampling cadence
+    metrics_loop_lag_interval_seconds: float = 0.25  # Event-loop lag probe cadence
 
     # Pydantic settings configuration
     # Reads from .env file, uses ULTIMON_ prefix for environment variables
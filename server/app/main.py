@@ -1,8 +1,6 @@
 import asyncio
 import time
 import sys
-import os
-import psutil
 from contextlib import asynccontextmanager
 from fastapi import (
     Depends,
@@ -23,6 +21,8 @@ from app.core.logging import setup_logging, get_logger
 from app.middleware.performance import PerformanceMonitoringMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.models.websocket import WebSocketMessage
+from app.services.frame_encoder import SnapshotEncoder
+from app.services.process_metrics import ProcessMetricsSampler
 from app.services.realtime_service import RealTimeService
 from app.services.sensor_manager import SensorManager
 from app.websocket_manager import WebSocketManager
@@ -48,9 +48,14 @@ def get_websocket_manager(websocket: WebSocket) -> WebSocketManager:
 def _create_services() -> tuple[SensorManager, WebSocketManager, RealTimeService]:
     """Factory to create core services."""
     _sensor_manager = SensorManager(settings=settings)
-    _websocket_manager = WebSocketManager()
+    _websocket_manager = WebSocketManager(
+        outbox_size=settings.ws_outbox_size,
+        max_lag_seconds=settings.ws_max_lag_seconds,
+    )
     _realtime_service = RealTimeService(
-        sensor_manager=_sensor_manager, websocket_manager=_websocket_manager
+        sensor_manager=_sensor_manager,
+        websocket_manager=_websocket_manager,
+        snapshot_encoder=SnapshotEncoder(),
     )
     return _sensor_manager, _websocket_manager, _realtime_service
 
@@ -67,16 +72,26 @@ async def lifespan(app: FastAPI):
     app.state.sensor_manager = sensor_manager
     app.state.websocket_manager = websocket_manager
     app.state.realtime_service = realtime_service
+    app.state.snapshot_encoder = realtime_service.snapshot_encoder
     app.state.start_time = time.time()
+    app.state.metrics_sampler = ProcessMetricsSampler(
+        sample_interval=settings.metrics_sample_interval_seconds,
+        lag_interval=settings.metrics_loop_lag_interval_seconds,
+        sensor_manager=sensor_manager,
+        realtime_service=realtime_service,
+        websocket_manager=websocket_manager,
+    )
 
     # Startup logic
     await sensor_manager.initialize()
     await realtime_service.start(settings)
+    await app.state.metrics_sampler.start()
 
     try:
         yield
     finally:
         # Shutdown logic
+        await app.state.metrics_sampler.stop()
         await sensor_manager.shutdown()
         if realtime_service.is_running:
             await realtime_service.stop()
@@ -122,9 +137,28 @@ def create_app() -> FastAPI:
         client_id = f"client_{int(time.time() * 1000)}"
         logger = get_logger().bind(client_id=client_id)
         
+        # Reconnecting clients may resume with ?resume_from=<seq>&stream=<id>
+        resume_from = websocket.query_params.get("resume_from")
+        try:
+            resume_from = int(resume_from) if resume_from is not None else None
+        except ValueError:
+            resume_from = None
+        stream_id = rt_service.sensor_manager.snapshots.stream_id
+
         try:
-            await manager.connect(websocket, client_id)
+            await manager.connect(
+                websocket,
+                client_id,
+                frame_format=websocket.query_params.get("format", "full"),
+                stream_id=stream_id,
+            )
             logger.info("WebSocket client connected")
+            # Catalog plus missed frames or the latest snapshot, without waiting
+            await rt_service.send_initial_state(
+                websocket,
+                resume_from=resume_from,
+                stream_id=websocket.query_params.get("stream"),
+            )
             
             # Simply wait for disconnect - no forced message receiving
             # The client will receive sensor data via broadcasts from the realtime service
@@ -182,9 +216,9 @@ async def read_root():
 @app.get("/health", response_model=dict)
 async def health_check(request: Request):
     """Performs a comprehensive health check of the application."""
-    process = psutil.Process(os.getpid())
-    memory_info = process.memory_info()
-    cpu_percent = process.cpu_percent(interval=0.1)
+    # Metrics come from the background sampler; nothing is measured here
+    sampler: ProcessMetricsSampler = request.app.state.metrics_sampler
+    metrics = sampler.metrics
 
     sensor_manager: SensorManager = request.app.state.sensor_manager
     active_sources = [
@@ -205,13 +239,29 @@ async def health_check(request: Request):
             "debug_mode": settings.debug_mode,
         },
         "system_metrics": {
-            "cpu_percent": cpu_percent,
-            "memory_rss_mb": memory_info.rss / (1024 * 1024),
-            "memory_vms_mb": memory_info.vms / (1024 * 1024),
+            "cpu_percent": metrics.process_cpu_usage,
+            "memory_rss_mb": metrics.memory_usage,
+            "memory_vms_mb": sampler.memory_vms_mb,
+            "open_files": metrics.open_files,
+            "thread_count": metrics.thread_count,
+            "event_loop_lag_ms": metrics.event_loop_lag,
+            "sampled_at": metrics.timestamp.isoformat(),
         },
         "service_status": {
             "active_sensor_sources": active_sources,
             "connected_clients": len(websocket_manager.active_connections),
+            "collection": sensor_manager.get_collection_stats(),
+            "providers": [
+                provider.get_source_info()
+                for provider in sensor_manager.sensor_providers
+            ],
         },
     }
     return JSONResponse(status_code=200, content=health_data)
+
+
+@app.get("/metrics", response_model=dict)
+async def metrics(request: Request):
+    """Latest sampled performance metrics with rolling-window aggregates."""
+    sampler: ProcessMetricsSampler = request.app.state.metrics_sampler
+    return JSONResponse(status_code=200, content=sampler.get_stats())
@@ -0,0 +1,128 @@
+"""
+Lightweight live sensor readings.
+Providers emit one Reading per sensor and poll instead of a validated
+SensorReading model: the sensor's SensorDefinition (shared across polls),
+the value, a status, the observed range and a timestamp shared by the whole
+poll. Attribute names match SensorReading, so the collection and broadcast
+pipeline accepts either; SensorReading models are only built for REST
+responses, through `to_model`.
+"""
+
+from datetime import datetime
+from typing import Any, Optional, Union
+
+from .sensor import DataQuality, SensorDefinition, SensorMetadata, SensorReading, SensorStatus
+
+_METADATA_FIELDS = frozenset(SensorMetadata.model_fields)
+
+
+def reading_metadata(definition: SensorDefinition) -> SensorMetadata:
+    """The SensorMetadata a reading of this sensor carries."""
+    metadata = definition.metadata or {}
+    return SensorMetadata(**{k: v for k, v in metadata.items() if k in _METADATA_FIELDS})
+
+
+class Reading:
+    """One sensor's value from one poll."""
+
+    __slots__ = (
+        "definition",
+        "value",
+        "timestamp",
+        "status",
+        "min_value",
+        "max_value",
+        "parent_hardware",
+    )
+
+    def __init__(
+        self,
+        definition: SensorDefinition,
+        value: Union[float, int],
+        timestamp: datetime,
+        status: SensorStatus = SensorStatus.ACTIVE,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        parent_hardware: Optional[str] = None,
+    ):
+        self.definition = definition
+        self.value = value
+        self.timestamp = timestamp  # One datetime shared by every reading of the poll
+        self.status = status
+        # Observed range where the provider tracks one, else the definition's
+        self.min_value = definition.min_value if min_value is None else min_value
+        self.max_value = definition.max_value if max_value is None else max_value
+        self.parent_hardware = parent_hardware
+
+    # Static fields, read through from the definition
+
+    @property
+    def sensor_id(self) -> str:
+        return self.definition.sensor_id
+
+    @property
+    def name(self) -> str:
+        return self.definition.name
+
+    @property
+    def unit(self) -> str:
+        return self.definition.unit
+
+    @property
+    def category(self) -> Any:
+        return self.definition.category
+
+    @property
+    def hardware_type(self) -> Any:
+        return self.definition.hardware_type
+
+    @property
+    def source(self) -> str:
+        return self.definition.source_id
+
+    @property
+    def quality(self) -> str:
+        return DataQuality.GOOD.value
+
+    @property
+    def last_updated(self) -> Optional[datetime]:
+        return None
+
+    @property
+    def metadata(self) -> SensorMetadata:
+        return reading_metadata(self.definition)
+
+    def to_model(self, **update: Any) -> SensorReading:
+        """Build the validated SensorReading, e.g. for a REST response."""
+        fields = {
+            "sensor_id": self.definition.sensor_id,
+            "name": self.definition.name,
+            "value": self.value,
+            "unit": self.definition.unit,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "category": self.definition.category,
+            "hardware_type": self.definition.hardware_type,
+            "source": self.definition.source_id,
+            "parent_hardware": self.parent_hardware,
+            "status": self.status,
+            "timestamp": self.timestamp,
+            "metadata": self.metadata,
+        }
+        fields.update(update)
+        return SensorReading(**fields)
+
+    def __repr__(self) -> str:
+        return f"Reading({self.definition.sensor_id!r}, {self.value!r})"
+
+
+# What providers, snapshots and encoders carry; SensorReading is still
+# accepted wherever a Reading is, e.g. from tests and older callers
+AnyReading = Union[Reading, SensorReading]
+
+
+def to_model(reading: AnyReading, **update: Any) -> SensorReading:
+    """A SensorReading for either kind of reading."""
+    if isinstance(reading, SensorReading):
+        return reading.model_copy(update=update) if update else reading
+    return reading.to_model(**update)
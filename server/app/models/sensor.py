@@ -16,6 +16,7 @@ class SensorProviderStatus(BaseModel):
     source_id: str
     available: bool
     sensor_count: int
+    stale: bool = False
 
 
 class SensorStatus(str, Enum):
@@ -189,7 +190,10 @@ class SourceStatistics(BaseModel):
     active_sensors: int = 0
     update_count: int = 0
     error_count: int = 0
+    timeout_count: int = 0
+    stale: bool = False
     average_update_time: float = 0.0
+    hardware_update_times: Dict[str, float] = Field(default_factory=dict)
     data_throughput: float = 0.0
     last_error: Optional[str] = None
 
@@ -321,6 +325,19 @@ class PerformanceMetrics(BaseModel):
     memory_usage: float = Field(0.0, ge=0, description="Memory usage in MB")
     network_usage: float = Field(0.0, ge=0, description="Network usage in bytes/sec")
 
+    # Process metrics
+    process_cpu_usage: float = Field(
+        0.0, ge=0, description="Server process CPU usage percentage (per core)"
+    )
+    open_files: int = Field(0, ge=0, description="Open file descriptors or handles")
+    thread_count: int = Field(0, ge=0, description="Server process thread count")
+    event_loop_lag: float = Field(
+        0.0, ge=0, description="Recent event-loop scheduling lag in milliseconds"
+    )
+    max_event_loop_lag: float = Field(
+        0.0, ge=0, description="Worst event-loop lag in the rolling window (ms)"
+    )
+
     # Application metrics
     update_latency: float = Field(
         0.0, ge=0, description="Update latency in milliseconds"
@@ -13,7 +13,7 @@ AVAILABLE_SENSOR_CLASSES = [
     MockSensor,  # Mock data is always safe to import
     # HWSensor,      # Removed to prevent eager loading
     # LHMSensor,     # Removed to prevent eager loading
-    # HWiNFOSensor,  # Disabled for now
+    # HWiNFOSensor,  # Opt-in through hwinfo_enabled
 ]
 
 # Dictionary to map source names to sensor classes for easy lookup
@@ -3,8 +3,9 @@ Abstract base class for sensor data sources.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Any, Optional, Dict
-from ..models.sensor import SensorReading, SensorDefinition
+from typing import AbstractSet, List, Any, Optional, Dict
+from ..models.reading import Reading
+from ..models.sensor import SensorDefinition
 from ..core.config import AppSettings
 
 
@@ -17,6 +18,12 @@ class BaseSensor(ABC):
         self.display_name = display_name  # User-friendly name for the provider
         self.is_active = False
         self.last_error: Optional[str] = None
+        # Set while the readings returned are a last-good snapshot rather than
+        # fresh values (e.g. relayed from another process); None otherwise
+        self.stale_reason: Optional[str] = None
+        # Bumped whenever get_available_sensors() would return something new
+        # (e.g. a device appeared); the SensorManager then re-registers them
+        self.definitions_version = 0
         self.app_settings: Optional[
             AppSettings
         ] = None  # To store settings after initialization
@@ -58,13 +65,35 @@ class BaseSensor(ABC):
         pass
 
     @abstractmethod
-    async def get_current_data(self) -> List[SensorReading]:
+    async def get_current_data(self) -> List[Reading]:
         """
         Get current sensor readings for all sensors provided by this source.
-        Returns list of SensorReading objects.
+        Returns list of Reading objects (SensorReading models are also accepted).
         """
         pass
 
+    async def restart(self, app_settings: AppSettings) -> bool:
+        """
+        Tear the provider down and initialize it again, e.g. after a hung
+        read. Returns whether the provider is available afterwards.
+        """
+        await self.close()
+        await self.initialize(app_settings)
+        return await self.is_available()
+
+    async def get_current_data_for(
+        self, sensor_ids: Optional[AbstractSet[str]] = None
+    ) -> List[Reading]:
+        """
+        Get current readings for the given sensors only (all when None).
+        Providers that can read a subset of their sensors more cheaply than
+        all of them override this; the default reads everything and filters.
+        """
+        readings = await self.get_current_data()
+        if sensor_ids is None:
+            return readings
+        return [reading for reading in readings if reading.sensor_id in sensor_ids]
+
     async def get_sensor_definition_by_id(
         self, sensor_id: str
     ) -> Optional[SensorDefinition]:
@@ -87,6 +116,10 @@ class BaseSensor(ABC):
             if sensor_def.category.value == category
         ]
 
+    def get_update_timings(self) -> Dict[str, float]:
+        """Average update cost per hardware component (ms), where measured."""
+        return {}
+
     def get_source_info(self) -> Dict[str, Any]:
         """Get information about this sensor source provider."""
         return {
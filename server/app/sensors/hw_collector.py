@@ -0,0 +1,149 @@
+"""
+Dedicated collector thread for the HardwareMonitor (LHM) library.
+The pythonnet Computer object is created, used and closed on this one thread
+so blocking .NET calls never run on the asyncio event loop.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from ..core.logging import get_logger
+
+T = TypeVar("T")
+
+# Sentinel pushed onto the request queue to stop the thread
+_STOP = object()
+
+
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _reject(future: asyncio.Future, error: BaseException) -> None:
+    if not future.done():
+        future.set_exception(error)
+
+
+class HardwareCollectorThread:
+    """Single-owner worker thread that serves requests against one Computer."""
+
+    def __init__(self, name: str = "lhm-collector"):
+        self.name = name
+        self.logger = get_logger("hw_collector")
+        self.computer: Any = None
+        self._requests: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+        # Timing statistics (milliseconds)
+        self.requests_served = 0
+        self.last_work_ms = 0.0
+        self.total_work_ms = 0.0
+        self.max_work_ms = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread if it is not already running."""
+        if self.is_running:
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Collector thread '{self.name}' started")
+
+    async def submit(self, func: Callable[[Any], T]) -> T:
+        """
+        Run `func(computer)` on the collector thread and await its result.
+        The event loop is free while the thread does the work.
+        """
+        if not self.is_running:
+            raise RuntimeError(f"Collector thread '{self.name}' is not running")
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._requests.put((func, loop, future))
+        return await future
+
+    async def open(self, factory: Callable[[], Any]) -> Any:
+        """Create the Computer on the collector thread and keep ownership of it."""
+
+        def _open(_: Any) -> Any:
+            self.computer = factory()
+            return self.computer
+
+        return await self.submit(_open)
+
+    async def stop(
+        self, close: Optional[Callable[[Any], None]] = None, timeout: float = 5.0
+    ) -> None:
+        """
+        Optionally close the Computer on its own thread, then stop the thread.
+        A thread stuck in a native call cannot be interrupted; after `timeout`
+        it is abandoned (it is a daemon) and will exit if the call ever returns.
+        """
+        if not self.is_running:
+            return
+        if close is not None and self.computer is not None:
+            try:
+                await asyncio.wait_for(self.submit(close), timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    f"Collector thread '{self.name}' did not close the computer "
+                    f"within {timeout}s; abandoning it"
+                )
+            except Exception as e:
+                self.logger.error(f"Error closing computer on collector thread: {e}")
+        self.computer = None
+        self._requests.put(_STOP)
+        thread = self._thread
+        self._thread = None
+        if thread is not None:
+            await asyncio.get_running_loop().run_in_executor(None, thread.join, timeout)
+        self.logger.info(f"Collector thread '{self.name}' stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Timing statistics for work done on the collector thread."""
+        served = self.requests_served
+        return {
+            "thread": self.name,
+            "running": self.is_running,
+            "pending_requests": self._requests.qsize(),
+            "requests_served": served,
+            "last_work_ms": round(self.last_work_ms, 3),
+            "average_work_ms": round(self.total_work_ms / served, 3) if served else 0.0,
+            "max_work_ms": round(self.max_work_ms, 3),
+        }
+
+    def _run(self) -> None:
+        while True:
+            item = self._requests.get()
+            if item is _STOP:
+                break
+            func, loop, future = item
+            started = time.perf_counter()
+            try:
+                result = func(self.computer)
+            except BaseException as e:  # Forward everything to the awaiting coroutine
+                self._finish(started)
+                self._complete(loop, _reject, future, e)
+            else:
+                self._finish(started)
+                self._complete(loop, _resolve, future, result)
+
+    def _finish(self, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.requests_served += 1
+        self.last_work_ms = elapsed_ms
+        self.total_work_ms += elapsed_ms
+        self.max_work_ms = max(self.max_work_ms, elapsed_ms)
+
+    def _complete(self, loop, callback, future, value) -> None:
+        try:
+            loop.call_soon_threadsafe(callback, future, value)
+        except RuntimeError:
+            # Event loop already closed; nobody is waiting any more
+            pass
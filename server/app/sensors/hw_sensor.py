@@ -5,23 +5,28 @@ This is the primary sensor source with fallback to other implementations.
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import math
+import time
+from array import array
+from typing import AbstractSet, List, Dict, Any, Optional
 from datetime import datetime
 
 from ..core.config import AppSettings
 from ..core.logging import get_logger
+from ..models.reading import Reading
 from ..models.sensor import (
     SensorDefinition,
-    SensorReading,
     SensorStatus,
     SensorCategory,
     HardwareType,
 )
 from .base import BaseSensor
+from .hw_collector import HardwareCollectorThread
+from .update_profiler import HardwareUpdateProfiler
 
 try:
     import HardwareMonitor
-    from HardwareMonitor.Util import OpenComputer, ToBuiltinTypes, SensorValueToString
+    from HardwareMonitor.Util import OpenComputer
 
     # from HardwareMonitor.Hardware import SensorType, HardwareType # Not used directly
     HARDWARE_MONITOR_AVAILABLE = True
@@ -36,6 +41,59 @@ except Exception as e:
     _hw_import_error = str(e)
 
 
+# Characters that are not allowed in generated sensor IDs
+_SENSOR_ID_TRANSLATION = str.maketrans({" ": "_", "/": "_", "\\": "_"})
+
+
+class _SensorHandle:
+    """Everything static about one native sensor, resolved at discovery."""
+
+    __slots__ = (
+        "index",
+        "sensor_id",
+        "name",
+        "hardware_name",
+        "hardware_type",
+        "category",
+        "unit",
+        "native",
+        "hardware",
+        "definition",
+    )
+
+    def __init__(
+        self,
+        index: int,
+        sensor_id: str,
+        name: str,
+        hardware_name: str,
+        hardware_type: HardwareType,
+        category: SensorCategory,
+        unit: str,
+        native: Any,
+        hardware: Any,
+    ):
+        self.index = index
+        self.sensor_id = sensor_id
+        self.name = name
+        self.hardware_name = hardware_name
+        self.hardware_type = hardware_type
+        self.category = category
+        self.unit = unit
+        self.native = native
+        self.hardware = hardware  # Owning IHardware node, updated per poll
+        # Shared by every Reading of this sensor
+        self.definition = SensorDefinition(
+            sensor_id=sensor_id,
+            name=name,
+            category=category,
+            hardware_type=hardware_type,
+            unit=unit,
+            source_id=HWSensor.source_id,
+            description=f"{hardware_name} - {name}",
+        )
+
+
 class HWSensor(BaseSensor):
     """Primary sensor implementation using HardwareMonitor Python package."""
 
@@ -46,9 +104,32 @@ class HWSensor(BaseSensor):
         super().__init__(display_name=self.display_name)
         self.logger = get_logger("hw_sensor")
         self.computer = None
+        self._collector = HardwareCollectorThread()
         self._initialized = False
         self._available = False
 
+        # Resolved sensor handles and their value columns; only touched
+        # on the collector thread.
+        self._handles: List[_SensorHandle] = []
+        self._values = array("d")
+        self._min_values = array("d")
+        self._max_values = array("d")
+        self._hardware_nodes = 0
+
+        # Hardware nodes refreshed vs. left alone because none of their
+        # sensors were requested
+        self.hardware_updates = 0
+        self.hardware_updates_skipped = 0
+        # Per-node Update() timings and backoff of slow nodes
+        self.update_profiler = HardwareUpdateProfiler()
+
+        # Event-loop side timing of the last poll (milliseconds): the whole
+        # await, and the part of it not spent in the collector's work, i.e.
+        # queueing behind other requests plus resuming on the loop
+        self._last_wait_ms = 0.0
+        self._last_handoff_ms = 0.0
+        self._max_handoff_ms = 0.0
+
     async def initialize(self, settings: AppSettings) -> None:
         """Initialize the HardwareMonitor sensor."""
         self.logger.info("[INIT] Starting HardwareMonitor initialization...")
@@ -62,6 +143,11 @@ class HWSensor(BaseSensor):
             self.logger.info("      - Run as Administrator")
             return
 
+        self.update_profiler = HardwareUpdateProfiler(
+            budget_ms=settings.lhm_update_budget_ms,
+            max_backoff=settings.lhm_max_update_backoff,
+        )
+
         try:
             # Check admin privileges first
             is_admin = False
@@ -82,29 +168,35 @@ class HWSensor(BaseSensor):
                 )
 
             self.logger.info("Initializing HardwareMonitor computer...")
-            self.computer = OpenComputer(
-                cpu=True,
-                gpu=True,
-                motherboard=True,
-                memory=True,
-                storage=True,
-                network=True,
-                controller=True,
+            # The Computer is created on, and owned by, the collector thread
+            self._collector.start()
+            enabled = {
+                "cpu": settings.lhm_enable_cpu,
+                "gpu": settings.lhm_enable_gpu,
+                "motherboard": settings.lhm_enable_motherboard,
+                "memory": settings.lhm_enable_memory,
+                "storage": settings.lhm_enable_storage,
+                "network": settings.lhm_enable_network,
+                "controller": settings.lhm_enable_controller,
+            }
+            disabled = [name for name, flag in enabled.items() if not flag]
+            if disabled:
+                self.logger.info(f"Hardware groups disabled: {', '.join(disabled)}")
+            self.computer = await self._collector.open(
+                lambda: OpenComputer(**enabled)
             )
 
             if self.computer:
                 self.logger.info("[OK] HardwareMonitor computer initialized successfully!")
-                self.computer.Update()
-                hardware_list = ToBuiltinTypes(self.computer.Hardware)
-                self.logger.info(
-                    f"Found {len(hardware_list) if hardware_list else 0} hardware components"
-                )
+                hardware_count = await self._collector.submit(self._count_hardware)
+                self.logger.info(f"Found {hardware_count} hardware components")
                 self._initialized = True
                 self._available = True
             else:
                 self.logger.error(
                     "[FAIL] Failed to initialize HardwareMonitor computer (returned None)"
                 )
+                await self._collector.stop()
 
         except Exception as e:
             self.logger.error(
@@ -112,6 +204,7 @@ class HWSensor(BaseSensor):
             )
             self._initialized = False
             self._available = False
+            await self._collector.stop()
 
     async def is_available(self) -> bool:
         """Check if HardwareMonitor is available and working."""
@@ -122,50 +215,9 @@ class HWSensor(BaseSensor):
         if not await self.is_available():
             return []
 
-        sensors = []
+        sensors: List[SensorDefinition] = []
         try:
-            self.computer.Update()
-            data = ToBuiltinTypes(self.computer.Hardware)
-
-            if not data:
-                self.logger.warning("No hardware data available from HardwareMonitor")
-                return []
-
-            for hardware in data:
-                if not hardware or "Sensors" not in hardware:
-                    continue
-
-                hardware_name = hardware.get("Name", "Unknown Hardware")
-                hardware_type = self._map_hardware_type(hardware.get("HardwareType"))
-
-                for sensor in hardware["Sensors"]:
-                    if not sensor:
-                        continue
-
-                    sensor_name = sensor.get("Name", "Unknown Sensor")
-                    sensor_type = sensor.get("SensorType")
-
-                    sensor_id = (
-                        f"{self.source_id}_{hardware_name}_{sensor_name}".replace(
-                            " ", "_"
-                        )
-                        .replace("/", "_")
-                        .replace("\\", "_")
-                    )
-
-                    sensor_def = SensorDefinition(
-                        sensor_id=sensor_id,
-                        name=sensor_name,
-                        category=self._map_sensor_type_to_category(sensor_type),
-                        hardware_type=hardware_type,
-                        unit=self._get_sensor_unit(sensor_type),
-                        source_id=self.source_id,
-                        description=f"{hardware_name} - {sensor_name}",
-                        min_value=sensor.get("Min"),
-                        max_value=sensor.get("Max"),
-                    )
-                    sensors.append(sensor_def)
-
+            sensors = await self._collector.submit(self._discover_sensors)
         except Exception as e:
             self.logger.error(
                 f"Error getting available sensors from HardwareMonitor: {e}",
@@ -175,77 +227,250 @@ class HWSensor(BaseSensor):
         self.logger.info(f"Found {len(sensors)} sensors in HardwareMonitor")
         return sensors
 
-    async def get_current_data(self) -> List[SensorReading]:
+    async def get_current_data(self) -> List[Reading]:
         """Get current sensor readings from HardwareMonitor."""
+        return await self.get_current_data_for(None)
+
+    async def get_current_data_for(
+        self, sensor_ids: Optional[AbstractSet[str]] = None
+    ) -> List[Reading]:
+        """
+        Get current readings for the given sensors (all when None). Errors
+        from the collector thread propagate, so the SensorManager keeps the
+        last good readings as stale and the watchdog sees the failure.
+        """
         if not await self.is_available():
             return []
 
-        readings = []
         try:
-            self.computer.Update()
-            data = ToBuiltinTypes(self.computer.Hardware)
-            timestamp = datetime.now()
-
-            if not data:
-                return []
-
-            for hardware in data:
-                if not hardware or "Sensors" not in hardware:
-                    continue
-
-                hardware_name = hardware.get("Name", "Unknown Hardware")
-                hardware_type = self._map_hardware_type(hardware.get("HardwareType"))
-
-                for sensor in hardware["Sensors"]:
-                    if not sensor or sensor.get("Value") is None:
-                        continue
-
-                    sensor_name = sensor.get("Name", "Unknown Sensor")
-                    sensor_type = sensor.get("SensorType")
-                    sensor_id = (
-                        f"{self.source_id}_{hardware_name}_{sensor_name}".replace(
-                            " ", "_"
-                        )
-                        .replace("/", "_")
-                        .replace("\\", "_")
-                    )
-
-                    reading = SensorReading(
-                        sensor_id=sensor_id,
-                        name=sensor_name,
-                        value=float(sensor["Value"]),
-                        unit=self._get_sensor_unit(sensor_type),
-                        category=self._map_sensor_type_to_category(sensor_type),
-                        hardware_type=hardware_type,
-                        source=self.source_id,
-                        timestamp=timestamp,
-                        status=SensorStatus.ACTIVE,
-                        min_value=sensor.get("Min"),
-                        max_value=sensor.get("Max"),
-                        parent_hardware=hardware_name,
-                    )
-                    readings.append(reading)
-
-        except Exception as e:
-            self.logger.error(
-                f"Error getting current data from HardwareMonitor: {e}", exc_info=True
+            submitted = time.perf_counter()
+            readings = await self._collector.submit(
+                lambda computer: self._read_snapshot(computer, sensor_ids)
             )
-
+        except Exception:
+            self._last_wait_ms = 0.0
+            self._last_handoff_ms = 0.0
+            raise
+
+        self._last_wait_ms = (time.perf_counter() - submitted) * 1000
+        self._last_handoff_ms = max(0.0, self._last_wait_ms - self._collector.last_work_ms)
+        self._max_handoff_ms = max(self._max_handoff_ms, self._last_handoff_ms)
         return readings
 
     async def close(self) -> None:
         """Close the HardwareMonitor sensor."""
         try:
-            if self.computer:
-                self.computer.Close()
-                self.logger.info("HardwareMonitor computer closed")
+            await self._collector.stop(close=self._close_computer)
         except Exception as e:
             self.logger.error(f"Error closing HardwareMonitor: {e}", exc_info=True)
         finally:
             self.computer = None
+            self._handles = []
             self._initialized = False
             self._available = False
 
+    async def restart(self, settings: AppSettings) -> bool:
+        """Close, then reopen the Computer on a fresh collector thread."""
+        await self.close()
+        # The old thread may still be stuck in a native call
+        self._collector = HardwareCollectorThread()
+        await self.initialize(settings)
+        return await self.is_available()
+
+    def get_source_info(self) -> Dict[str, Any]:
+        """Source info including collector thread work and handoff timings."""
+        info = super().get_source_info()
+        info["collector"] = {
+            **self._collector.get_stats(),
+            "last_wait_ms": round(self._last_wait_ms, 3),
+            "last_handoff_ms": round(self._last_handoff_ms, 3),
+            "max_handoff_ms": round(self._max_handoff_ms, 3),
+        }
+        info["hardware"] = {
+            "nodes": self._hardware_nodes,
+            "updates": self.hardware_updates,
+            "updates_skipped": self.hardware_updates_skipped,
+        }
+        info["update_profile"] = self.update_profiler.get_stats()
+        return info
+
+    def get_update_timings(self) -> Dict[str, float]:
+        """Smoothed Update() cost per hardware node (milliseconds)."""
+        return self.update_profiler.average_update_times()
+
+    # -------------------------------------------------------------
+    # Collector-thread work. These run with exclusive access to the
+    # Computer and must never be called from the event loop.
+    # -------------------------------------------------------------
+
+    def _count_hardware(self, computer) -> int:
+        computer.Update()
+        return len(list(computer.Hardware))
+
+    def _close_computer(self, computer) -> None:
+        computer.Close()
+        self.logger.info("HardwareMonitor computer closed")
+
+    def _iter_hardware(self, computer):
+        """Yield every hardware node, including sub-hardware such as SuperIO chips."""
+        for hardware in computer.Hardware:
+            yield hardware
+            for sub_hardware in hardware.SubHardware:
+                yield sub_hardware
+
+    def _build_handle_table(self, computer) -> None:
+        """Resolve every native sensor once and cache everything static about it."""
+        handles: List[_SensorHandle] = []
+        nodes = 0
+        self.update_profiler.clear()
+        for hardware in self._iter_hardware(computer):
+            nodes += 1
+            hardware_name = str(hardware.Name) or "Unknown Hardware"
+            hardware_type = self._map_hardware_type(str(hardware.HardwareType))
+            self.update_profiler.register(
+                id(hardware), hardware_name, str(hardware.HardwareType)
+            )
+
+            for sensor in hardware.Sensors:
+                sensor_name = str(sensor.Name) or "Unknown Sensor"
+                sensor_type = str(sensor.SensorType)
+                handles.append(
+                    _SensorHandle(
+                        index=len(handles),
+                        sensor_id=f"{self.source_id}_{hardware_name}_{sensor_name}".translate(
+                            _SENSOR_ID_TRANSLATION
+                        ),
+                        name=sensor_name,
+                        hardware_name=hardware_name,
+                        hardware_type=hardware_type,
+                        category=self._map_sensor_type_to_category(sensor_type),
+                        unit=self._get_sensor_unit(sensor_type),
+                        native=sensor,
+                        hardware=hardware,
+                    )
+                )
+
+        count = len(handles)
+        self._handles = handles
+        self._hardware_nodes = nodes
+        # Preallocated per-sensor columns, overwritten in place on every poll
+        self._values = array("d", [math.nan]) * count
+        self._min_values = array("d", [math.inf]) * count
+        self._max_values = array("d", [-math.inf]) * count
+        self.logger.info(f"Resolved {count} sensor handles")
+
+    def _discover_sensors(self, computer) -> List[SensorDefinition]:
+        computer.Update()
+        self._build_handle_table(computer)
+
+        if not self._handles:
+            self.logger.warning("No hardware data available from HardwareMonitor")
+            return []
+
+        sensors = []
+        for handle in self._handles:
+            native = handle.native
+            sensors.append(
+                SensorDefinition(
+                    sensor_id=handle.sensor_id,
+                    name=handle.name,
+                    category=handle.category,
+                    hardware_type=handle.hardware_type,
+                    unit=handle.unit,
+                    source_id=self.source_id,
+                    description=f"{handle.hardware_name} - {handle.name}",
+                    min_value=native.Min,
+                    max_value=native.Max,
+                )
+            )
+        return sensors
+
+    def _select_handles(
+        self, sensor_ids: Optional[AbstractSet[str]]
+    ) -> List[_SensorHandle]:
+        if sensor_ids is None:
+            return self._handles
+        return [handle for handle in self._handles if handle.sensor_id in sensor_ids]
+
+    def _update_hardware(self, handles: List[_SensorHandle]) -> List[_SensorHandle]:
+        """
+        Call Update() on just the hardware nodes owning the given sensors.
+        Unrequested nodes keep their previous values, so expensive reads such
+        as storage SMART data or the motherboard's SuperIO chip only happen
+        while one of their sensors is wanted. Nodes backed off by the update
+        profiler sit out some polls; returns the handles that were refreshed.
+        """
+        profiler = self.update_profiler
+        perf_counter = time.perf_counter
+        refreshed: Dict[int, bool] = {}
+        for handle in handles:
+            key = id(handle.hardware)
+            if key in refreshed:
+                continue
+            if not profiler.should_update(key):
+                refreshed[key] = False
+                continue
+            started = perf_counter()
+            handle.hardware.Update()
+            profiler.record(key, (perf_counter() - started) * 1000)
+            refreshed[key] = True
+        updated = sum(refreshed.values())
+        self.hardware_updates += updated
+        self.hardware_updates_skipped += self._hardware_nodes - updated
+        if updated == len(refreshed):
+            return handles
+        return [handle for handle in handles if refreshed[id(handle.hardware)]]
+
+    def _poll_values(self, handles: List[_SensorHandle]) -> None:
+        """Read `.Value` from the given handles into the preallocated arrays."""
+        values = self._values
+        min_values = self._min_values
+        max_values = self._max_values
+        nan = math.nan
+        for handle in handles:
+            index = handle.index
+            value = handle.native.Value
+            if value is None:
+                values[index] = nan
+                continue
+            value = float(value)
+            values[index] = value
+            if value < min_values[index]:
+                min_values[index] = value
+            if value > max_values[index]:
+                max_values[index] = value
+
+    def _read_snapshot(
+        self, computer, sensor_ids: Optional[AbstractSet[str]] = None
+    ) -> List[Reading]:
+        if not self._handles:
+            computer.Update()
+            self._build_handle_table(computer)
+            handles = self._select_handles(sensor_ids)
+        else:
+            handles = self._update_hardware(self._select_handles(sensor_ids))
+        self._poll_values(handles)
+        timestamp = datetime.now()
+
+        readings = []
+        values = self._values
+        for handle in handles:
+            value = values[handle.index]
+            if value != value:  # NaN: sensor currently has no value
+                continue
+            readings.append(
+                Reading(
+                    handle.definition,
+                    value,
+                    timestamp,
+                    SensorStatus.ACTIVE,
+                    min_value=self._min_values[handle.index],
+                    max_value=self._max_values[handle.index],
+                    parent_hardware=handle.hardware_name,
+                )
+            )
+        return readings
+
     def _map_hardware_type(self, hw_type_str: Optional[str]) -> HardwareType:
         """Maps hardware type string from library to HardwareType enum."""
         if not hw_type_str:
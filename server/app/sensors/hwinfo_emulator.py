@@ -0,0 +1,154 @@
+"""
+File-backed emulator of the HWiNFO SM2 shared-memory segment.
+Writes a file with HWiNFO's layout that HWiNFOSharedMemory can map in place
+of the real segment, so the HWiNFO provider, its tests and benchmarks run on
+any platform. Values are updated in place like HWiNFO does.
+"""
+
+import mmap
+import os
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .hwinfo_shm import (
+    HEADER,
+    READING_ELEMENT_SIZE_UTF8,
+    SENSOR_ELEMENT_SIZE_UTF8,
+    SIGNATURE_ACTIVE,
+    SIGNATURE_DEAD,
+    reading_dtype,
+    sensor_dtype,
+)
+
+# (label, unit, SENSOR_READING_TYPE, value)
+ReadingSpec = Tuple[str, str, int, float]
+# (sensor name, readings)
+SensorSpec = Tuple[str, Sequence[ReadingSpec]]
+
+
+class HWiNFOEmulator:
+    """Owns one emulated segment file; call `close` when done."""
+
+    def __init__(
+        self,
+        path: str,
+        sensors: Sequence[SensorSpec],
+        sensor_element_size: int = SENSOR_ELEMENT_SIZE_UTF8,
+        reading_element_size: int = READING_ELEMENT_SIZE_UTF8,
+    ):
+        self.path = path
+        self.sensor_element_size = sensor_element_size
+        self.reading_element_size = reading_element_size
+        self._mm: Optional[mmap.mmap] = None
+        self._file = None
+        self.readings = None  # Structured view for in-place updates
+        self.write_layout(sensors)
+
+    @classmethod
+    def synthetic(cls, path: str, reading_count: int, per_sensor: int = 20) -> "HWiNFOEmulator":
+        """An emulator with `reading_count` temperature readings, for benchmarks."""
+        sensors: List[SensorSpec] = []
+        for start in range(0, reading_count, per_sensor):
+            count = min(per_sensor, reading_count - start)
+            sensors.append(
+                (
+                    f"CPU [#{start // per_sensor}]: Synthetic",
+                    [(f"Core #{i}", "°C", 1, 40.0 + i % 30) for i in range(count)],
+                )
+            )
+        return cls(path, sensors)
+
+    def write_layout(self, sensors: Sequence[SensorSpec]) -> None:
+        """(Re)write the whole segment for a new set of sensors and readings."""
+        self._release()
+        sensor_array = np.zeros(len(sensors), dtype=sensor_dtype(self.sensor_element_size))
+        reading_specs = [
+            (sensor_index, reading_id, spec)
+            for sensor_index, (_, readings) in enumerate(sensors)
+            for reading_id, spec in enumerate(readings)
+        ]
+        reading_array = np.zeros(
+            len(reading_specs), dtype=reading_dtype(self.reading_element_size)
+        )
+        has_utf8 = "label_utf8" in reading_array.dtype.names
+
+        for index, (name, _) in enumerate(sensors):
+            element = sensor_array[index]
+            element["sensor_id"] = 0xF0000000 + index
+            element["name_orig"] = name.encode("latin-1", "replace")
+            element["name_user"] = name.encode("latin-1", "replace")
+            if "name_utf8" in sensor_array.dtype.names:
+                element["name_utf8"] = name.encode("utf-8")
+        for index, (sensor_index, reading_id, (label, unit, reading_type, value)) in enumerate(
+            reading_specs
+        ):
+            element = reading_array[index]
+            element["type"] = reading_type
+            element["sensor_index"] = sensor_index
+            element["reading_id"] = 0x1000000 + reading_id
+            element["label_orig"] = label.encode("latin-1", "replace")
+            element["label_user"] = label.encode("latin-1", "replace")
+            element["unit"] = unit.encode("latin-1", "replace")
+            for field in ("value", "value_min", "value_max", "value_avg"):
+                element[field] = value
+            if has_utf8:
+                element["label_utf8"] = label.encode("utf-8")
+                element["unit_utf8"] = unit.encode("utf-8")
+
+        sensor_offset = HEADER.size
+        reading_offset = sensor_offset + sensor_array.nbytes
+        header = HEADER.pack(
+            SIGNATURE_ACTIVE,
+            2,  # Version
+            0,  # Revision
+            int(time.time()),
+            sensor_offset,
+            self.sensor_element_size,
+            len(sensor_array),
+            reading_offset,
+            self.reading_element_size,
+            len(reading_array),
+            1000,  # Polling period (ms)
+        )
+        # Rewritten in place, never truncated: shrinking a file that a reader
+        # has mapped would fault the reader
+        mode = "r+b" if os.path.exists(self.path) else "wb"
+        with open(self.path, mode) as f:
+            f.write(header + sensor_array.tobytes() + reading_array.tobytes())
+
+        self._file = open(self.path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self.readings = np.ndarray(
+            (len(reading_array),), dtype=reading_array.dtype, buffer=self._mm, offset=reading_offset
+        )
+
+    def set_values(self, values) -> None:
+        """Overwrite every reading's value in place and stamp the poll time."""
+        readings = self.readings
+        readings["value"] = values
+        np.minimum(readings["value_min"], readings["value"], out=readings["value_min"])
+        np.maximum(readings["value_max"], readings["value"], out=readings["value_max"])
+        self._set_header_field(3, int(time.time()))
+
+    def mark_dead(self) -> None:
+        """What HWiNFO leaves behind when it exits."""
+        self._set_header_field(0, SIGNATURE_DEAD)
+
+    def _set_header_field(self, index: int, value: int) -> None:
+        fields = list(HEADER.unpack_from(self._mm, 0))
+        fields[index] = value
+        HEADER.pack_into(self._mm, 0, *fields)
+
+    def _release(self) -> None:
+        self.readings = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        self._release()
@@ -0,0 +1,380 @@
+"""
+HWiNFO "SM2" shared-memory layout and a vectorized reader.
+The segment is mapped once and its sensor and reading arrays are viewed in
+place through NumPy structured dtypes built from the offsets and element
+sizes in the header, so every poll is a single strided copy of the value
+column. Labels are only decoded when the layout or the set of readings
+changes.
+
+    header   <IIIqIIIIIII  signature ("HWiS", or "DEAD" once HWiNFO exits),
+                           version, revision, poll time, sensor section
+                           offset/element size/count, reading section
+                           offset/element size/count, polling period (ms)
+    sensor   id, instance, original name, user name[, UTF-8 user name]
+    reading  type, sensor index, reading id, original label, user label,
+             unit, value, min, max, avg[, UTF-8 user label, UTF-8 unit]
+
+On Windows the segment is HWiNFO's named file mapping; anywhere else a file
+with the same layout can be mapped instead (see hwinfo_emulator).
+"""
+
+import mmap
+import struct
+import sys
+from typing import List, Optional, Tuple
+
+from ..models.sensor import HardwareType, SensorCategory
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+SHARED_MEMORY_NAME = "Global\\HWiNFO_SENS_SM2"
+SIGNATURE_ACTIVE = 0x53695748  # "HWiS"
+SIGNATURE_DEAD = 0x44414544  # "DEAD"
+
+HEADER = struct.Struct("<IIIqIIIIIII")
+STRING_LEN = 128
+UNIT_LEN = 16
+
+# Element sizes without and with the UTF-8 fields added in later revisions
+SENSOR_ELEMENT_SIZE = 264
+SENSOR_ELEMENT_SIZE_UTF8 = 392
+READING_ELEMENT_SIZE = 316
+READING_ELEMENT_SIZE_UTF8 = 460
+
+# SENSOR_READING_TYPE
+READING_TYPE_CATEGORIES = {
+    1: SensorCategory.TEMPERATURE,
+    2: SensorCategory.VOLTAGE,
+    3: SensorCategory.FAN,
+    4: SensorCategory.CURRENT,
+    5: SensorCategory.POWER,
+    6: SensorCategory.CLOCK,
+    7: SensorCategory.USAGE,
+}
+
+# Substrings of sensor names that identify the hardware (checked in order)
+_HARDWARE_HINTS = (
+    ("gpu", HardwareType.GPU),
+    ("cpu", HardwareType.CPU),
+    ("s.m.a.r.t", HardwareType.STORAGE),
+    ("drive", HardwareType.STORAGE),
+    ("network", HardwareType.NETWORK),
+    ("memory", HardwareType.MEMORY),
+    ("dimm", HardwareType.MEMORY),
+    ("battery", HardwareType.BATTERY),
+    ("psu", HardwareType.PSU),
+    ("nuvoton", HardwareType.MOTHERBOARD),
+    ("ite ", HardwareType.MOTHERBOARD),
+    ("fintek", HardwareType.MOTHERBOARD),
+    ("motherboard", HardwareType.MOTHERBOARD),
+)
+
+
+def sensor_dtype(element_size: int):
+    names = ["sensor_id", "instance", "name_orig", "name_user"]
+    formats = ["<u4", "<u4", f"S{STRING_LEN}", f"S{STRING_LEN}"]
+    offsets = [0, 4, 8, 136]
+    if element_size >= SENSOR_ELEMENT_SIZE_UTF8:
+        names.append("name_utf8")
+        formats.append(f"S{STRING_LEN}")
+        offsets.append(264)
+    return np.dtype(
+        {"names": names, "formats": formats, "offsets": offsets, "itemsize": element_size}
+    )
+
+
+def reading_dtype(element_size: int):
+    names = [
+        "type",
+        "sensor_index",
+        "reading_id",
+        "label_orig",
+        "label_user",
+        "unit",
+        "value",
+        "value_min",
+        "value_max",
+        "value_avg",
+    ]
+    formats = [
+        "<u4",
+        "<u4",
+        "<u4",
+        f"S{STRING_LEN}",
+        f"S{STRING_LEN}",
+        f"S{UNIT_LEN}",
+        "<f8",
+        "<f8",
+        "<f8",
+        "<f8",
+    ]
+    offsets = [0, 4, 8, 12, 140, 268, 284, 292, 300, 308]
+    if element_size >= READING_ELEMENT_SIZE_UTF8:
+        names += ["label_utf8", "unit_utf8"]
+        formats += [f"S{STRING_LEN}", f"S{UNIT_LEN}"]
+        offsets += [316, 444]
+    return np.dtype(
+        {"names": names, "formats": formats, "offsets": offsets, "itemsize": element_size}
+    )
+
+
+def _text(utf8: bytes, ansi: bytes) -> str:
+    if utf8:
+        return utf8.decode("utf-8", errors="replace")
+    return ansi.decode("latin-1")  # HWiNFO's ANSI strings; maps "\xb0C" to "°C"
+
+
+def _category(reading_type: int, unit: str) -> SensorCategory:
+    category = READING_TYPE_CATEGORIES.get(reading_type)
+    if category is not None:
+        return category
+    unit_lower = unit.lower()
+    if unit_lower in ("mb", "gb", "kb"):
+        return SensorCategory.DATA_SIZE
+    if unit_lower.endswith("/s"):
+        return SensorCategory.THROUGHPUT
+    if unit_lower in ("mhz", "ghz"):
+        return SensorCategory.FREQUENCY
+    return SensorCategory.UNKNOWN
+
+
+def _hardware_type(sensor_name: str) -> HardwareType:
+    name = sensor_name.lower()
+    for hint, hardware_type in _HARDWARE_HINTS:
+        if hint in name:
+            return hardware_type
+    return HardwareType.UNKNOWN
+
+
+def _column(array, name: str) -> list:
+    """A string column as bytes, or empty strings for older layouts."""
+    if name in array.dtype.names:
+        return array[name].tolist()
+    return [b""] * len(array)
+
+
+class HWiNFOEntry:
+    """Static description of one reading, decoded when the layout changes."""
+
+    __slots__ = (
+        "sensor_id",
+        "label",
+        "unit",
+        "category",
+        "hardware_name",
+        "hardware_type",
+    )
+
+    def __init__(
+        self,
+        sensor_id: str,
+        label: str,
+        unit: str,
+        category: SensorCategory,
+        hardware_name: str,
+        hardware_type: HardwareType,
+    ):
+        self.sensor_id = sensor_id
+        self.label = label
+        self.unit = unit
+        self.category = category
+        self.hardware_name = hardware_name
+        self.hardware_type = hardware_type
+
+
+class HWiNFOFrame:
+    """One poll: value columns aligned with the reader's `entries`."""
+
+    __slots__ = ("poll_time", "layout_version", "values", "minimums", "maximums")
+
+    def __init__(self, poll_time: int, layout_version: int, values, minimums, maximums):
+        self.poll_time = poll_time
+        self.layout_version = layout_version
+        self.values = values
+        self.minimums = minimums
+        self.maximums = maximums
+
+
+class HWiNFOSharedMemory:
+    """Maps the HWiNFO segment (or a file with its layout) and reads it."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path  # None: HWiNFO's named mapping (Windows only)
+        self._mm: Optional[mmap.mmap] = None
+        self._file = None
+        self._layout: Optional[Tuple[int, ...]] = None
+        self._readings = None  # Structured view into the mapping
+        self._sensor_indices = None
+        self._reading_ids = None
+        self.entries: List[HWiNFOEntry] = []
+        self.layout_version = 0
+
+        # Statistics
+        self.polls = 0
+        self.layouts_decoded = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._mm is not None
+
+    def _map(self, length: int) -> mmap.mmap:
+        if self.path is not None:
+            if self._file is None:
+                self._file = open(self.path, "rb")
+            return mmap.mmap(self._file.fileno(), length, access=mmap.ACCESS_READ)
+        if sys.platform != "win32":
+            raise OSError("HWiNFO shared memory is only available on Windows")
+        return mmap.mmap(-1, length, tagname=SHARED_MEMORY_NAME, access=mmap.ACCESS_READ)
+
+    def open(self) -> bool:
+        """Map the segment; False when HWiNFO is not publishing sensors."""
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required to read HWiNFO shared memory")
+        self.close()
+        self._mm = self._map(HEADER.size)
+        return self._refresh_layout() is not None
+
+    def close(self) -> None:
+        # Views into the mapping must go before it can be closed
+        self._readings = None
+        self._layout = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _refresh_layout(self) -> Optional[Tuple[int, ...]]:
+        """Re-read the header; remap and re-decode labels if the layout moved."""
+        header = HEADER.unpack_from(self._mm, 0)
+        signature = header[0]
+        if signature != SIGNATURE_ACTIVE:
+            return None
+        layout = header[1:3] + header[4:10]
+        if layout == self._layout:
+            return layout
+
+        (
+            _version,
+            _revision,
+            sensor_offset,
+            sensor_size,
+            sensor_count,
+            reading_offset,
+            reading_size,
+            reading_count,
+        ) = layout
+        length = max(
+            HEADER.size,
+            sensor_offset + sensor_size * sensor_count,
+            reading_offset + reading_size * reading_count,
+        )
+        self._readings = None
+        if len(self._mm) < length:
+            self._mm.close()
+            self._mm = self._map(length)
+        sensors = np.ndarray(
+            (sensor_count,), dtype=sensor_dtype(sensor_size), buffer=self._mm, offset=sensor_offset
+        )
+        self._readings = np.ndarray(
+            (reading_count,),
+            dtype=reading_dtype(reading_size),
+            buffer=self._mm,
+            offset=reading_offset,
+        )
+        self._layout = layout
+        self._decode_entries(sensors)
+        return layout
+
+    def _decode_entries(self, sensors) -> None:
+        readings = self._readings
+        # Whole columns at once; only the strings are decoded per entry
+        sensor_names = [
+            _text(utf8, user) or _text(b"", orig)
+            for utf8, user, orig in zip(
+                _column(sensors, "name_utf8"),
+                sensors["name_user"].tolist(),
+                sensors["name_orig"].tolist(),
+            )
+        ]
+        sensor_keys = [
+            f"{sensor_id:08x}_{instance}"
+            for sensor_id, instance in zip(
+                sensors["sensor_id"].tolist(), sensors["instance"].tolist()
+            )
+        ]
+
+        entries = []
+        for reading_type, sensor_index, reading_id, utf8, user, orig, unit, unit_utf8 in zip(
+            readings["type"].tolist(),
+            readings["sensor_index"].tolist(),
+            readings["reading_id"].tolist(),
+            _column(readings, "label_utf8"),
+            readings["label_user"].tolist(),
+            readings["label_orig"].tolist(),
+            readings["unit"].tolist(),
+            _column(readings, "unit_utf8"),
+        ):
+            in_range = sensor_index < len(sensor_names)
+            hardware_name = sensor_names[sensor_index] if in_range else "HWiNFO"
+            sensor_key = sensor_keys[sensor_index] if in_range else "unknown"
+            unit = _text(unit_utf8, unit)
+            entries.append(
+                HWiNFOEntry(
+                    sensor_id=f"HWiNFO_{sensor_key}_{reading_id:08x}",
+                    label=_text(utf8, user) or _text(b"", orig),
+                    unit=unit,
+                    category=_category(reading_type, unit),
+                    hardware_name=hardware_name,
+                    hardware_type=_hardware_type(hardware_name),
+                )
+            )
+        self.entries = entries
+        self._sensor_indices = readings["sensor_index"].copy()
+        self._reading_ids = readings["reading_id"].copy()
+        self.layout_version += 1
+        self.layouts_decoded += 1
+
+    def _readings_moved(self) -> bool:
+        readings = self._readings
+        return not (
+            np.array_equal(readings["reading_id"], self._reading_ids)
+            and np.array_equal(readings["sensor_index"], self._sensor_indices)
+        )
+
+    def read(self) -> Optional[HWiNFOFrame]:
+        """Copy out the current values; None when HWiNFO is not running."""
+        if self._mm is None:
+            return None
+        if self._refresh_layout() is None:
+            return None
+        if self._readings_moved():
+            # Same sizes, but HWiNFO reordered or replaced readings
+            self._layout = None
+            self._refresh_layout()
+        readings = self._readings
+        self.polls += 1
+        return HWiNFOFrame(
+            poll_time=HEADER.unpack_from(self._mm, 0)[3],
+            layout_version=self.layout_version,
+            values=readings["value"].copy(),
+            minimums=readings["value_min"].copy(),
+            maximums=readings["value_max"].copy(),
+        )
+
+    def get_stats(self) -> dict:
+        return {
+            "path": self.path or SHARED_MEMORY_NAME,
+            "open": self.is_open,
+            "readings": len(self.entries),
+            "layout_version": self.layout_version,
+            "layouts_decoded": self.layouts_decoded,
+            "polls": self.polls,
+        }
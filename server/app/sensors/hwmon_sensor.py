@@ -0,0 +1,301 @@
+"""
+Linux hwmon/thermal sensor provider.
+Discovers the sensor attributes under <sysfs>/class/hwmon and
+<sysfs>/class/thermal once, keeps a file descriptor open per attribute and
+re-reads each one with a positioned read into a preallocated buffer every
+poll, so a poll costs one syscall per sensor and no open/close or path
+lookups. The sysfs root is configurable so a fake tree can stand in for it.
+"""
+
+import asyncio
+import os
+import re
+from datetime import datetime
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
+
+from ..core.config import AppSettings
+from ..core.logging import get_logger
+from ..models.reading import Reading
+from ..models.sensor import HardwareType, SensorCategory, SensorDefinition, SensorStatus
+from .base import BaseSensor
+
+# hwmon attribute prefix -> (category, unit, scale from the sysfs integer)
+_ATTRIBUTE_KINDS: Dict[str, Tuple[SensorCategory, str, float]] = {
+    "temp": (SensorCategory.TEMPERATURE, "°C", 1e-3),  # millidegrees
+    "in": (SensorCategory.VOLTAGE, "V", 1e-3),  # millivolts
+    "curr": (SensorCategory.CURRENT, "A", 1e-3),  # milliamps
+    "power": (SensorCategory.POWER, "W", 1e-6),  # microwatts
+    "energy": (SensorCategory.ENERGY, "J", 1e-6),  # microjoules
+    "fan": (SensorCategory.FAN, "RPM", 1.0),
+    "freq": (SensorCategory.CLOCK, "MHz", 1e-6),  # Hz
+    "humidity": (SensorCategory.LEVEL, "%", 1e-3),  # milli-percent
+    "pwm": (SensorCategory.CONTROL, "%", 100 / 255),  # 0-255 duty cycle
+}
+_ATTRIBUTE_PATTERN = re.compile(
+    r"^(temp|in|curr|power|energy|fan|freq|humidity)(\d+)_(input|average)$|^(pwm)(\d+)$"
+)
+_LABEL_PREFIXES = {
+    "temp": "Temp",
+    "in": "Voltage",
+    "curr": "Current",
+    "power": "Power",
+    "energy": "Energy",
+    "fan": "Fan",
+    "freq": "Frequency",
+    "humidity": "Humidity",
+    "pwm": "Fan Control",
+}
+
+# Substrings of hwmon chip names / thermal zone types (checked in order)
+_HARDWARE_HINTS = (
+    ("coretemp", HardwareType.CPU),
+    ("k10temp", HardwareType.CPU),
+    ("zenpower", HardwareType.CPU),
+    ("x86_pkg", HardwareType.CPU),
+    ("cpu", HardwareType.CPU),
+    ("amdgpu", HardwareType.GPU),
+    ("radeon", HardwareType.GPU),
+    ("nouveau", HardwareType.GPU),
+    ("i915", HardwareType.GPU),
+    ("gpu", HardwareType.GPU),
+    ("nvme", HardwareType.STORAGE),
+    ("drivetemp", HardwareType.STORAGE),
+    ("jc42", HardwareType.MEMORY),
+    ("spd", HardwareType.MEMORY),
+    ("iwlwifi", HardwareType.NETWORK),
+    ("r8169", HardwareType.NETWORK),
+    ("bat", HardwareType.BATTERY),
+    ("nct", HardwareType.MOTHERBOARD),
+    ("it87", HardwareType.MOTHERBOARD),
+    ("acpitz", HardwareType.MOTHERBOARD),
+    ("pch", HardwareType.MOTHERBOARD),
+)
+
+_SENSOR_ID_TRANSLATION = str.maketrans({" ": "_", "/": "_", "#": "", "-": "_"})
+_READ_SIZE = 32  # Longest integer attribute plus newline, with room to spare
+
+
+def _hardware_type(chip: str) -> HardwareType:
+    chip = chip.lower()
+    for hint, hardware_type in _HARDWARE_HINTS:
+        if hint in chip:
+            return hardware_type
+    return HardwareType.UNKNOWN
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class _Channel:
+    """One open sysfs attribute."""
+
+    __slots__ = ("definition", "path", "fd", "scale", "hardware_name")
+
+    def __init__(
+        self, definition: SensorDefinition, path: str, fd: int, scale: float, hardware_name: str
+    ):
+        self.definition = definition
+        self.path = path
+        self.fd = fd
+        self.scale = scale
+        self.hardware_name = hardware_name
+
+
+class HwmonSensor(BaseSensor):
+    """Sensor implementation for Linux hwmon and thermal zones in sysfs."""
+
+    source_id = "hwmon"
+    source_name = "Linux hwmon"
+
+    def __init__(self):
+        super().__init__(display_name=self.source_name)
+        self.logger = get_logger("hwmon_sensor")
+        self._channels: List[_Channel] = []
+        self._by_id: Dict[str, _Channel] = {}
+        self._reads = 0
+        self._read_errors = 0
+
+    async def initialize(self, app_settings: AppSettings) -> bool:
+        """Discover the sysfs attributes and open them."""
+        self.app_settings = app_settings
+        root = getattr(app_settings, "hwmon_sysfs_root", "/sys")
+        include_thermal = getattr(app_settings, "hwmon_include_thermal_zones", True)
+        try:
+            self._discover(root, include_thermal)
+        except OSError as e:
+            self.last_error = str(e)
+            self.logger.warning(f"Failed to scan sysfs at {root}: {e}")
+        self.is_active = bool(self._channels)
+        if self.is_active:
+            self.logger.info(f"Opened {len(self._channels)} hwmon/thermal sensors under {root}")
+        else:
+            self.logger.info(f"No hwmon or thermal sensors found under {root}")
+        return self.is_active
+
+    def _open(
+        self,
+        path: str,
+        sensor_id: str,
+        name: str,
+        kind: str,
+        hardware_name: str,
+        hardware_type: HardwareType,
+    ) -> None:
+        category, unit, scale = _ATTRIBUTE_KINDS[kind]
+        sensor_id = sensor_id.translate(_SENSOR_ID_TRANSLATION)
+        if sensor_id in self._by_id:
+            return
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError as e:
+            self.logger.debug(f"Skipping unreadable sensor {path}: {e}")
+            return
+        definition = SensorDefinition(
+            sensor_id=sensor_id,
+            name=name,
+            unit=unit,
+            category=category,
+            hardware_type=hardware_type,
+            source_id=self.source_id,
+            description=f"{hardware_name} - {name}",
+        )
+        channel = _Channel(definition, path, fd, scale, hardware_name)
+        self._channels.append(channel)
+        self._by_id[sensor_id] = channel
+
+    def _discover(self, root: str, include_thermal: bool) -> None:
+        hwmon_dir = os.path.join(root, "class", "hwmon")
+        chips: Dict[str, int] = {}
+        if os.path.isdir(hwmon_dir):
+            for entry in sorted(os.listdir(hwmon_dir), key=_natural_key):
+                device = os.path.join(hwmon_dir, entry)
+                chip = _read_text(os.path.join(device, "name")) or entry
+                # hwmonN numbering is not stable across boots; chip names are,
+                # with a suffix for repeats (e.g. one nvme chip per drive)
+                chips[chip] = chips.get(chip, 0) + 1
+                hardware_name = chip if chips[chip] == 1 else f"{chip} #{chips[chip]}"
+                hardware_type = _hardware_type(chip)
+
+                attributes = set(os.listdir(device))
+                for attribute in sorted(attributes, key=_natural_key):
+                    match = _ATTRIBUTE_PATTERN.match(attribute)
+                    if not match:
+                        continue
+                    kind = match.group(1) or match.group(4)
+                    index = match.group(2) or match.group(5)
+                    if match.group(3) == "average" and f"{kind}{index}_input" in attributes:
+                        continue  # Prefer the instantaneous reading
+                    label = _read_text(os.path.join(device, f"{kind}{index}_label"))
+                    name = label or f"{_LABEL_PREFIXES[kind]} {index}"
+                    self._open(
+                        os.path.join(device, attribute),
+                        f"{self.source_id}_{hardware_name}_{kind}{index}",
+                        name,
+                        kind,
+                        hardware_name,
+                        hardware_type,
+                    )
+
+        thermal_dir = os.path.join(root, "class", "thermal")
+        if include_thermal and os.path.isdir(thermal_dir):
+            for entry in sorted(os.listdir(thermal_dir), key=_natural_key):
+                if not entry.startswith("thermal_zone"):
+                    continue
+                zone = os.path.join(thermal_dir, entry)
+                if not os.path.exists(os.path.join(zone, "temp")):
+                    continue
+                zone_type = _read_text(os.path.join(zone, "type")) or entry
+                self._open(
+                    os.path.join(zone, "temp"),
+                    f"{self.source_id}_{entry}",
+                    zone_type,
+                    "temp",
+                    entry,
+                    _hardware_type(zone_type),
+                )
+
+    async def close(self) -> None:
+        for channel in self._channels:
+            try:
+                os.close(channel.fd)
+            except OSError:
+                pass
+        self._channels = []
+        self._by_id = {}
+        self.is_active = False
+
+    async def is_available(self) -> bool:
+        return self.is_active and bool(self._channels)
+
+    async def get_available_sensors(self) -> List[SensorDefinition]:
+        return [channel.definition for channel in self._channels]
+
+    def _read_values(self, channels: List[_Channel]) -> List[Optional[float]]:
+        """Re-read each channel from offset 0 of its open descriptor."""
+        buffer = bytearray(_READ_SIZE)
+        buffers = [buffer]
+        values: List[Optional[float]] = []
+        for channel in channels:
+            try:
+                length = os.preadv(channel.fd, buffers, 0)
+                values.append(int(buffer[:length]) * channel.scale)
+            except (OSError, ValueError):
+                # e.g. ENODATA from a powered-down sensor, or EIO from the chip
+                self._read_errors += 1
+                values.append(None)
+        self._reads += len(channels)
+        return values
+
+    async def get_current_data(self) -> List[Reading]:
+        return await self.get_current_data_for(None)
+
+    async def get_current_data_for(
+        self, sensor_ids: Optional[AbstractSet[str]] = None
+    ) -> List[Reading]:
+        """Get current readings for the given sensors (all when None)."""
+        if not await self.is_available():
+            return []
+        if sensor_ids is None:
+            channels = self._channels
+        else:
+            channels = [self._by_id[s] for s in sensor_ids if s in self._by_id]
+        # Some drivers (e.g. drivetemp) query the device on read; keep that
+        # off the event loop
+        loop = asyncio.get_running_loop()
+        values = await loop.run_in_executor(None, self._read_values, channels)
+
+        timestamp = datetime.now()
+        readings = []
+        for channel, value in zip(channels, values):
+            if value is None:
+                continue
+            readings.append(
+                Reading(
+                    channel.definition,
+                    round(value, 3),
+                    timestamp,
+                    SensorStatus.ACTIVE,
+                    parent_hardware=channel.hardware_name,
+                )
+            )
+        return readings
+
+    def get_source_info(self) -> Dict[str, Any]:
+        info = super().get_source_info()
+        info["sysfs"] = {
+            "root": getattr(self.app_settings, "hwmon_sysfs_root", "/sys"),
+            "open_files": len(self._channels),
+            "reads": self._reads,
+            "read_errors": self._read_errors,
+        }
+        return info
+
+
+def _natural_key(name: str) -> List[Any]:
+    """Sort hwmon2 before hwmon10 and temp2_input before temp10_input."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
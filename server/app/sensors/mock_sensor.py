@@ -1,18 +1,29 @@
 """
 Mock sensor implementation for development and testing.
-Generates realistic-looking hardware monitoring data.
+Generates realistic-looking hardware monitoring data, either for a handful of
+fixed sensors or, with mock_sensor_count set, for any number of synthetic
+sensors as a load source for capacity testing.
 """
 
 import random
 import math
 import time
 import asyncio
-from typing import List, Optional, Dict, Any
+from array import array
+from typing import AbstractSet, List, Optional, Dict, Any
 from datetime import datetime, timezone
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 from .base import BaseSensor
+from ..models.reading import Reading
 from ..models.sensor import (
-    SensorReading,
     SensorDefinition,
     SensorCategory,
     HardwareType,
@@ -21,6 +32,50 @@ from ..models.sensor import (
 from ..core.config import AppSettings
 from ..core.logging import get_logger
 
+# Synthetic mode cycles through the fixed sensors plus these, so every
+# category the frontend renders shows up under load
+_SYNTHETIC_EXTRA_TEMPLATES = [
+    {
+        "id": "board_voltage",
+        "name": "Vcore",
+        "hardware_name": "Motherboard",
+        "unit": "V",
+        "category_str": "voltage",
+        "hardware_type_str": "motherboard",
+        "value_type": SensorValueType.FLOAT,
+        "min_value": 0.8,
+        "max_value": 1.5,
+        "base_value": 1.2,
+        "variation": 0.1,
+    },
+    {
+        "id": "cpu_clock",
+        "name": "Core Clock",
+        "hardware_name": "CPU Package",
+        "unit": "MHz",
+        "category_str": "clock",
+        "hardware_type_str": "cpu",
+        "value_type": SensorValueType.INTEGER,
+        "min_value": 800.0,
+        "max_value": 5200.0,
+        "base_value": 3600.0,
+        "variation": 1500.0,
+    },
+    {
+        "id": "net_throughput",
+        "name": "Download Speed",
+        "hardware_name": "Ethernet",
+        "unit": "B/s",
+        "category_str": "throughput",
+        "hardware_type_str": "network",
+        "value_type": SensorValueType.INTEGER,
+        "min_value": 0.0,
+        "max_value": 125000000.0,
+        "base_value": 2000000.0,
+        "variation": 5000000.0,
+    },
+]
+
 
 class MockSensor(BaseSensor):
     """Mock sensor data generator for development and testing."""
@@ -34,11 +89,14 @@ class MockSensor(BaseSensor):
         self.app_settings: Optional[AppSettings] = None
         self.start_time = time.monotonic()
         self._pydantic_sensor_definitions: List[SensorDefinition] = []
+        self._positions: Dict[str, int] = {}
+        self._is_integer: List[bool] = []
+        self._rng = np.random.default_rng() if NUMPY_AVAILABLE else None
 
         # Raw definitions, to be converted to Pydantic models in initialize()
         # Added 'hardware_name' for more descriptive SensorDefinition
         # Added 'value_type' to guide data generation/interpretation
-        self._raw_sensor_definitions = [
+        self._fixed_sensor_definitions = [
             {
                 "id": "cpu_temp",
                 "name": "CPU Core #1 Temp",
@@ -144,11 +202,32 @@ class MockSensor(BaseSensor):
                 "variation": 10.0,
             },
         ]
+        self._raw_sensor_definitions = self._fixed_sensor_definitions
+
+    def _synthetic_definitions(self, count: int) -> List[Dict[str, Any]]:
+        """`count` raw definitions cycling through the sensor templates."""
+        templates = self._fixed_sensor_definitions + _SYNTHETIC_EXTRA_TEMPLATES
+        raw_defs = []
+        for i in range(count):
+            template = templates[i % len(templates)]
+            copy = i // len(templates)
+            raw_def = dict(template)
+            raw_def["id"] = f"{template['id']}_{copy}"
+            raw_def["name"] = f"{template['name']} #{copy}"
+            raw_def["hardware_name"] = f"{template['hardware_name']} #{copy}"
+            raw_defs.append(raw_def)
+        return raw_defs
 
     async def initialize(self, app_settings: AppSettings) -> bool:
         await super().initialize(app_settings)
         self.app_settings = app_settings
         self._pydantic_sensor_definitions = []
+        synthetic_count = getattr(app_settings, "mock_sensor_count", 0)
+        if synthetic_count > 0:
+            self._raw_sensor_definitions = self._synthetic_definitions(synthetic_count)
+        else:
+            self._raw_sensor_definitions = self._fixed_sensor_definitions
+        loaded_raw_defs = []
 
         for raw_def in self._raw_sensor_definitions:
             try:
@@ -171,6 +250,7 @@ class MockSensor(BaseSensor):
                     },
                 )
                 self._pydantic_sensor_definitions.append(sensor_def)
+                loaded_raw_defs.append(raw_def)
             except ValueError as e:
                 self.logger.error(f"Invalid enum value for sensor {raw_def['id']}: {e}")
             except Exception as e:
@@ -179,6 +259,8 @@ class MockSensor(BaseSensor):
                     exc_info=True,
                 )
 
+        self._build_generation_parameters(loaded_raw_defs)
+
         if not self._pydantic_sensor_definitions:
             self.logger.warning(
                 "MockSensor: No sensor definitions were successfully loaded."
@@ -191,6 +273,66 @@ class MockSensor(BaseSensor):
             )
         return self.is_active
 
+    def _build_generation_parameters(self, raw_defs: List[Dict[str, Any]]) -> None:
+        """Per-sensor generation parameters, aligned with the definitions."""
+        self._positions = {
+            sensor_def.sensor_id: i
+            for i, sensor_def in enumerate(self._pydantic_sensor_definitions)
+        }
+        self._is_integer = [
+            raw_def["value_type"] == SensorValueType.INTEGER for raw_def in raw_defs
+        ]
+        columns = {
+            name: array("d", (raw_def[key] for raw_def in raw_defs))
+            for name, key in (
+                ("base", "base_value"),
+                ("variation", "variation"),
+                ("low", "min_value"),
+                ("high", "max_value"),
+            )
+        }
+        if NUMPY_AVAILABLE:
+            columns = {name: np.asarray(column) for name, column in columns.items()}
+            self._integer_mask = np.asarray(self._is_integer, dtype=bool)
+        self._base = columns["base"]
+        self._variation = columns["variation"]
+        self._low = columns["low"]
+        self._high = columns["high"]
+
+    def _generate_values(self, positions: List[int], elapsed: float) -> List[float]:
+        """
+        Slow and fast sine waves plus noise around each sensor's base value,
+        clamped to its range; the period and speed vary per sensor.
+        """
+        if NUMPY_AVAILABLE:
+            index = np.asarray(positions, dtype=np.int64)
+            time_factor = elapsed / (60.0 + index * 5)
+            speed = 1 + index * 0.05
+            variation_factor = (
+                np.sin(time_factor * 0.1 * speed) * 0.3
+                + np.sin(time_factor * 2.0 * speed) * 0.1
+                + (self._rng.random(len(index)) - 0.5) * 0.2
+            )
+            values = np.clip(
+                self._base[index] + variation_factor * self._variation[index],
+                self._low[index],
+                self._high[index],
+            )
+            # Whole numbers for integer sensors, 2 decimal places otherwise
+            integer = self._integer_mask[index]
+            return np.where(integer, np.round(values), np.round(values, 2)).tolist()
+
+        values = []
+        for i in positions:
+            time_factor = elapsed / (60.0 + i * 5)
+            sine_variation = math.sin(time_factor * 0.1 * (1 + i * 0.05)) * 0.3
+            fast_variation = math.sin(time_factor * 2.0 * (1 + i * 0.05)) * 0.1
+            noise = (random.random() - 0.5) * 0.2
+            value = self._base[i] + (sine_variation + fast_variation + noise) * self._variation[i]
+            value = max(self._low[i], min(self._high[i], value))
+            values.append(round(value) if self._is_integer[i] else round(value, 2))
+        return values
+
     async def close(self) -> None:
         await super().close()
         self.logger.info("MockSensor closed.")
@@ -205,72 +347,30 @@ class MockSensor(BaseSensor):
             return []
         return self._pydantic_sensor_definitions
 
-    async def get_current_data(self) -> List[SensorReading]:
+    async def get_current_data(self) -> List[Reading]:
+        return await self.get_current_data_for(None)
+
+    async def get_current_data_for(
+        self, sensor_ids: Optional[AbstractSet[str]] = None
+    ) -> List[Reading]:
         await asyncio.sleep(0)
         if not self.is_active:
             return []
 
-        readings: List[SensorReading] = []
-        current_monotonic_time = time.monotonic()
-        elapsed = current_monotonic_time - self.start_time
-
-        for i, sensor_def in enumerate(self._pydantic_sensor_definitions):
-            # Find corresponding raw definition for generation parameters
-            # This assumes IDs in _raw_sensor_definitions match SensorDefinition IDs
-            raw_def = next(
-                (
-                    rd
-                    for rd in self._raw_sensor_definitions
-                    if rd["id"] == sensor_def.sensor_id
-                ),
-                None,
-            )
-            if not raw_def:
-                self.logger.warning(
-                    f"Could not find raw definition for sensor ID {sensor_def.sensor_id}. Skipping."
-                )
-                continue
-
-            base_value = raw_def["base_value"]
-            variation = raw_def["variation"]
-            min_val = raw_def["min_value"]
-            max_val = raw_def["max_value"]
-
-            # Create realistic variations using sine waves and random noise
-            # Different time factors for variety across sensors
-            time_factor = elapsed / (60.0 + i * 5)  # Convert to minutes, vary period
-
-            sine_variation = math.sin(time_factor * 0.1 * (1 + i * 0.05)) * 0.3
-            fast_variation = math.sin(time_factor * 2.0 * (1 + i * 0.05)) * 0.1
-            noise = (random.random() - 0.5) * 0.2
-
-            variation_factor = sine_variation + fast_variation + noise
-            current_value_unclamped = base_value + (variation_factor * variation)
-            current_value = max(min_val, min(max_val, current_value_unclamped))
-
-            # Get value type from metadata
-            value_type = raw_def["value_type"]
-            if value_type == SensorValueType.INTEGER:
-                current_value = round(current_value)
-            elif value_type == SensorValueType.FLOAT:
-                current_value = round(
-                    current_value, 2
-                )  # Default to 2 decimal places for floats
-            # else string, boolean - not handled by this mock's generation logic for now
+        if sensor_ids is None:
+            positions = list(range(len(self._pydantic_sensor_definitions)))
+        else:
+            lookup = self._positions
+            positions = sorted(lookup[s] for s in sensor_ids if s in lookup)
+        values = self._generate_values(positions, time.monotonic() - self.start_time)
 
-            reading = SensorReading(
-                sensor_id=sensor_def.sensor_id,
-                name=sensor_def.name,
-                value=current_value,
-                unit=sensor_def.unit,
-                category=sensor_def.category,
-                hardware_type=sensor_def.hardware_type,
-                source=self.source_id,
-                min_value=sensor_def.min_value,
-                max_value=sensor_def.max_value,
-                timestamp=datetime.now(timezone.utc),
-                metadata=sensor_def.metadata.copy() if sensor_def.metadata else {},
-            )
-            readings.append(reading)
+        readings: List[Reading] = []
+        timestamp = datetime.now(timezone.utc)
+        definitions = self._pydantic_sensor_definitions
+        is_integer = self._is_integer
+        for position, current_value in zip(positions, values):
+            if is_integer[position]:
+                current_value = int(current_value)
+            readings.append(Reading(definitions[position], current_value, timestamp))
 
         return readings
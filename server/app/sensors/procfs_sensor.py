@@ -0,0 +1,370 @@
+"""
+Linux procfs system-load provider.
+Reads <procfs>/stat, meminfo, diskstats and net/dev once per poll, parses
+each into a counter matrix, and turns the cumulative counters into per-core
+CPU load and per-device disk/network rates with array arithmetic against
+the previous poll. The procfs root is configurable so fixture files can
+stand in for it, and so is the sysfs root used to tell partitions apart.
+"""
+
+import os
+import re
+import time
+from datetime import datetime
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
+
+from ..core.config import AppSettings
+from ..core.logging import get_logger
+from ..models.reading import Reading
+from ..models.sensor import HardwareType, SensorCategory, SensorDefinition, SensorStatus
+from .base import BaseSensor
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+SECTOR_BYTES = 512  # diskstats always counts 512-byte sectors
+_IDLE_COLUMNS = (3, 4)  # idle, iowait among user nice system idle iowait irq softirq steal
+_SKIPPED_DISKS = ("loop", "ram", "fd", "sr")
+_MEMINFO_KEYS = ("MemTotal", "MemAvailable", "SwapTotal", "SwapFree")
+# Shortest window rates are computed over; jiffies tick at 100 Hz, so much
+# shorter windows read as 0% or 100% load
+MIN_SAMPLE_SECONDS = 0.5
+_SENSOR_ID_TRANSLATION = str.maketrans({" ": "_", "/": "_", "-": "_", ".": "_"})
+
+
+def _sensor_id(*parts: str) -> str:
+    return "_".join(("procfs",) + parts).translate(_SENSOR_ID_TRANSLATION)
+
+
+class _Counters:
+    """One poll's parsed procfs counters."""
+
+    __slots__ = ("time", "cpu_names", "cpu", "memory", "disk_names", "disk", "net_names", "net")
+
+    def __init__(self, time_: float):
+        self.time = time_
+        self.cpu_names: Tuple[str, ...] = ()
+        self.cpu = None  # (cpus, 8) jiffies; row 0 is the aggregate "cpu" line
+        self.memory: Dict[str, float] = {}  # kB
+        self.disk_names: Tuple[str, ...] = ()
+        self.disk = None  # (disks, 2) sectors read, written
+        self.net_names: Tuple[str, ...] = ()
+        self.net = None  # (interfaces, 2) bytes received, sent
+
+    @property
+    def layout(self) -> Tuple[Tuple[str, ...], ...]:
+        return (self.cpu_names, self.disk_names, self.net_names)
+
+
+class ProcfsSensor(BaseSensor):
+    """CPU, memory, disk and network load from Linux procfs."""
+
+    source_id = "procfs"
+    source_name = "Linux procfs"
+
+    def __init__(self):
+        super().__init__(display_name=self.source_name)
+        self.logger = get_logger("procfs_sensor")
+        self.root = "/proc"
+        self.sysfs_root = "/sys"
+        self._clock = time.monotonic
+        self._partitions: Dict[str, bool] = {}  # Block device name -> is a partition
+        self._previous: Optional[_Counters] = None  # Baseline of the next rates
+        self._last_values: Optional[List[float]] = None
+        self._layout: Optional[Tuple[Tuple[str, ...], ...]] = None
+        self._definitions: List[SensorDefinition] = []
+        self._positions: Dict[str, int] = {}
+        self._swap = False
+
+    async def initialize(self, app_settings: AppSettings) -> bool:
+        """Take the baseline sample the first rates are computed against."""
+        self.app_settings = app_settings
+        self.root = getattr(app_settings, "procfs_root", "/proc")
+        self.sysfs_root = getattr(app_settings, "procfs_sysfs_root", "/sys")
+        if not NUMPY_AVAILABLE:
+            self.last_error = "numpy is not installed"
+            self.logger.warning("procfs provider disabled: numpy is not installed")
+            return False
+        try:
+            self._previous = self._sample()
+        except (OSError, ValueError) as e:
+            self.last_error = str(e)
+            self.logger.info(f"procfs not readable at {self.root}: {e}")
+            self.is_active = False
+            return False
+        self._build_definitions(self._previous)
+        self.is_active = True
+        self.logger.info(
+            f"Reading {len(self._definitions)} load sensors from {self.root} "
+            f"({len(self._previous.cpu_names) - 1} cores, "
+            f"{len(self._previous.disk_names)} disks, {len(self._previous.net_names)} interfaces)"
+        )
+        return True
+
+    async def close(self) -> None:
+        self._previous = None
+        self.is_active = False
+
+    async def is_available(self) -> bool:
+        return self.is_active
+
+    async def get_available_sensors(self) -> List[SensorDefinition]:
+        return list(self._definitions)
+
+    # -------------------------------------------------------------
+    # Parsing
+    # -------------------------------------------------------------
+
+    def _read(self, name: str) -> str:
+        with open(os.path.join(self.root, name), "r") as f:
+            return f.read()
+
+    def _sample(self) -> _Counters:
+        counters = _Counters(self._clock())
+
+        rows = [line.split() for line in self._read("stat").splitlines() if line.startswith("cpu")]
+        counters.cpu_names = tuple(row[0] for row in rows)
+        counters.cpu = np.array([row[1:9] for row in rows], dtype=np.float64)
+
+        for line in self._read("meminfo").splitlines():
+            key, _, rest = line.partition(":")
+            if key in _MEMINFO_KEYS:
+                counters.memory[key] = float(rest.split()[0])
+
+        disk_names: List[str] = []
+        disk_rows = []
+        for line in self._read("diskstats").splitlines():
+            fields = line.split()
+            if len(fields) < 10:
+                continue
+            name = fields[2]
+            if name.startswith(_SKIPPED_DISKS) or self._is_partition(name, disk_names):
+                continue
+            disk_names.append(name)
+            disk_rows.append((fields[5], fields[9]))
+        counters.disk_names = tuple(disk_names)
+        counters.disk = np.array(disk_rows, dtype=np.float64).reshape(-1, 2) * SECTOR_BYTES
+
+        net_names: List[str] = []
+        net_rows = []
+        for line in self._read("net/dev").splitlines()[2:]:
+            name, _, rest = line.partition(":")
+            name = name.strip()
+            fields = rest.split()
+            if name == "lo" or len(fields) < 9:
+                continue
+            net_names.append(name)
+            net_rows.append((fields[0], fields[8]))
+        counters.net_names = tuple(net_names)
+        counters.net = np.array(net_rows, dtype=np.float64).reshape(-1, 2)
+        return counters
+
+    def _is_partition(self, name: str, disks: List[str]) -> bool:
+        partition = self._partitions.get(name)
+        if partition is None:
+            block = os.path.join(self.sysfs_root, "class", "block", name)
+            if os.path.isdir(block):
+                partition = os.path.exists(os.path.join(block, "partition"))
+            else:
+                partition = _is_partition_name(name, disks)
+            self._partitions[name] = partition
+        return partition
+
+    # -------------------------------------------------------------
+    # Definitions and values, in the same fixed order
+    # -------------------------------------------------------------
+
+    def _build_definitions(self, counters: _Counters) -> None:
+        def definition(sensor_id, name, unit, category, hardware_type, description):
+            return SensorDefinition(
+                sensor_id=sensor_id,
+                name=name,
+                unit=unit,
+                category=category,
+                hardware_type=hardware_type,
+                source_id=self.source_id,
+                description=description,
+            )
+
+        definitions = [
+            definition(
+                _sensor_id("cpu_total_usage"),
+                "CPU Total Usage",
+                "%",
+                SensorCategory.USAGE,
+                HardwareType.CPU,
+                "Share of non-idle CPU time across all cores",
+            )
+        ]
+        for name in counters.cpu_names[1:]:
+            core = name[3:]
+            definitions.append(
+                definition(
+                    _sensor_id(name, "usage"),
+                    f"CPU Core #{core} Usage",
+                    "%",
+                    SensorCategory.USAGE,
+                    HardwareType.CPU,
+                    f"Share of non-idle time on CPU {core}",
+                )
+            )
+
+        self._swap = counters.memory.get("SwapTotal", 0.0) > 0
+        memory = [
+            ("memory_usage", "Memory Usage", "%", SensorCategory.USAGE),
+            ("memory_used", "Memory Used", "GB", SensorCategory.DATA_SIZE),
+            ("memory_available", "Memory Available", "GB", SensorCategory.DATA_SIZE),
+        ]
+        if self._swap:
+            memory.append(("swap_usage", "Swap Usage", "%", SensorCategory.USAGE))
+        for key, name, unit, category in memory:
+            definitions.append(
+                definition(_sensor_id(key), name, unit, category, HardwareType.MEMORY, name)
+            )
+
+        for name in counters.disk_names:
+            for direction in ("read", "write"):
+                definitions.append(
+                    definition(
+                        _sensor_id("disk", name, direction),
+                        f"{name} {direction.capitalize()} Rate",
+                        "B/s",
+                        SensorCategory.THROUGHPUT,
+                        HardwareType.STORAGE,
+                        f"Bytes per second {'read from' if direction == 'read' else 'written to'} {name}",
+                    )
+                )
+        for name in counters.net_names:
+            for direction, label in (("rx", "Download"), ("tx", "Upload")):
+                definitions.append(
+                    definition(
+                        _sensor_id("net", name, direction),
+                        f"{name} {label} Rate",
+                        "B/s",
+                        SensorCategory.THROUGHPUT,
+                        HardwareType.NETWORK,
+                        f"Bytes per second {'received on' if direction == 'rx' else 'sent from'} {name}",
+                    )
+                )
+
+        self._definitions = definitions
+        self._positions = {d.sensor_id: i for i, d in enumerate(definitions)}
+        self._layout = counters.layout
+        self.definitions_version += 1
+
+    def _values(self, current: _Counters, previous: Optional[_Counters]):
+        """All sensor values in definition order; NaN where no rate exists yet."""
+        if previous is None:
+            cpu_usage = np.full(len(current.cpu), np.nan)
+        else:
+            cpu_delta = current.cpu - previous.cpu
+            total = cpu_delta.sum(axis=1)
+            idle = cpu_delta[:, _IDLE_COLUMNS].sum(axis=1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                cpu_usage = np.where(total > 0, 100.0 * (1.0 - idle / total), 0.0)
+
+        memory = current.memory
+        total_kb = memory.get("MemTotal", 0.0)
+        available_kb = memory.get("MemAvailable", 0.0)
+        memory_values = [
+            100.0 * (total_kb - available_kb) / total_kb if total_kb else 0.0,
+            (total_kb - available_kb) / 1024**2,
+            available_kb / 1024**2,
+        ]
+        if self._swap:
+            swap_total = memory.get("SwapTotal", 0.0)
+            swap_used = swap_total - memory.get("SwapFree", 0.0)
+            memory_values.append(100.0 * swap_used / swap_total if swap_total else 0.0)
+
+        elapsed = current.time - previous.time if previous is not None else 0.0
+        if elapsed > 0:
+            # Counters only go backwards on a reset or wrap; report 0 then
+            disk_rates = np.maximum(current.disk - previous.disk, 0.0) / elapsed
+            net_rates = np.maximum(current.net - previous.net, 0.0) / elapsed
+        else:
+            disk_rates = np.full(current.disk.shape, np.nan)
+            net_rates = np.full(current.net.shape, np.nan)
+
+        return np.concatenate(
+            (
+                np.clip(cpu_usage, 0.0, 100.0),
+                memory_values,
+                disk_rates.ravel(),  # read, write per disk
+                net_rates.ravel(),  # rx, tx per interface
+            )
+        )
+
+    async def get_current_data(self) -> List[Reading]:
+        return await self.get_current_data_for(None)
+
+    async def get_current_data_for(
+        self, sensor_ids: Optional[AbstractSet[str]] = None
+    ) -> List[Reading]:
+        """Get current readings for the given sensors (all when None)."""
+        if not await self.is_available():
+            return []
+        current = self._sample()
+        if current.layout != self._layout:
+            # A core went offline or a disk/interface appeared: start over
+            self.logger.info("procfs device set changed, rebuilding sensor definitions")
+            self._build_definitions(current)
+            self._previous = current
+            self._last_values = None
+            return []
+
+        if current.time - self._previous.time >= MIN_SAMPLE_SECONDS:
+            values = self._last_values = self._values(current, self._previous).tolist()
+            self._previous = current
+        elif self._last_values is not None:
+            # Too soon after the last rates (warm-ups, on-demand reads,
+            # overlapping rounds): serve them again, keeping their baseline
+            values = self._last_values
+        else:
+            # No rates yet: only the instantaneous memory figures
+            values = self._values(current, None).tolist()
+        if sensor_ids is None:
+            positions = range(len(self._definitions))
+        else:
+            lookup = self._positions
+            positions = sorted(lookup[s] for s in sensor_ids if s in lookup)
+
+        timestamp = datetime.now()
+        readings = []
+        for position in positions:
+            value = values[position]
+            if value != value:  # NaN
+                continue
+            readings.append(
+                Reading(self._definitions[position], round(value, 2), timestamp, SensorStatus.ACTIVE)
+            )
+        return readings
+
+    def get_source_info(self) -> Dict[str, Any]:
+        info = super().get_source_info()
+        info["procfs"] = {"root": self.root, "sensors": len(self._definitions)}
+        return info
+
+
+_PARTITION_NUMBER = re.compile(r"\d+")
+_P_PARTITION_NUMBER = re.compile(r"p\d+")
+
+
+def _is_partition_name(name: str, disks: List[str]) -> bool:
+    """
+    Without sysfs: sda1 after sda, but nvme0n1p2 after nvme0n1 and mmcblk0p1
+    after mmcblk0. Disks whose names end in a digit number their partitions
+    with a "p", so dm-10 and nvme0n10 are disks of their own (diskstats lists
+    disks before their partitions).
+    """
+    for disk in disks:
+        if name.startswith(disk):
+            suffix = name[len(disk):]
+            pattern = _P_PARTITION_NUMBER if disk[-1].isdigit() else _PARTITION_NUMBER
+            if pattern.fullmatch(suffix):
+                return True
+    return False
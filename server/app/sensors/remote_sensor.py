@@ -0,0 +1,66 @@
+"""
+Proxy for a sensor source collected in the collector process.
+One RemoteSensor stands in for each provider the collector process runs, so
+the web process keeps per-source snapshots, statistics and staleness.
+"""
+
+from typing import Any, Dict, List
+
+from ..core.config import AppSettings
+from ..models.reading import Reading
+from ..models.sensor import SensorDefinition
+from .base import BaseSensor
+
+
+class RemoteSensor(BaseSensor):
+    """Reads one source's readings from the collector process's shared buffer."""
+
+    def __init__(self, client, source_id: str, display_name: str):
+        super().__init__(display_name=display_name)
+        self.client = client  # CollectorProcessClient, shared by all proxies
+        self.source_id = source_id
+        self._generation = client.generation
+
+    async def initialize(self, app_settings: AppSettings) -> bool:
+        self.app_settings = app_settings
+        self.is_active = True
+        return True
+
+    async def close(self) -> None:
+        # The collector process is stopped by its owner, not per source
+        self.is_active = False
+
+    async def restart(self, app_settings: AppSettings) -> bool:
+        """Restart the collector process this source runs in."""
+        restarted = await self.client.restart(self._generation)
+        self._generation = self.client.generation
+        return restarted and await self.is_available()
+
+    async def is_available(self) -> bool:
+        return self.is_active and self.client.is_alive
+
+    async def get_available_sensors(self) -> List[SensorDefinition]:
+        return self.client.definitions_for(self.source_id)
+
+    async def get_current_data(self) -> List[Reading]:
+        readings, stale_sources = self.client.read()
+        # Follows the collector process's definitions as they are extended
+        self.definitions_version = self.client.definitions_version
+        if self.client.is_overdue:
+            # Alive but not publishing: stale here, and hung to the watchdog
+            raise RuntimeError(
+                f"Collector process published nothing for {self.client.publish_age:.1f}s"
+            )
+        # The child serves its last good readings for a stale source; flag
+        # them as such rather than failing the read
+        self.stale_reason = (
+            f"Collector process reports {self.source_id} as stale"
+            if self.source_id in stale_sources
+            else None
+        )
+        return readings.get(self.source_id, [])
+
+    def get_source_info(self) -> Dict[str, Any]:
+        info = super().get_source_info()
+        info["collector_process"] = self.client.get_stats()
+        return info
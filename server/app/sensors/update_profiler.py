@@ -0,0 +1,143 @@
+"""
+Per-hardware update profiling for the LibreHardwareMonitor provider.
+Every IHardware.Update() call is timed separately, giving rolling latency
+percentiles per hardware node. A node whose smoothed update cost exceeds the
+budget is backed off: it is then only updated every 2nd, 4th, ... poll (up
+to `max_backoff`), and returns to every poll once it is cheap again.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, List
+
+# Smoothing of the update cost that drives backoff decisions
+_COST_ALPHA = 0.2
+# Samples needed before a node can be backed off
+_MIN_SAMPLES = 3
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class _NodeProfile:
+    __slots__ = (
+        "label",
+        "hardware_type",
+        "samples",
+        "updates",
+        "skipped",
+        "last_ms",
+        "average_ms",
+        "backoff",
+        "_countdown",
+    )
+
+    def __init__(self, label: str, hardware_type: str, window: int):
+        self.label = label
+        self.hardware_type = hardware_type
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.updates = 0
+        self.skipped = 0
+        self.last_ms = 0.0
+        self.average_ms = 0.0
+        self.backoff = 1  # Updated on every backoff-th poll
+        self._countdown = 0
+
+
+class HardwareUpdateProfiler:
+    """
+    Times hardware updates and decides which nodes to update on a poll.
+    Called from the collector thread; `get_stats` may be called from any
+    thread and only reads copies.
+    """
+
+    def __init__(self, budget_ms: float = 50.0, max_backoff: int = 8, window: int = 120):
+        self.budget_ms = budget_ms  # 0 or less disables backoff
+        self.max_backoff = max(1, max_backoff)
+        self.window = window
+        self._nodes: Dict[Hashable, _NodeProfile] = {}
+
+    def register(self, key: Hashable, label: str, hardware_type: str) -> None:
+        """Add a node; labels are made unique (identical GPUs, disks, ...)."""
+        if key in self._nodes:
+            return
+        labels = {node.label for node in self._nodes.values()}
+        unique, suffix = label, 2
+        while unique in labels:
+            unique, suffix = f"{label} #{suffix}", suffix + 1
+        self._nodes[key] = _NodeProfile(unique, hardware_type, self.window)
+
+    def clear(self) -> None:
+        self._nodes.clear()
+
+    def should_update(self, key: Hashable) -> bool:
+        """Whether a backed-off node takes part in this poll."""
+        node = self._nodes.get(key)
+        if node is None or node.backoff == 1:
+            return True
+        if node._countdown > 0:
+            node._countdown -= 1
+            node.skipped += 1
+            return False
+        node._countdown = node.backoff - 1
+        return True
+
+    def record(self, key: Hashable, elapsed_ms: float) -> None:
+        """Record one Update() duration and adjust the node's backoff."""
+        node = self._nodes.get(key)
+        if node is None:
+            return
+        node.samples.append(elapsed_ms)
+        node.last_ms = elapsed_ms
+        node.updates += 1
+        if node.updates == 1:
+            node.average_ms = elapsed_ms
+        else:
+            node.average_ms += _COST_ALPHA * (elapsed_ms - node.average_ms)
+
+        if self.budget_ms <= 0 or node.updates < _MIN_SAMPLES:
+            return
+        if node.average_ms > self.budget_ms and node.backoff < self.max_backoff:
+            node.backoff = min(self.max_backoff, node.backoff * 2)
+            node._countdown = node.backoff - 1
+        elif node.average_ms < self.budget_ms / 2 and node.backoff > 1:
+            node.backoff //= 2
+            node._countdown = min(node._countdown, node.backoff - 1)
+
+    def average_update_times(self) -> Dict[str, float]:
+        """Smoothed Update() cost per node label (milliseconds)."""
+        return {
+            node.label: round(node.average_ms, 3)
+            for node in list(self._nodes.values())
+            if node.updates
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        nodes = {}
+        for node in list(self._nodes.values()):
+            ordered = sorted(node.samples)
+            nodes[node.label] = {
+                "hardware_type": node.hardware_type,
+                "updates": node.updates,
+                "skipped": node.skipped,
+                "backoff": node.backoff,
+                "last_ms": round(node.last_ms, 3),
+                "average_ms": round(node.average_ms, 3),
+                "p50_ms": round(_percentile(ordered, 0.50), 3),
+                "p95_ms": round(_percentile(ordered, 0.95), 3),
+                "p99_ms": round(_percentile(ordered, 0.99), 3),
+                "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+                "samples": len(ordered),
+            }
+        return {
+            "budget_ms": self.budget_ms,
+            "max_backoff": self.max_backoff,
+            "backed_off": sorted(
+                label for label, node in nodes.items() if node["backoff"] > 1
+            ),
+            "nodes": nodes,
+        }
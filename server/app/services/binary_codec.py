@@ -0,0 +1,129 @@
+"""
+Binary sensor_data stream.
+A JSON `sensor_index` message names the sensors once; after that each
+snapshot is a single binary message:
+
+    header  <IIqI  sequence, index_version, timestamp (epoch ms), value count
+    values  <f     float32 per sensor in index order, NaN when absent
+
+Frames whose index_version differs from the last index a client received
+must be dropped until the new index arrives.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Optional
+
+from .delta_encoder import SensorIndex
+from .frame_encoder import dumps
+from .snapshot_channel import SensorSnapshot
+
+FRAME_HEADER = struct.Struct("<IIqI")
+_NAN = float("nan")
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class BinaryFrame:
+    """One encoded snapshot of the binary stream."""
+
+    __slots__ = ("sequence", "index_version", "payload")
+
+    def __init__(self, sequence: int, index_version: int, payload: bytes):
+        self.sequence = sequence
+        self.index_version = index_version
+        self.payload = payload
+
+
+def decode_frame(payload: bytes) -> Dict[str, Any]:
+    """Decode a binary frame; the reference for client implementations."""
+    sequence, index_version, timestamp_ms, count = FRAME_HEADER.unpack_from(payload)
+    values = array("f")
+    values.frombytes(payload[FRAME_HEADER.size : FRAME_HEADER.size + 4 * count])
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return {
+        "sequence": sequence,
+        "index_version": index_version,
+        "timestamp_ms": timestamp_ms,
+        "values": values.tolist(),
+    }
+
+
+class BinaryEncoder:
+    """
+    Encodes snapshots of one subscription into binary frames. The sequence
+    number of a frame is the version of the snapshot it was built from.
+    """
+
+    def __init__(self):
+        self.index = SensorIndex()
+        self._units: List[str] = []
+        self._names: List[str] = []
+        self._frame_cache: Optional[BinaryFrame] = None
+        self._index_cache: Optional[str] = None
+        self._index_cache_version = -1
+
+        # Statistics
+        self.frames_encoded = 0
+        self.bytes_encoded = 0
+        self.index_tables_built = 0
+
+    def encode(self, snapshot: SensorSnapshot) -> BinaryFrame:
+        """Binary frame for a snapshot; cached for its version."""
+        cached = self._frame_cache
+        if cached is not None and cached.sequence == snapshot.version:
+            return cached
+
+        index = self.index
+        for readings in snapshot.readings.values():
+            for reading in readings:
+                if index.get(reading.sensor_id) is None:
+                    index.index_of(reading.sensor_id)
+                    self._units.append(reading.unit)
+                    self._names.append(reading.name)
+
+        values = array("f", [_NAN]) * len(index)
+        index_of = index.get
+        for readings in snapshot.readings.values():
+            for reading in readings:
+                values[index_of(reading.sensor_id)] = reading.value
+        if _BIG_ENDIAN:
+            values.byteswap()
+
+        header = FRAME_HEADER.pack(
+            snapshot.version & 0xFFFFFFFF,
+            index.version,
+            int(snapshot.timestamp.timestamp() * 1000),
+            len(values),
+        )
+        frame = BinaryFrame(snapshot.version, index.version, header + values.tobytes())
+        self._frame_cache = frame
+        self.frames_encoded += 1
+        self.bytes_encoded += len(frame.payload)
+        return frame
+
+    def index_message(self) -> str:
+        """The `sensor_index` message describing the current index."""
+        if self._index_cache_version != self.index.version:
+            self._index_cache = dumps(
+                {
+                    "type": "sensor_index",
+                    "index_version": self.index.version,
+                    "sensor_ids": self.index.ids,
+                    "names": self._names,
+                    "units": self._units,
+                }
+            ).decode("utf-8")
+            self._index_cache_version = self.index.version
+            self.index_tables_built += 1
+        return self._index_cache
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "indexed_sensors": len(self.index),
+            "index_version": self.index.version,
+            "frames_encoded": self.frames_encoded,
+            "bytes_encoded": self.bytes_encoded,
+            "index_tables_built": self.index_tables_built,
+        }
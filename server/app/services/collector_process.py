@@ -0,0 +1,423 @@
+"""
+Out-of-process sensor collection.
+With `sensor_collector_mode = "process"` a long-lived child process owns
+every hardware provider and runs its own SensorManager. Each snapshot it
+collects is written into a SharedSnapshotBuffer; sensor definitions, which
+change rarely, travel over a pipe. The web process reads the buffer through
+RemoteSensor proxies, so hardware polling no longer competes for its GIL and
+a crash in native code only takes down the child. The web process forwards
+its consumer count over the pipe, so the child polls at the same
+demand-driven cadence as an in-process collector would.
+"""
+
+import asyncio
+import math
+import multiprocessing
+import threading
+import time
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.config import AppSettings
+from ..core.logging import get_logger
+from ..models.reading import AnyReading, Reading
+from ..models.sensor import SensorDefinition, SensorStatus
+from .shared_snapshot import FLAG_STALE, STATUS_MASK, STATUS_SHIFT, SharedSnapshotBuffer
+
+logger = get_logger("collector_process")
+
+
+# -------------------------------------------------------------
+# Child process
+# -------------------------------------------------------------
+
+
+def run_collector(shm_name: str, settings_data: Dict[str, Any], conn) -> None:
+    """Entry point of the collector process."""
+    try:
+        asyncio.run(_serve(shm_name, settings_data, conn))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _serve(shm_name: str, settings_data: Dict[str, Any], conn) -> None:
+    # Imported here so the web process does not need it for this module
+    from .sensor_manager import SensorManager
+
+    settings = AppSettings(**{**settings_data, "sensor_collector_mode": "inprocess"})
+    buffer = SharedSnapshotBuffer.attach(shm_name)
+    manager = SensorManager(settings)
+    snapshots = manager.snapshots.subscribe()
+    loop = asyncio.get_running_loop()
+    # Commands from the parent; "stop", or the pipe closing, means stop
+    stop = loop.create_future()
+    threading.Thread(
+        target=_receive_commands,
+        args=(conn, loop, stop, manager),
+        name="collector-commands",
+        daemon=True,
+    ).start()
+
+    try:
+        await manager.initialize()
+
+        sources = [
+            {"source_id": p.source_id, "display_name": p.display_name}
+            for p in manager.sensor_providers
+        ]
+        definitions: List[SensorDefinition] = list(
+            manager.get_sensor_definition_map().values()
+        )
+        index = {d.sensor_id: i for i, d in enumerate(definitions)}
+        version = 1
+        capacity_warned = False
+        conn.send(("definitions", version, sources, _dump(definitions)))
+
+        while not stop.done():
+            next_snapshot = asyncio.ensure_future(snapshots.get())
+            await asyncio.wait({next_snapshot, stop}, return_when=asyncio.FIRST_COMPLETED)
+            if not next_snapshot.done():
+                next_snapshot.cancel()
+                break
+            snapshot = next_snapshot.result()
+
+            # Readings the definitions do not cover extend the layout
+            added = False
+            for source_id, readings in snapshot.readings.items():
+                for reading in readings:
+                    if reading.sensor_id in index:
+                        continue
+                    if len(index) >= buffer.capacity:
+                        if not capacity_warned:
+                            logger.warning(
+                                f"Collector buffer is full ({buffer.capacity} sensors); "
+                                f"dropping {reading.sensor_id} and any further new "
+                                "sensors, raise sensor_collector_capacity to keep them"
+                            )
+                            capacity_warned = True
+                        continue
+                    index[reading.sensor_id] = len(definitions)
+                    definitions.append(_definition_from_reading(reading, source_id))
+                    added = True
+            if added:
+                version += 1
+                conn.send(("definitions", version, sources, _dump(definitions)))
+
+            values = array("d", [math.nan]) * len(definitions)
+            minimums = array("d", [math.nan]) * len(definitions)
+            maximums = array("d", [math.nan]) * len(definitions)
+            flags = bytearray(len(definitions))
+            stale = set(snapshot.stale_sources)
+            for source_id, readings in snapshot.readings.items():
+                flag = FLAG_STALE if source_id in stale else 0
+                for reading in readings:
+                    position = index.get(reading.sensor_id)
+                    if position is not None:
+                        values[position] = reading.value
+                        if reading.min_value is not None:
+                            minimums[position] = reading.min_value
+                        if reading.max_value is not None:
+                            maximums[position] = reading.max_value
+                        flags[position] = flag | _encode_status(reading.status)
+            buffer.write(
+                snapshot.version,
+                snapshot.timestamp.timestamp(),
+                version,
+                values,
+                flags,
+                minimums,
+                maximums,
+            )
+    finally:
+        snapshots.close()
+        await manager.shutdown()
+        buffer.close()
+
+
+def _receive_commands(
+    conn, loop: asyncio.AbstractEventLoop, stop: asyncio.Future, manager
+) -> None:
+    try:
+        while True:
+            message = conn.recv()
+            if message[0] != "consumers":
+                break
+            loop.call_soon_threadsafe(manager.set_consumer_count, message[1])
+    except (EOFError, OSError):
+        pass
+    loop.call_soon_threadsafe(lambda: stop.done() or stop.set_result(None))
+
+
+def _dump(definitions: List[SensorDefinition]) -> List[Dict[str, Any]]:
+    return [definition.model_dump(mode="json") for definition in definitions]
+
+
+def _definition_from_reading(reading: AnyReading, source_id: str) -> SensorDefinition:
+    return SensorDefinition(
+        sensor_id=reading.sensor_id,
+        name=reading.name,
+        category=reading.category,
+        hardware_type=reading.hardware_type,
+        unit=reading.unit,
+        source_id=source_id,
+        min_value=reading.min_value,
+        max_value=reading.max_value,
+    )
+
+
+_STATUSES = list(SensorStatus)
+
+
+def _encode_status(status: Any) -> int:
+    return _STATUSES.index(SensorStatus(status)) << STATUS_SHIFT
+
+
+def _decode_status(flags: int) -> SensorStatus:
+    return _STATUSES[(flags & STATUS_MASK) >> STATUS_SHIFT]
+
+
+# -------------------------------------------------------------
+# Web process
+# -------------------------------------------------------------
+
+
+class CollectorProcessClient:
+    """Starts the collector process and decodes what it publishes."""
+
+    def __init__(self, settings: AppSettings):
+        self.settings = settings
+        self.capacity = getattr(settings, "sensor_collector_capacity", 4096)
+        self.start_timeout = getattr(
+            settings, "sensor_collector_start_timeout_seconds", 30.0
+        )
+        self._buffer: Optional[SharedSnapshotBuffer] = None
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn = None
+
+        self.sources: List[Dict[str, str]] = []
+        self.definitions: List[SensorDefinition] = []
+        self.definitions_version = 0
+        self._definitions_by_source: Dict[str, List[SensorDefinition]] = {}
+
+        # Latest snapshot decoded into readings per source
+        self._decoded_sequence: Optional[int] = None
+        self._readings: Dict[str, List[Reading]] = {}
+        self._stale_sources: set = set()
+        self.last_published_at: Optional[float] = None
+        self._last_new_snapshot = time.monotonic()
+        # Consumers of the web process, forwarded so the child follows its cadence
+        self.consumers = 0
+
+        # Bumped on every start; proxies compare it to avoid double restarts
+        self.generation = 0
+        self._restart_lock: Optional[asyncio.Lock] = None
+
+        # Statistics
+        self.snapshots_decoded = 0
+        self.started_at: Optional[float] = None
+
+    @property
+    def stale_after(self) -> Optional[float]:
+        """
+        Seconds without a new snapshot after which a live process counts as
+        wedged, at the cadence it currently polls at; None while it is paused.
+        """
+        if self.consumers:
+            interval = getattr(self.settings, "sensor_poll_interval_seconds", 5)
+        else:
+            interval = getattr(self.settings, "sensor_idle_poll_interval_seconds", 60.0)
+        if interval <= 0:
+            return None
+        return 3 * interval + getattr(self.settings, "sensor_provider_timeout_seconds", 3.0)
+
+    @property
+    def is_overdue(self) -> bool:
+        stale_after = self.stale_after
+        return stale_after is not None and self.publish_age > stale_after
+
+    def set_consumer_count(self, count: int) -> None:
+        """Forward the web process's consumer count to the collector process."""
+        if count != self.consumers:
+            # The child changes cadence now; judge its publishing from here on
+            self._last_new_snapshot = time.monotonic()
+        self.consumers = count
+        self._send(("consumers", count))
+
+    def _send(self, message: Tuple[Any, ...]) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.send(message)
+            except (OSError, ValueError):
+                pass  # Process gone; is_alive reports it
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    @property
+    def exitcode(self) -> Optional[int]:
+        return self._process.exitcode if self._process is not None else None
+
+    async def start(self) -> bool:
+        """Start the process and wait for its first sensor definitions."""
+        self.generation += 1
+        self.definitions_version = 0
+        context = multiprocessing.get_context("spawn")
+        self._buffer = SharedSnapshotBuffer.create(self.capacity)
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=run_collector,
+            args=(self._buffer.name, self.settings.model_dump(), child_conn),
+            name="usmp-collector",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._send(("consumers", self.consumers))
+        self.started_at = self._last_new_snapshot = time.monotonic()
+        logger.info(f"Collector process started (pid {self._process.pid})")
+
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + self.start_timeout
+        while not self.definitions_version:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.is_alive:
+                break
+            if await loop.run_in_executor(None, self._conn.poll, min(remaining, 0.5)):
+                self._drain_messages()
+        if not self.definitions_version:
+            logger.error(
+                f"Collector process sent no sensor definitions "
+                f"(alive: {self.is_alive}, exit code: {self.exitcode})"
+            )
+            await self.stop()
+            return False
+        return True
+
+    async def restart(self, generation: int) -> bool:
+        """
+        Restart the process, unless it was already restarted since
+        `generation` (several proxies may ask for the same restart).
+        """
+        if self._restart_lock is None:
+            self._restart_lock = asyncio.Lock()
+        async with self._restart_lock:
+            if self.generation != generation and self.is_alive:
+                return True
+            await self.stop()
+            return await self.start()
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        process, self._process = self._process, None
+        if process is not None:
+            self._send(("stop",))
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, process.join, timeout)
+            if process.is_alive():
+                logger.warning("Collector process did not stop in time; terminating")
+                process.terminate()
+                await loop.run_in_executor(None, process.join, timeout)
+            logger.info(f"Collector process stopped (exit code {process.exitcode})")
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+    def _drain_messages(self) -> None:
+        conn = self._conn
+        try:
+            while conn is not None and conn.poll():
+                message = conn.recv()
+                if message[0] == "definitions":
+                    _, version, sources, definitions = message
+                    self._set_definitions(version, sources, definitions)
+        except (EOFError, OSError):
+            pass  # Process gone; is_alive reports it
+
+    def _set_definitions(
+        self, version: int, sources: List[Dict[str, str]], data: List[Dict[str, Any]]
+    ) -> None:
+        self.sources = sources
+        self.definitions = [SensorDefinition(**item) for item in data]
+        self.definitions_version = version
+        by_source: Dict[str, List[SensorDefinition]] = {}
+        for definition in self.definitions:
+            by_source.setdefault(definition.source_id, []).append(definition)
+        self._definitions_by_source = by_source
+        self._decoded_sequence = None
+
+    @property
+    def publish_age(self) -> float:
+        """Seconds since a new snapshot was last seen in the buffer."""
+        return time.monotonic() - self._last_new_snapshot
+
+    def has_new_snapshot(self) -> bool:
+        """Whether the buffer holds a snapshot read() has not decoded yet."""
+        if self._buffer is None:
+            return False
+        sequence = self._buffer.latest_sequence
+        return sequence is not None and sequence != self._decoded_sequence
+
+    def definitions_for(self, source_id: str) -> List[SensorDefinition]:
+        return list(self._definitions_by_source.get(source_id, []))
+
+    def read(self) -> Tuple[Dict[str, List[Reading]], set]:
+        """Readings per source and the stale sources of the latest snapshot."""
+        if self._buffer is None:
+            return {}, set()
+        self._drain_messages()
+        snapshot = self._buffer.read(after_sequence=self._decoded_sequence)
+        if snapshot is None:
+            return self._readings, self._stale_sources
+        self._last_new_snapshot = time.monotonic()
+        if snapshot.definitions_version > self.definitions_version:
+            # The matching definitions are still in the pipe
+            return self._readings, self._stale_sources
+
+        timestamp = datetime.fromtimestamp(snapshot.timestamp)
+        readings: Dict[str, List[Reading]] = {}
+        stale = set()
+        definitions = self.definitions
+        for position, value in enumerate(snapshot.values):
+            if value != value:  # NaN: no reading this round
+                continue
+            definition = definitions[position]
+            minimum = snapshot.minimums[position]
+            maximum = snapshot.maximums[position]
+            flags = snapshot.flags[position]
+            readings.setdefault(definition.source_id, []).append(
+                Reading(
+                    definition,
+                    value,
+                    timestamp,
+                    _decode_status(flags),
+                    None if minimum != minimum else minimum,
+                    None if maximum != maximum else maximum,
+                )
+            )
+            if flags & FLAG_STALE:
+                stale.add(definition.source_id)
+        self._readings = readings
+        self._stale_sources = stale
+        self._decoded_sequence = snapshot.sequence
+        self.last_published_at = snapshot.timestamp
+        self.snapshots_decoded += 1
+        return readings, stale
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pid": self._process.pid if self._process is not None else None,
+            "alive": self.is_alive,
+            "exit_code": self.exitcode,
+            "uptime_seconds": round(time.monotonic() - self.started_at, 3)
+            if self.started_at is not None
+            else None,
+            "definitions_version": self.definitions_version,
+            "sensors": len(self.definitions),
+            "snapshots_decoded": self.snapshots_decoded,
+            "publish_age_seconds": round(self.publish_age, 3),
+            "buffer": self._buffer.get_stats() if self._buffer is not None else None,
+        }
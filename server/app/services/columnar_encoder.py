@@ -0,0 +1,156 @@
+"""
+Columnar JSON sensor_data stream.
+A `sensor_dictionary` message carries the static fields of every sensor once;
+each tick is then a `sensor_columns` message with parallel `ids` and `values`
+arrays and a single timestamp:
+
+    {"type":"sensor_columns","sequence":..,"dictionary_version":..,
+     "timestamp":..,"ids":[..],"values":[..],"stale_sources":[..]}
+
+Per-reading status and quality are sent only for readings that are not
+active/good, as sparse `status`/`quality` objects keyed by sensor id.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional
+
+from ..models.reading import AnyReading
+from ..models.sensor import DataQuality, SensorDefinition, SensorStatus
+from .frame_encoder import dumps
+from .snapshot_channel import SensorSnapshot
+
+_ACTIVE = SensorStatus.ACTIVE.value
+_GOOD = DataQuality.GOOD.value
+
+
+class ColumnarFrame:
+    """One encoded tick of the columnar stream."""
+
+    __slots__ = ("sequence", "dictionary_version", "text")
+
+    def __init__(self, sequence: int, dictionary_version: int, text: str):
+        self.sequence = sequence
+        self.dictionary_version = dictionary_version
+        self.text = text
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+class ColumnarEncoder:
+    """
+    Encodes snapshots of one subscription into columnar frames. Static fields
+    come from the sensor's SensorDefinition when one is known, and otherwise
+    from the first reading seen for that sensor.
+    """
+
+    def __init__(self, definitions: Optional[Mapping[str, SensorDefinition]] = None):
+        self.definitions = definitions if definitions is not None else {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.dictionary_version = 0
+        self._frame_cache: Optional[ColumnarFrame] = None
+        self._dictionary_cache: Optional[str] = None
+        self._dictionary_cache_version = -1
+
+        # Statistics
+        self.frames_encoded = 0
+        self.bytes_encoded = 0
+        self.dictionaries_built = 0
+
+    def _entry(self, reading: AnyReading) -> Dict[str, Any]:
+        definition = self.definitions.get(reading.sensor_id)
+        entry = {
+            "name": reading.name,
+            "unit": reading.unit,
+            "category": _enum_value(reading.category),
+            "hardware_type": _enum_value(reading.hardware_type),
+            "source": reading.source,
+            "parent_hardware": reading.parent_hardware,
+            "min_value": reading.min_value,
+            "max_value": reading.max_value,
+            "metadata": reading.metadata.model_dump(mode="json", exclude_none=True),
+        }
+        if definition is not None:
+            entry.update(
+                name=definition.name,
+                unit=definition.unit,
+                category=_enum_value(definition.category),
+                hardware_type=_enum_value(definition.hardware_type),
+                description=definition.description,
+            )
+            if definition.min_value is not None:
+                entry["min_value"] = definition.min_value
+            if definition.max_value is not None:
+                entry["max_value"] = definition.max_value
+        return entry
+
+    def encode(self, snapshot: SensorSnapshot) -> ColumnarFrame:
+        """Columnar frame for a snapshot; cached for its version."""
+        cached = self._frame_cache
+        if cached is not None and cached.sequence == snapshot.version:
+            return cached
+
+        entries = self._entries
+        ids: List[str] = []
+        values: List[float] = []
+        status: Dict[str, str] = {}
+        quality: Dict[str, str] = {}
+        for readings in snapshot.readings.values():
+            for reading in readings:
+                sensor_id = reading.sensor_id
+                if sensor_id not in entries:
+                    entries[sensor_id] = self._entry(reading)
+                    self.dictionary_version += 1
+                ids.append(sensor_id)
+                values.append(reading.value)
+                reading_status = _enum_value(reading.status)
+                if reading_status != _ACTIVE:
+                    status[sensor_id] = reading_status
+                reading_quality = _enum_value(reading.quality)
+                if reading_quality != _GOOD:
+                    quality[sensor_id] = reading_quality
+
+        message = {
+            "type": "sensor_columns",
+            "sequence": snapshot.version,
+            "dictionary_version": self.dictionary_version,
+            "timestamp": snapshot.timestamp.isoformat(),
+            "ids": ids,
+            "values": values,
+            "stale_sources": snapshot.stale_sources,
+        }
+        if status:
+            message["status"] = status
+        if quality:
+            message["quality"] = quality
+
+        frame = ColumnarFrame(
+            snapshot.version, self.dictionary_version, dumps(message).decode("utf-8")
+        )
+        self._frame_cache = frame
+        self.frames_encoded += 1
+        self.bytes_encoded += len(frame.text)
+        return frame
+
+    def dictionary_message(self) -> str:
+        """The `sensor_dictionary` message for every sensor seen so far."""
+        if self._dictionary_cache_version != self.dictionary_version:
+            self._dictionary_cache = dumps(
+                {
+                    "type": "sensor_dictionary",
+                    "dictionary_version": self.dictionary_version,
+                    "sensors": self._entries,
+                }
+            ).decode("utf-8")
+            self._dictionary_cache_version = self.dictionary_version
+            self.dictionaries_built += 1
+        return self._dictionary_cache
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "dictionary_sensors": len(self._entries),
+            "dictionary_version": self.dictionary_version,
+            "frames_encoded": self.frames_encoded,
+            "bytes_encoded": self.bytes_encoded,
+            "dictionaries_built": self.dictionaries_built,
+        }
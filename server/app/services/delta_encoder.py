@@ -0,0 +1,204 @@
+"""
+Delta-encoded sensor_data stream.
+A keyframe carries the full state plus a sensor index table; the frames in
+between carry only `{sensor_index: value}` for values that changed.
+"""
+
+from array import array
+from typing import Dict, List, Optional
+
+from .frame_encoder import EncodedSnapshot, dumps
+from .snapshot_channel import SensorSnapshot
+
+
+class SensorIndex:
+    """Stable sensor_id -> small integer index assignment for the wire."""
+
+    def __init__(self):
+        self._indices: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.version = 0  # Bumped whenever a new sensor is added
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def index_of(self, sensor_id: str) -> int:
+        index = self._indices.get(sensor_id)
+        if index is None:
+            index = len(self.ids)
+            self._indices[sensor_id] = index
+            self.ids.append(sensor_id)
+            self.version += 1
+        return index
+
+    def get(self, sensor_id: str) -> Optional[int]:
+        return self._indices.get(sensor_id)
+
+
+class DeltaFrame:
+    """One encoded frame of the delta stream."""
+
+    __slots__ = ("sequence", "base_sequence", "keyframe", "text")
+
+    def __init__(
+        self, sequence: int, base_sequence: Optional[int], keyframe: bool, text: str
+    ):
+        self.sequence = sequence
+        self.base_sequence = base_sequence
+        self.keyframe = keyframe
+        self.text = text
+
+
+def _delta_frame(
+    snapshot: SensorSnapshot, base_sequence: int, changed: Dict[str, float]
+) -> DeltaFrame:
+    text = dumps(
+        {
+            "type": "sensor_delta",
+            "sequence": snapshot.version,
+            "base_sequence": base_sequence,
+            "timestamp": snapshot.timestamp.isoformat(),
+            "values": changed,
+            "stale_sources": snapshot.stale_sources,
+        }
+    ).decode("utf-8")
+    return DeltaFrame(snapshot.version, base_sequence, False, text)
+
+
+class DeltaEncoder:
+    """
+    Produces the delta stream from successive snapshots. The sequence number of
+    a frame is the version of the snapshot it was built from; `base_sequence`
+    names the frame a delta applies to, so clients can detect gaps.
+    """
+
+    def __init__(self, keyframe_interval: int = 30):
+        self.keyframe_interval = max(1, keyframe_interval)
+        # Own index per stream: keyframes list only this stream's sensors, and
+        # sensors appearing in other streams never force a keyframe here
+        self.index = SensorIndex()
+        self._previous = array("d")
+        self._previous_sequence: Optional[int] = None
+        self._index_version_sent = -1
+        self._frames_since_keyframe = 0
+        self._keyframe_cache: Optional[DeltaFrame] = None
+
+        # Statistics
+        self.keyframes_sent = 0
+        self.deltas_sent = 0
+        self.values_sent = 0
+
+    @property
+    def last_sequence(self) -> Optional[int]:
+        """Sequence of the last frame produced by encode()."""
+        return self._previous_sequence
+
+    def _grow(self) -> None:
+        missing = len(self.index) - len(self._previous)
+        if missing > 0:
+            self._previous.extend([float("nan")] * missing)
+
+    def keyframe(self, snapshot: SensorSnapshot, encoded: EncodedSnapshot) -> DeltaFrame:
+        """Full-state frame for a snapshot; cached for its version."""
+        cached = self._keyframe_cache
+        if cached is not None and cached.sequence == snapshot.version:
+            return cached
+
+        for readings in snapshot.readings.values():
+            for reading in readings:
+                self.index.index_of(reading.sensor_id)
+
+        header = dumps(
+            {
+                "sequence": snapshot.version,
+                "keyframe": True,
+                "sensor_index": self.index.ids,
+            }
+        )
+        # {"sequence":..,"keyframe":true,"sensor_index":[..],"type":"sensor_data",...}
+        text = (header[:-1] + b"," + encoded.sensor_data[1:]).decode("utf-8")
+        frame = DeltaFrame(snapshot.version, None, True, text)
+        self._keyframe_cache = frame
+        return frame
+
+    def encode(self, snapshot: SensorSnapshot, encoded: EncodedSnapshot) -> DeltaFrame:
+        """Next frame of the shared stream: a delta, or a keyframe when one is due."""
+        if self._previous_sequence == snapshot.version:
+            # Already encoded this snapshot; deltas are only valid once
+            return self.keyframe(snapshot, encoded)
+
+        changed: Dict[str, float] = {}
+        index_of = self.index.index_of
+        previous = self._previous
+        updates = []
+        for readings in snapshot.readings.values():
+            for reading in readings:
+                updates.append((index_of(reading.sensor_id), float(reading.value)))
+        self._grow()
+
+        for index, value in updates:
+            if previous[index] != value:
+                changed[str(index)] = value
+                previous[index] = value
+
+        keyframe_due = (
+            self._previous_sequence is None
+            or self._index_version_sent != self.index.version
+            or self._frames_since_keyframe >= self.keyframe_interval - 1
+        )
+        base_sequence = self._previous_sequence
+        self._previous_sequence = snapshot.version
+
+        if keyframe_due:
+            self._frames_since_keyframe = 0
+            self._index_version_sent = self.index.version
+            self.keyframes_sent += 1
+            return self.keyframe(snapshot, encoded)
+
+        self._frames_since_keyframe += 1
+        self.deltas_sent += 1
+        self.values_sent += len(changed)
+        return _delta_frame(snapshot, base_sequence, changed)
+
+    def replay(
+        self, base: SensorSnapshot, snapshots: List[SensorSnapshot]
+    ) -> Optional[List[DeltaFrame]]:
+        """
+        Deltas taking a client from `base` through each of `snapshots`, without
+        touching the live stream. Returns None if a sensor the client cannot
+        know about appears, in which case it needs a keyframe instead.
+        """
+        get_index = self.index.get
+        previous: Dict[int, float] = {}
+        for readings in base.readings.values():
+            for reading in readings:
+                index = get_index(reading.sensor_id)
+                if index is None:
+                    return None
+                previous[index] = float(reading.value)
+
+        frames = []
+        base_sequence = base.version
+        for snapshot in snapshots:
+            changed: Dict[str, float] = {}
+            for readings in snapshot.readings.values():
+                for reading in readings:
+                    index = get_index(reading.sensor_id)
+                    if index not in previous:
+                        return None
+                    value = float(reading.value)
+                    if previous[index] != value:
+                        changed[str(index)] = value
+                        previous[index] = value
+            frames.append(_delta_frame(snapshot, base_sequence, changed))
+            base_sequence = snapshot.version
+        return frames
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "keyframe_interval": self.keyframe_interval,
+            "indexed_sensors": len(self.index),
+            "keyframes_sent": self.keyframes_sent,
+            "deltas_sent": self.deltas_sent,
+            "values_sent": self.values_sent,
+        }
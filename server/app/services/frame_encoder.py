@@ -0,0 +1,214 @@
+"""
+Snapshot-to-wire encoding stage.
+Each snapshot is serialized once; broadcasts, forced broadcasts, new
+connections and REST reads all reuse the cached bytes for its version.
+"""
+
+import json
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from ..models.reading import AnyReading, Reading, reading_metadata
+from ..models.sensor import DataQuality, SensorDefinition, SensorReading
+from .snapshot_channel import SensorSnapshot
+from .subscriptions import ALL
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+# pydantic-core serializes models straight to JSON bytes in Rust; readings
+# that arrive as SensorReading models (rather than Readings) still go this way
+_MODELS_ADAPTER = TypeAdapter(List[SensorReading])
+_DEFINITIONS_ADAPTER = TypeAdapter(List[SensorDefinition])
+
+
+def _reading_template(definition: SensorDefinition) -> Dict[str, Any]:
+    """The JSON fields of a reading that come from its definition, in model order."""
+    return {
+        "sensor_id": definition.sensor_id,
+        "name": definition.name.strip(),
+        "value": None,
+        "unit": definition.unit,
+        "min_value": None,
+        "max_value": None,
+        "category": getattr(definition.category, "value", definition.category),
+        "hardware_type": getattr(definition.hardware_type, "value", definition.hardware_type),
+        "source": definition.source_id,
+        "parent_hardware": None,
+        "status": None,
+        "quality": DataQuality.GOOD.value,
+        "timestamp": None,
+        "last_updated": None,
+        "metadata": reading_metadata(definition).model_dump(mode="json"),
+    }
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode plain JSON-compatible data with orjson, falling back to json."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class EncodedSnapshot:
+    """Wire-ready encodings of one snapshot."""
+
+    __slots__ = ("version", "sources", "sensor_data", "_sensor_data_text")
+
+    def __init__(self, version: int, sources: bytes, sensor_data: bytes):
+        self.version = version
+        self.sources = sources  # {source_id: [reading, ...]} as JSON
+        self.sensor_data = sensor_data  # Complete `sensor_data` WebSocket message
+        self._sensor_data_text: Optional[str] = None
+
+    @property
+    def sensor_data_text(self) -> str:
+        """The `sensor_data` message as text, decoded once for send_text()."""
+        if self._sensor_data_text is None:
+            self._sensor_data_text = self.sensor_data.decode("utf-8")
+        return self._sensor_data_text
+
+
+class SnapshotEncoder:
+    """
+    Encodes snapshots and caches the result by snapshot version. A `variant`
+    key distinguishes differently filtered views of the same version.
+    """
+
+    def __init__(self, cache_size: int = 4):
+        self.cache_size = cache_size  # Number of recent versions kept
+        self._cache: "OrderedDict[Tuple[int, Hashable], EncodedSnapshot]" = OrderedDict()
+        self.encode_count = 0
+        self.cache_hits = 0
+        # Definition catalog, cached per SensorManager.definitions_version
+        self._catalog: Optional[str] = None
+        self._catalog_version: Optional[int] = None
+        self.catalog_encodes = 0
+        # Static JSON fields per sensor, rebuilt when its definition is replaced
+        self._templates: Dict[str, Tuple[SensorDefinition, Dict[str, Any]]] = {}
+
+    def _reading_json(self, reading: Reading, timestamps: Dict[datetime, str]) -> Dict[str, Any]:
+        """A Reading as the JSON-ready dict its SensorReading model dumps to."""
+        definition = reading.definition
+        cached = self._templates.get(definition.sensor_id)
+        if cached is None or cached[0] is not definition:
+            cached = self._templates[definition.sensor_id] = (
+                definition,
+                _reading_template(definition),
+            )
+        fields = cached[1].copy()
+        fields["value"] = reading.value
+        fields["min_value"] = reading.min_value
+        fields["max_value"] = reading.max_value
+        fields["parent_hardware"] = reading.parent_hardware
+        fields["status"] = getattr(reading.status, "value", reading.status)
+        timestamp = reading.timestamp
+        text = timestamps.get(timestamp)
+        if text is None:
+            # Readings of one poll share a timestamp: formatted once
+            # Same format as SensorReading's json_encoders
+            text = timestamps[timestamp] = timestamp.isoformat()
+        fields["timestamp"] = text
+        return fields
+
+    def _encode_sources(self, readings_by_source: Mapping[str, List[AnyReading]]) -> bytes:
+        """{source_id: [reading, ...]} as JSON, identical to the models' JSON."""
+        timestamps: Dict[datetime, str] = {}
+        parts = []
+        for source_id, readings in readings_by_source.items():
+            if readings and isinstance(readings[0], SensorReading):
+                payload = _MODELS_ADAPTER.dump_json(readings)
+            else:
+                payload = dumps([self._reading_json(r, timestamps) for r in readings])
+            parts.append(dumps(source_id) + b":" + payload)
+        return b"{" + b",".join(parts) + b"}"
+
+    def encode(
+        self, snapshot: SensorSnapshot, variant: Hashable = None
+    ) -> EncodedSnapshot:
+        """Return the encoded form of a snapshot, serializing it at most once."""
+        if variant == ALL:
+            variant = None  # The unfiltered snapshot, however the caller names it
+        key = (snapshot.version, variant)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+
+        sources = self._encode_sources(snapshot.readings)
+        timestamp = snapshot.timestamp.isoformat()
+        summary = dumps(
+            {
+                "timestamp": timestamp,
+                "version": snapshot.version,
+                "total_sensors": snapshot.total_sensors,
+                "active_sources": snapshot.active_sources,
+                "stale_sources": snapshot.stale_sources,
+            }
+        )
+        # Splice the pre-encoded sources into the message envelope:
+        # {"type":"sensor_data","sequence_number":..,"timestamp":..,
+        #  "data":{"sources":...,<summary>}}
+        sensor_data = b"".join(
+            (
+                b'{"type":"sensor_data","sequence_number":',
+                dumps(snapshot.version),
+                b',"timestamp":',
+                dumps(timestamp),
+                b',"data":{"sources":',
+                sources,
+                b",",
+                summary[1:],
+                b"}",
+            )
+        )
+
+        encoded = EncodedSnapshot(snapshot.version, sources, sensor_data)
+        self.encode_count += 1
+        self._cache[key] = encoded
+        oldest_kept = snapshot.version - self.cache_size
+        while self._cache:
+            version, _ = next(iter(self._cache))
+            if version > oldest_kept:
+                break
+            self._cache.popitem(last=False)
+        return encoded
+
+    def encode_catalog(
+        self, definitions: Mapping[str, SensorDefinition], version: int
+    ) -> str:
+        """
+        The `sensor_definitions` message, re-encoded only when the definitions'
+        `version` (SensorManager.definitions_version) changes.
+        """
+        if self._catalog is None or self._catalog_version != version:
+            self._catalog = b"".join(
+                (
+                    b'{"type":"sensor_definitions","timestamp":',
+                    dumps(datetime.now().isoformat()),
+                    b',"data":',
+                    _DEFINITIONS_ADAPTER.dump_json(list(definitions.values())),
+                    b"}",
+                )
+            ).decode("utf-8")
+            self._catalog_version = version
+            self.catalog_encodes += 1
+        return self._catalog
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "encoder": "orjson" if ORJSON_AVAILABLE else "json",
+            "encode_count": self.encode_count,
+            "cache_hits": self.cache_hits,
+            "catalog_encodes": self.catalog_encodes,
+            "cached_versions": sorted({version for version, _ in self._cache}),
+        }
@@ -0,0 +1,209 @@
+"""
+Per-category sensor polling schedule.
+Each sensor is polled on its own cadence, taken from a per-sensor override,
+its category's interval, or the default poll interval, in that order. With
+adaptation enabled the cadence also stretches for sensors that barely move
+and shrinks for sensors that change quickly.
+"""
+
+import math
+from typing import Any, Dict, Iterable, Mapping, Optional, Set
+
+from ..models.reading import AnyReading
+from ..models.sensor import SensorCategory, SensorDefinition
+
+# Fast-moving metrics first, slow physical quantities last (seconds)
+DEFAULT_CATEGORY_INTERVALS: Dict[str, float] = {
+    SensorCategory.LOAD.value: 1.0,
+    SensorCategory.USAGE.value: 1.0,
+    SensorCategory.CLOCK.value: 1.0,
+    SensorCategory.FREQUENCY.value: 1.0,
+    SensorCategory.POWER.value: 1.0,
+    SensorCategory.THROUGHPUT.value: 1.0,
+    SensorCategory.CURRENT.value: 2.0,
+    SensorCategory.TEMPERATURE.value: 3.0,
+    SensorCategory.FAN.value: 3.0,
+    SensorCategory.FAN_SPEED.value: 3.0,
+    SensorCategory.CONTROL.value: 3.0,
+    SensorCategory.VOLTAGE.value: 5.0,
+    SensorCategory.FLOW.value: 5.0,
+    SensorCategory.FLOW_RATE.value: 5.0,
+    SensorCategory.NOISE.value: 5.0,
+    SensorCategory.FACTOR.value: 10.0,
+    SensorCategory.DATA.value: 10.0,
+    SensorCategory.DATA_SIZE.value: 10.0,
+    SensorCategory.ENERGY.value: 10.0,
+    SensorCategory.LEVEL.value: 30.0,
+}
+
+# Adaptation: smoothing of the observed change, and the change (relative to
+# the sensor's magnitude) below which a sensor counts as quiet / above which
+# it counts as busy.
+_ADAPT_ALPHA = 0.3
+_QUIET_CHANGE = 0.002
+_BUSY_CHANGE = 0.02
+_ADAPT_STEP = 1.5
+_MIN_TICK = 0.1
+
+
+def _category_value(category: Any) -> str:
+    return getattr(category, "value", category)
+
+
+class _ScheduledSensor:
+    __slots__ = (
+        "source_id",
+        "category",
+        "base_interval",
+        "factor",
+        "next_due",
+        "last_value",
+        "activity",
+    )
+
+    def __init__(self, source_id: str, category: str, base_interval: float):
+        self.source_id = source_id
+        self.category = category
+        self.base_interval = base_interval
+        self.factor = 1.0
+        self.next_due = -math.inf  # Due on the first tick
+        self.last_value: Optional[float] = None
+        self.activity = 0.0  # Smoothed relative change between polls
+
+    @property
+    def interval(self) -> float:
+        return self.base_interval * self.factor
+
+
+class PollingSchedule:
+    """Tracks when each sensor is next due and hands out due sensors per tick."""
+
+    def __init__(
+        self,
+        default_interval: float,
+        category_intervals: Optional[Mapping[str, float]] = None,
+        sensor_intervals: Optional[Mapping[str, float]] = None,
+        adaptive: bool = False,
+        min_factor: float = 0.5,
+        max_factor: float = 4.0,
+    ):
+        self.default_interval = default_interval
+        # Overrides are validated against SensorCategory
+        self.category_intervals = dict(DEFAULT_CATEGORY_INTERVALS)
+        for category, interval in (category_intervals or {}).items():
+            self.category_intervals[SensorCategory(category).value] = interval
+        self.sensor_intervals = dict(sensor_intervals or {})
+        self.adaptive = adaptive
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self._sensors: Dict[str, _ScheduledSensor] = {}
+
+        # Statistics
+        self.ticks = 0
+        self.sensor_reads = 0
+
+    @classmethod
+    def from_settings(cls, settings) -> "PollingSchedule":
+        return cls(
+            default_interval=getattr(settings, "sensor_poll_interval_seconds", 5),
+            category_intervals=getattr(settings, "sensor_category_intervals", {}),
+            sensor_intervals=getattr(settings, "sensor_interval_overrides", {}),
+            adaptive=getattr(settings, "sensor_schedule_adaptive", False),
+        )
+
+    def __len__(self) -> int:
+        return len(self._sensors)
+
+    def interval_for(self, sensor_id: str, category: Any) -> float:
+        if sensor_id in self.sensor_intervals:
+            return self.sensor_intervals[sensor_id]
+        return self.category_intervals.get(_category_value(category), self.default_interval)
+
+    def register(self, sensor_id: str, source_id: str, category: Any) -> None:
+        if sensor_id not in self._sensors:
+            category = _category_value(category)
+            self._sensors[sensor_id] = _ScheduledSensor(
+                source_id, category, self.interval_for(sensor_id, category)
+            )
+
+    def register_definitions(self, definitions: Iterable[SensorDefinition]) -> None:
+        for definition in definitions:
+            self.register(definition.sensor_id, definition.source_id, definition.category)
+
+    @property
+    def tick_interval(self) -> float:
+        """Cadence at which due sensors must be checked."""
+        if not self._sensors:
+            return self.default_interval
+        shortest = min(sensor.base_interval for sensor in self._sensors.values())
+        if self.adaptive:
+            shortest *= self.min_factor
+        return max(_MIN_TICK, shortest)
+
+    def take_due(self, now: float) -> Dict[str, Set[str]]:
+        """
+        Sensors due at `now`, grouped by source, and schedule their next poll.
+        Sensors due within half a tick are included so cadences do not slip
+        by a whole tick because of timer jitter.
+        """
+        horizon = now + self.tick_interval / 2
+        due: Dict[str, Set[str]] = {}
+        for sensor_id, sensor in self._sensors.items():
+            if sensor.next_due <= horizon:
+                due.setdefault(sensor.source_id, set()).add(sensor_id)
+                # Keep the cadence anchored unless we fell behind
+                next_due = sensor.next_due + sensor.interval
+                sensor.next_due = next_due if next_due > now else now + sensor.interval
+                self.sensor_reads += 1
+        self.ticks += 1
+        return due
+
+    def mark_all_polled(self, now: float) -> None:
+        """Restart every sensor's cadence after a full collection."""
+        for sensor in self._sensors.values():
+            sensor.next_due = now + sensor.interval
+
+    def observe(self, readings: Iterable[AnyReading]) -> None:
+        """Register unseen sensors and, when adaptive, adjust cadences."""
+        for reading in readings:
+            sensor = self._sensors.get(reading.sensor_id)
+            if sensor is None:
+                self.register(reading.sensor_id, reading.source, reading.category)
+                sensor = self._sensors[reading.sensor_id]
+            value = float(reading.value)
+            if self.adaptive and sensor.last_value is not None:
+                scale = max(abs(sensor.last_value), abs(value), 1e-9)
+                change = abs(value - sensor.last_value) / scale
+                sensor.activity += _ADAPT_ALPHA * (change - sensor.activity)
+                if sensor.activity < _QUIET_CHANGE:
+                    sensor.factor = min(self.max_factor, sensor.factor * _ADAPT_STEP)
+                elif sensor.activity > _BUSY_CHANGE:
+                    sensor.factor = max(self.min_factor, sensor.factor / _ADAPT_STEP)
+            sensor.last_value = value
+
+    def get_stats(self) -> Dict[str, Any]:
+        categories: Dict[str, Dict[str, Any]] = {}
+        for sensor in self._sensors.values():
+            entry = categories.setdefault(
+                sensor.category, {"sensors": 0, "interval_seconds": sensor.base_interval}
+            )
+            entry["sensors"] += 1
+        # What polling every sensor on every tick would have cost
+        uniform_reads = self.ticks * len(self._sensors)
+        stats = {
+            "tick_interval_seconds": self.tick_interval,
+            "adaptive": self.adaptive,
+            "sensors": len(self._sensors),
+            "ticks": self.ticks,
+            "sensor_reads": self.sensor_reads,
+            "sensor_reads_saved": max(0, uniform_reads - self.sensor_reads),
+            "categories": categories,
+        }
+        if self.adaptive and self._sensors:
+            factors = [sensor.factor for sensor in self._sensors.values()]
+            stats["interval_factor"] = {
+                "min": min(factors),
+                "max": max(factors),
+                "average": round(sum(factors) / len(factors), 3),
+            }
+        return stats
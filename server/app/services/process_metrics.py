@@ -0,0 +1,228 @@
+"""
+Background process and system metrics sampler.
+psutil is sampled off the event loop on a fixed cadence, and a probe task
+measures event-loop lag, so /health and /metrics only read the latest
+PerformanceMetrics instead of measuring anything per request.
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import psutil
+
+from ..core.logging import get_logger
+from ..models.sensor import PerformanceMetrics
+from .scheduling import MonotonicTicker
+
+
+class ProcessMetricsSampler:
+    """
+    Keeps rolling process/system metrics and an up-to-date PerformanceMetrics.
+    Application metrics are read from whichever services were given.
+    """
+
+    def __init__(
+        self,
+        sample_interval: float = 2.0,
+        lag_interval: float = 0.25,
+        window: int = 30,
+        sensor_manager=None,
+        realtime_service=None,
+        websocket_manager=None,
+    ):
+        self.sample_interval = sample_interval
+        self.lag_interval = lag_interval
+        self.sensor_manager = sensor_manager
+        self.realtime_service = realtime_service
+        self.websocket_manager = websocket_manager
+        self.logger = get_logger("process_metrics")
+
+        self._process = psutil.Process(os.getpid())
+        self.metrics = PerformanceMetrics()
+        self.memory_vms_mb = 0.0
+        self.samples_taken = 0
+        self.last_sample_duration_ms = 0.0
+
+        # Rolling windows
+        self._cpu_window: Deque[float] = deque(maxlen=window)
+        self._loop_lag_window: Deque[float] = deque(
+            maxlen=max(1, int(window * sample_interval / lag_interval))
+        )
+
+        # Counters carried between samples for rates
+        self._last_sample_time: Optional[float] = None
+        self._last_net_bytes: Optional[int] = None
+        self._last_published = 0
+
+        self._tasks: list = []
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        # Prime the cpu_percent() counters; their first call always returns 0.0
+        self._process.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None)
+        self._tasks = [
+            asyncio.create_task(self._sample_loop()),
+            asyncio.create_task(self._loop_lag_probe()),
+        ]
+        self.logger.info(
+            f"Process metrics sampler started (every {self.sample_interval}s)"
+        )
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _sample_loop(self) -> None:
+        ticker = MonotonicTicker(self.sample_interval)
+        while True:
+            try:
+                await self.sample()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Process metrics sampling failed: {e}")
+            await ticker.wait()
+
+    async def _loop_lag_probe(self) -> None:
+        """Measure how late the loop wakes up from a short sleep."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            lag_ms = max(0.0, (loop.time() - expected) * 1000)
+            self._loop_lag_window.append(lag_ms)
+
+    def _read_process(self) -> Dict[str, Any]:
+        """All psutil reads for one sample; runs in a worker thread."""
+        process = self._process
+        with process.oneshot():
+            memory = process.memory_info()
+            if hasattr(process, "num_fds"):
+                open_files = process.num_fds()
+            else:  # Windows
+                open_files = process.num_handles()
+            reading = {
+                "process_cpu": process.cpu_percent(interval=None),
+                "rss": memory.rss,
+                "vms": memory.vms,
+                "open_files": open_files,
+                "threads": process.num_threads(),
+            }
+        reading["system_cpu"] = psutil.cpu_percent(interval=None)
+        try:
+            net = psutil.net_io_counters()
+            reading["net_bytes"] = net.bytes_sent + net.bytes_recv if net else None
+        except OSError:
+            reading["net_bytes"] = None
+        return reading
+
+    async def sample(self) -> PerformanceMetrics:
+        """Take one sample and publish a new PerformanceMetrics."""
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        reading = await loop.run_in_executor(None, self._read_process)
+
+        now = time.monotonic()
+        elapsed = (
+            now - self._last_sample_time if self._last_sample_time is not None else 0.0
+        )
+        self._last_sample_time = now
+
+        network_usage = 0.0
+        net_bytes = reading["net_bytes"]
+        if net_bytes is not None and self._last_net_bytes is not None and elapsed > 0:
+            network_usage = max(0.0, (net_bytes - self._last_net_bytes) / elapsed)
+        self._last_net_bytes = net_bytes
+
+        self._cpu_window.append(reading["process_cpu"])
+        lag = self._loop_lag_window
+
+        metrics = PerformanceMetrics(
+            cpu_usage=min(100.0, reading["system_cpu"]),
+            memory_usage=reading["rss"] / (1024 * 1024),
+            network_usage=network_usage,
+            process_cpu_usage=reading["process_cpu"],
+            open_files=reading["open_files"],
+            thread_count=reading["threads"],
+            event_loop_lag=lag[-1] if lag else 0.0,
+            max_event_loop_lag=max(lag) if lag else 0.0,
+            **self._application_metrics(elapsed),
+        )
+        self.memory_vms_mb = reading["vms"] / (1024 * 1024)
+        self.metrics = metrics
+        self.samples_taken += 1
+        self.last_sample_duration_ms = (time.perf_counter() - started) * 1000
+        return metrics
+
+    def _application_metrics(self, elapsed: float) -> Dict[str, Any]:
+        """PerformanceMetrics fields that come from the running services."""
+        fields: Dict[str, Any] = {}
+
+        if self.sensor_manager is not None:
+            statistics = self.sensor_manager.get_source_statistics().values()
+            attempts = failures = 0
+            stale = 0
+            for stats in statistics:
+                failures += stats.error_count + stats.timeout_count
+                attempts += stats.update_count + stats.error_count + stats.timeout_count
+                stale += stats.stale
+            fields["sensor_count"] = sum(stats.total_sensors for stats in statistics)
+            fields["active_sensors"] = sum(stats.active_sensors for stats in statistics)
+            fields["error_rate"] = failures / attempts * 100 if attempts else 0.0
+            if statistics:
+                fields["data_quality_score"] = 100.0 * (1 - stale / len(statistics))
+
+            published = self.sensor_manager.snapshots.published
+            if elapsed > 0:
+                fields["update_rate"] = (published - self._last_published) / elapsed
+            self._last_published = published
+
+        if self.realtime_service is not None:
+            fields["update_latency"] = self.realtime_service.average_latency_ms
+
+        if self.websocket_manager is not None:
+            stats = self.websocket_manager.get_connection_stats()
+            fields["queue_size"] = sum(
+                connection.get("queue_depth", 0) for connection in stats["connections"]
+            )
+            fields["dropped_updates"] = stats["total_dropped_frames"]
+
+        return fields
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Latest metrics plus rolling-window aggregates."""
+        cpu = self._cpu_window
+        lag = self._loop_lag_window
+        return {
+            "metrics": self.metrics.model_dump(mode="json"),
+            "memory_vms_mb": round(self.memory_vms_mb, 3),
+            "rolling": {
+                "process_cpu_percent": {
+                    "average": round(sum(cpu) / len(cpu), 2) if cpu else 0.0,
+                    "max": max(cpu) if cpu else 0.0,
+                    "samples": len(cpu),
+                },
+                "event_loop_lag_ms": {
+                    "average": round(sum(lag) / len(lag), 3) if lag else 0.0,
+                    "max": round(max(lag), 3) if lag else 0.0,
+                    "samples": len(lag),
+                },
+            },
+            "sampler": {
+                "sample_interval_seconds": self.sample_interval,
+                "lag_interval_seconds": self.lag_interval,
+                "samples_taken": self.samples_taken,
+                "last_sample_duration_ms": round(self.last_sample_duration_ms, 3),
+            },
+        }
@@ -0,0 +1,238 @@
+"""
+Watchdog for hung sensor providers.
+A provider counts as hung when one of its reads has been in flight, or every
+read has failed, for longer than the hard deadline; a native call that never
+returns (e.g. an LHM Update() stuck in a driver) shows up as exactly that.
+The watchdog then marks the provider stale, restarts it with exponential
+backoff between attempts, and reports each step as a status event.
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..core.logging import get_logger
+
+if TYPE_CHECKING:
+    from ..sensors.base import BaseSensor
+    from .sensor_manager import SensorManager
+
+logger = get_logger("provider_watchdog")
+
+
+class _ProviderHealth:
+    __slots__ = (
+        "read_started",
+        "failing_since",
+        "attempt",
+        "next_attempt",
+        "restarting",
+        "restarts",
+        "failed_restarts",
+        "reported",
+    )
+
+    def __init__(self):
+        self.read_started: Optional[float] = None  # Monotonic start of the read in flight
+        self.failing_since: Optional[float] = None  # First failure since the last success
+        self.attempt = 0  # Restarts since the provider last produced data
+        self.next_attempt = 0.0
+        self.restarting = False
+        self.restarts = 0
+        self.failed_restarts = 0
+        self.reported = False  # A status event went out and recovery is pending
+
+    def hung_for(self, now: float) -> float:
+        hung = 0.0
+        if self.read_started is not None:
+            hung = now - self.read_started
+        if self.failing_since is not None:
+            hung = max(hung, now - self.failing_since)
+        return hung
+
+
+class ProviderWatchdog:
+    """Restarts providers of a SensorManager that stop producing data."""
+
+    def __init__(
+        self,
+        manager: "SensorManager",
+        deadline: float = 15.0,
+        backoff: float = 5.0,
+        max_backoff: float = 300.0,
+        restart_timeout: float = 30.0,
+    ):
+        self.manager = manager
+        self.deadline = deadline
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.restart_timeout = restart_timeout
+        self.check_interval = max(0.05, min(1.0, deadline / 4))
+        self._health: Dict[str, _ProviderHealth] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._restarts: Dict[str, asyncio.Task] = {}
+
+    @classmethod
+    def from_settings(cls, manager: "SensorManager", settings) -> "ProviderWatchdog":
+        return cls(
+            manager,
+            deadline=getattr(settings, "sensor_watchdog_deadline_seconds", 15.0),
+            backoff=getattr(settings, "sensor_watchdog_backoff_seconds", 5.0),
+            max_backoff=getattr(settings, "sensor_watchdog_max_backoff_seconds", 300.0),
+        )
+
+    def _state(self, source_id: str) -> _ProviderHealth:
+        health = self._health.get(source_id)
+        if health is None:
+            health = self._health[source_id] = _ProviderHealth()
+        return health
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        tasks = [task for task in (self._task, *self._restarts.values()) if task]
+        self._task = None
+        self._restarts.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    # -------------------------------------------------------------
+    # Read tracking, called by the SensorManager around every read
+    # -------------------------------------------------------------
+
+    def read_started(self, source_id: str) -> None:
+        self._state(source_id).read_started = time.monotonic()
+
+    async def read_finished(self, source_id: str, ok: bool) -> None:
+        health = self._state(source_id)
+        health.read_started = None
+        if not ok:
+            if health.failing_since is None:
+                health.failing_since = time.monotonic()
+            return
+        health.failing_since = None
+        health.attempt = 0
+        health.next_attempt = 0.0
+        if health.reported:
+            health.reported = False
+            await self.manager.emit_status({"source_id": source_id, "status": "recovered"})
+
+    # -------------------------------------------------------------
+    # Detection and restart
+    # -------------------------------------------------------------
+
+    def hung_providers(self, now: float) -> List[str]:
+        """Providers past the deadline whose backoff allows a restart now."""
+        return [
+            source_id
+            for source_id, health in self._health.items()
+            if not health.restarting
+            and now >= health.next_attempt
+            and health.hung_for(now) >= self.deadline
+        ]
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                for source_id in self.hung_providers(time.monotonic()):
+                    provider = self.manager.get_provider(source_id)
+                    if provider is not None:
+                        self._restarts[source_id] = asyncio.create_task(
+                            self.restart(provider)
+                        )
+            except Exception as e:
+                logger.error(f"Provider watchdog check failed: {e}", exc_info=True)
+
+    async def restart(self, provider: "BaseSensor") -> bool:
+        """Mark a provider stale and restart it; schedules the next attempt."""
+        source_id = provider.source_id
+        health = self._state(source_id)
+        health.restarting = True
+        health.attempt += 1
+        now = time.monotonic()
+        hung_for = health.hung_for(now)
+        reason = f"No data for {hung_for:.1f}s (deadline {self.deadline}s)"
+        logger.warning(
+            f"{provider.display_name} looks hung: {reason}; restart attempt {health.attempt}"
+        )
+        self.manager.mark_source_stale(source_id, reason)
+        health.reported = True
+        await self.manager.emit_status(
+            {
+                "source_id": source_id,
+                "status": "restarting",
+                "attempt": health.attempt,
+                "reason": reason,
+            }
+        )
+
+        error: Optional[str] = None
+        try:
+            ok = await asyncio.wait_for(
+                self.manager.restart_provider(provider), self.restart_timeout
+            )
+        except asyncio.TimeoutError:
+            ok, error = False, f"Restart timed out after {self.restart_timeout}s"
+        except Exception as e:
+            ok, error = False, str(e)
+        finally:
+            health.restarting = False
+            self._restarts.pop(source_id, None)
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (health.attempt - 1))
+        health.next_attempt = time.monotonic() + delay
+        health.read_started = None
+        if ok:
+            # Healthy until a read hangs or fails again, which re-arms detection;
+            # with no reads (idle or paused polling) there is nothing to judge
+            health.failing_since = None
+            health.restarts += 1
+            logger.info(f"{provider.display_name} restarted")
+        else:
+            # Still broken: due again as soon as the backoff allows
+            health.failing_since = now - hung_for
+            health.failed_restarts += 1
+            logger.error(
+                f"Restarting {provider.display_name} failed: {error or 'unavailable'}; "
+                f"next attempt in {delay:.0f}s"
+            )
+        event: Dict[str, Any] = {
+            "source_id": source_id,
+            "status": "restarted" if ok else "restart_failed",
+            "attempt": health.attempt,
+            "next_retry_seconds": delay,
+        }
+        if error:
+            event["error"] = error
+        await self.manager.emit_status(event)
+        return ok
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "deadline_seconds": self.deadline,
+            "running": self.is_running,
+            "providers": {
+                source_id: {
+                    "hung_for_seconds": round(health.hung_for(now), 3),
+                    "restarting": health.restarting,
+                    "attempt": health.attempt,
+                    "next_attempt_in_seconds": round(max(0.0, health.next_attempt - now), 3),
+                    "restarts": health.restarts,
+                    "failed_restarts": health.failed_restarts,
+                }
+                for source_id, health in self._health.items()
+            },
+        }
@@ -1,59 +1,98 @@
 """
 Real-time sensor data broadcasting service.
-Manages periodic sensor data collection and WebSocket broadcasting.
+Broadcasts each snapshot published by the SensorManager to WebSocket clients.
 """
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 import json
 from starlette.websockets import WebSocket
-from ..models.websocket import WebSocketMessage
 
 from ..core.config import AppSettings
 from ..core.logging import get_logger
 from ..websocket_manager import WebSocketManager
 from .sensor_manager import SensorManager
+from .binary_codec import BinaryEncoder
+from .columnar_encoder import ColumnarEncoder
+from .delta_encoder import DeltaEncoder
+from .frame_encoder import EncodedSnapshot, SnapshotEncoder
+from .replay_buffer import ReplayBuffer
+from .snapshot_channel import SensorSnapshot, SnapshotSubscription
+from .subscriptions import Subscription
 
 
 class RealTimeService:
     """Service for real-time sensor data broadcasting via WebSocket."""
 
     def __init__(
-        self, sensor_manager: SensorManager, websocket_manager: WebSocketManager
+        self,
+        sensor_manager: SensorManager,
+        websocket_manager: WebSocketManager,
+        snapshot_encoder: Optional[SnapshotEncoder] = None,
     ):
         self.sensor_manager = sensor_manager
         self.websocket_manager = websocket_manager
+        self.snapshot_encoder = snapshot_encoder or SnapshotEncoder()
+        # One delta stream per subscription, since each has its own state
+        self.keyframe_interval = 30
+        self._delta_encoders: Dict[Subscription, DeltaEncoder] = {}
+        self._binary_encoders: Dict[Subscription, BinaryEncoder] = {}
+        self._columnar_encoders: Dict[Subscription, ColumnarEncoder] = {}
+        self.replay_buffer = ReplayBuffer()
         self.logger = get_logger("realtime_service")
 
-        # Configuration
-        self.broadcast_interval = 2.0  # seconds
+        # Broadcasting is driven by snapshots published by the collector
         self.is_running = False
         self.broadcast_task: Optional[asyncio.Task] = None
+        self._subscription: Optional[SnapshotSubscription] = None
 
         # Statistics
         self.broadcasts_sent = 0
+        self.snapshots_skipped = 0
+        self.initial_snapshots_sent = 0
+        self.initial_snapshots_missed = 0
+        self.resumes_succeeded = 0
+        self.resumes_failed = 0
+        self.frames_replayed = 0
         self.last_broadcast_time: Optional[datetime] = None
+        self.last_broadcast_version = 0
         self.errors_count = 0
 
+        # Sensor-to-wire latency: collection start until the frame is sent (ms)
+        self.last_latency_ms = 0.0
+        self.average_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+
     async def start(self, app_settings: AppSettings) -> None:
         """Start the real-time broadcasting service."""
         if self.is_running:
             self.logger.warning("RealTimeService is already running")
             return
 
-        # Update configuration from settings
-        self.broadcast_interval = getattr(
-            app_settings, "realtime_broadcast_interval", 2.0
+        self.keyframe_interval = getattr(app_settings, "ws_keyframe_interval", 30)
+        self.replay_buffer = ReplayBuffer(
+            getattr(app_settings, "ws_replay_buffer_size", 120)
         )
 
-        self.logger.info(
-            f"Starting RealTimeService with {self.broadcast_interval}s interval"
-        )
+        self.logger.info("Starting RealTimeService (broadcasting on new snapshots)")
         self.is_running = True
 
-        # Start the broadcasting task
+        # Subscribe before starting the task so no snapshot is missed
+        self._subscription = self.sensor_manager.snapshots.subscribe()
+        # Collection cadence follows the number of connected clients
+        self.websocket_manager.connection_listeners.append(
+            self.sensor_manager.set_consumer_count
+        )
+        # ...and what is polled follows what those clients subscribe to
+        self.websocket_manager.connection_listeners.append(self._sync_subscriptions)
+        # Provider restarts and recoveries are pushed to every client
+        self.sensor_manager.status_listeners.append(self._broadcast_status)
+        self.sensor_manager.set_consumer_count(
+            len(self.websocket_manager.active_connections)
+        )
+        self._sync_subscriptions()
         self.broadcast_task = asyncio.create_task(self._broadcast_loop())
 
         self.logger.info("RealTimeService started successfully")
@@ -65,6 +104,15 @@ class RealTimeService:
 
         self.logger.info("Stopping RealTimeService...")
         self.is_running = False
+        if self.sensor_manager.set_consumer_count in self.websocket_manager.connection_listeners:
+            self.websocket_manager.connection_listeners.remove(
+                self.sensor_manager.set_consumer_count
+            )
+        if self._broadcast_status in self.sensor_manager.status_listeners:
+            self.sensor_manager.status_listeners.remove(self._broadcast_status)
+        if self._sync_subscriptions in self.websocket_manager.connection_listeners:
+            self.websocket_manager.connection_listeners.remove(self._sync_subscriptions)
+        self.sensor_manager.set_subscriptions([])
 
         if self.broadcast_task:
             self.broadcast_task.cancel()
@@ -74,95 +122,375 @@ class RealTimeService:
                 pass
             self.broadcast_task = None
 
+        if self._subscription:
+            self._subscription.close()
+            self._subscription = None
+
         self.logger.info("RealTimeService stopped")
 
+    async def _broadcast_status(self, event: Dict[str, Any]) -> None:
+        """Send a provider status event to every client as a status_update."""
+        await self.websocket_manager.broadcast_system_message("status_update", event)
+
+    def _sync_subscriptions(self, count: Optional[int] = None) -> None:
+        """Tell the sensor manager which sensors connected clients subscribe to."""
+        manager = self.websocket_manager
+        connected = set(manager.active_connections)
+        self.sensor_manager.set_subscriptions(
+            metadata["subscription"]
+            for websocket, metadata in manager.connection_metadata.items()
+            if websocket in connected
+        )
+
     async def _broadcast_loop(self) -> None:
-        """Main broadcasting loop."""
+        """Broadcast exactly once per snapshot published by the collector."""
         self.logger.info("Starting sensor data broadcasting loop")
 
         while self.is_running:
+            snapshot = await self._subscription.get()
+            # Buffered even when nobody is connected, so resumes can cover it
+            self.replay_buffer.record(snapshot)
+
+            # No clients connected; nothing to send for this snapshot
+            if not self.websocket_manager.active_connections:
+                self.snapshots_skipped += 1
+                continue
+
             try:
-                # Check if there are any connected WebSocket clients
-                if not self.websocket_manager.active_connections:
-                    # No clients connected, wait and continue
-                    await asyncio.sleep(self.broadcast_interval)
-                    continue
-
-                # Get current sensor data from all sources
-                sensor_data = await self.sensor_manager.get_all_sensor_data()
-
-                if sensor_data:
-                    # Convert SensorReading objects to dictionaries for JSON serialization
-                    serializable_data = {}
-                    for source_id, readings in sensor_data.items():
-                        serializable_data[source_id] = [
-                            reading.model_dump(mode="json")
-                            if hasattr(reading, "model_dump")
-                            else reading.dict()
-                            for reading in readings
-                        ]
-
-                    # Prepare the broadcast message
-                    broadcast_data = {
-                        "sources": serializable_data,
-                        "timestamp": datetime.now().isoformat(),
-                        "total_sensors": sum(
-                            len(readings) for readings in sensor_data.values()
-                        ),
-                        "active_sources": len(
-                            [
-                                source
-                                for source, readings in sensor_data.items()
-                                if readings
-                            ]
-                        ),
-                    }
-
-                    # Broadcast to all connected clients
-                    await self.websocket_manager.broadcast_sensor_data(broadcast_data)
-
-                    # Update statistics
-                    self.broadcasts_sent += 1
-                    self.last_broadcast_time = datetime.now()
-
-                    if (
-                        self.broadcasts_sent % 30 == 0
-                    ):  # Log every 30 broadcasts (1 minute at 2s interval)
+                if snapshot.readings:
+                    await self._broadcast_snapshot(snapshot)
+
+                    if self.broadcasts_sent % 30 == 0:
                         self.logger.debug(
-                            f"Broadcast #{self.broadcasts_sent}: {broadcast_data['total_sensors']} sensors "
-                            f"from {broadcast_data['active_sources']} sources to "
-                            f"{len(self.websocket_manager.active_connections)} clients"
+                            f"Broadcast #{self.broadcasts_sent}: {snapshot.total_sensors} sensors "
+                            f"from {snapshot.active_sources} sources to "
+                            f"{len(self.websocket_manager.active_connections)} clients, "
+                            f"latency {self.last_latency_ms:.1f}ms"
                         )
                 else:
-                    # No sensor data available
-                    if self.broadcasts_sent % 15 == 0:  # Log every 15 attempts
-                        self.logger.debug("No sensor data available for broadcasting")
+                    self.logger.debug("No sensor data available for broadcasting")
 
             except Exception as e:
                 self.errors_count += 1
                 self.logger.error(f"Error in broadcast loop: {e}", exc_info=True)
 
-                # If too many errors, increase the interval to avoid spam
-                if self.errors_count > 10:
-                    self.logger.warning(
-                        "Too many broadcast errors, increasing interval"
-                    )
-                    await asyncio.sleep(self.broadcast_interval * 2)
-                    self.errors_count = 0  # Reset error count
+    async def _broadcast_snapshot(self, snapshot: SensorSnapshot) -> None:
+        """Send one snapshot to all clients and record its sensor-to-wire latency."""
+        await self._send_snapshot(snapshot)
+
+        self.broadcasts_sent += 1
+        self.last_broadcast_time = datetime.now()
+        self.last_broadcast_version = snapshot.version
+
+        latency_ms = snapshot.age_ms()
+        self.last_latency_ms = latency_ms
+        self.average_latency_ms += (
+            latency_ms - self.average_latency_ms
+        ) / self.broadcasts_sent
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+
+    async def _send_snapshot(self, snapshot: SensorSnapshot) -> None:
+        """
+        Send a snapshot to every client in the wire format and subscription it
+        asked for, encoding each distinct frame once per group of clients.
+        """
+        groups = self.websocket_manager.connection_groups()
+
+        sends = []
+        active_streams = {"delta": set(), "binary": set(), "columnar": set()}
+        for (frame_format, subscription), clients in groups.items():
+            if subscription.is_empty:
+                continue
+            if frame_format in active_streams:
+                active_streams[frame_format].add(subscription)
+            sends.extend(self._group_sends(frame_format, subscription, snapshot, clients))
+
+        # Forget stream state for subscriptions nobody holds any more
+        for frame_format, encoders in (
+            ("delta", self._delta_encoders),
+            ("binary", self._binary_encoders),
+            ("columnar", self._columnar_encoders),
+        ):
+            for subscription in list(encoders):
+                if subscription not in active_streams[frame_format]:
+                    del encoders[subscription]
+
+        if sends:
+            await asyncio.gather(*sends)
+
+    def _group_sends(
+        self,
+        frame_format: str,
+        subscription: Subscription,
+        snapshot: SensorSnapshot,
+        clients: List[WebSocket],
+    ) -> list:
+        """Sends of one snapshot to a group sharing a format and subscription."""
+        view = subscription.apply(snapshot)
+        if frame_format in ("binary", "columnar"):
+            return self._table_stream_sends(frame_format, view, subscription, clients)
+
+        encoded = self.snapshot_encoder.encode(view, variant=subscription)
+        if frame_format == "delta":
+            return self._delta_sends(view, encoded, subscription, clients)
+        return [self.websocket_manager.broadcast(encoded.sensor_data_text, clients)]
+
+    async def send_initial_state(
+        self,
+        websocket: WebSocket,
+        resume_from: Optional[int] = None,
+        stream_id: Optional[str] = None,
+    ) -> None:
+        """
+        Give a newly connected client the sensor definition catalog and then
+        either the frames it missed since `resume_from` or the latest published
+        snapshot in its wire format. Everything comes from cached or buffered
+        snapshots; no collection is triggered.
+        """
+        catalog = self.snapshot_encoder.encode_catalog(
+            self.sensor_manager.get_sensor_definition_map(),
+            self.sensor_manager.definitions_version,
+        )
+        await self.websocket_manager.send_personal_message(catalog, websocket)
+
+        metadata = self.websocket_manager.connection_metadata.get(websocket)
+        if metadata is None:
+            return
+        if resume_from is not None and await self._resume(
+            websocket, metadata, resume_from, stream_id
+        ):
+            return
+
+        snapshot = self.sensor_manager.snapshots.latest
+        if snapshot is None:
+            self.initial_snapshots_missed += 1
+            return
+        subscription = metadata["subscription"]
+        if not subscription.is_empty:
+            sends = self._group_sends(metadata["format"], subscription, snapshot, [websocket])
+            await asyncio.gather(*sends)
+        self.initial_snapshots_sent += 1
+
+    async def _resume(
+        self,
+        websocket: WebSocket,
+        metadata: Dict[str, Any],
+        sequence: int,
+        stream_id: Optional[str],
+    ) -> bool:
+        """
+        Replay the buffered frames after `sequence`. Returns False, after
+        telling the client, when the gap cannot be replayed and the client
+        must start over from a keyframe.
+        """
+        current_stream = self.sensor_manager.snapshots.stream_id
+        missed = None
+        if stream_id in (None, current_stream):
+            missed = self.replay_buffer.since(sequence)
+
+        messages = None
+        if missed is not None:
+            messages = self._replay_messages(metadata, sequence, missed)
+
+        if messages is None:
+            self.resumes_failed += 1
+            await self._reply(
+                websocket,
+                "resume",
+                {"resumed": False, "from": sequence, "stream_id": current_stream},
+            )
+            return False
 
-            # Wait for the next broadcast interval
-            await asyncio.sleep(self.broadcast_interval)
+        reply = {
+            "resumed": True,
+            "from": sequence,
+            "replayed": len(missed),
+            "stream_id": current_stream,
+        }
+        if metadata["format"] == "delta" and not metadata["subscription"].is_empty:
+            # Indices are per subscription stream, and a reconnecting client
+            # may have been on another one: name the indices the deltas use
+            reply["sensor_index"] = self._delta_encoder(metadata["subscription"]).index.ids
+        await self._reply(websocket, "resume", reply)
+        # Control messages: never dropped, and written before any live frame
+        for message in messages:
+            await self.websocket_manager.send_personal_message(message, websocket)
+        self.resumes_succeeded += 1
+        self.frames_replayed += len(missed)
+        return True
+
+    def _replay_messages(
+        self, metadata: Dict[str, Any], sequence: int, missed: List[SensorSnapshot]
+    ) -> Optional[list]:
+        """Messages replaying `missed` in the client's format and subscription."""
+        subscription: Subscription = metadata["subscription"]
+        if subscription.is_empty:
+            return []
+        frame_format = metadata["format"]
+        views = [subscription.apply(snapshot) for snapshot in missed]
+
+        if frame_format == "delta":
+            delta_encoder = self._delta_encoder(subscription)
+            base = subscription.apply(self.replay_buffer.get(sequence))
+            frames = delta_encoder.replay(base, views)
+            if frames is None:
+                return None
+            # Live deltas only chain on if the stream is where the replay ended
+            last_sequence = views[-1].version if views else sequence
+            metadata["needs_keyframe"] = delta_encoder.last_sequence != last_sequence
+            return [frame.text for frame in frames]
+
+        if frame_format == "binary":
+            binary_encoder = self._binary_encoder(subscription)
+            payloads = [binary_encoder.encode(view).payload for view in views]
+            metadata["table_version"] = binary_encoder.index.version
+            metadata["needs_keyframe"] = False
+            return [binary_encoder.index_message(), *payloads]
+
+        if frame_format == "columnar":
+            columnar_encoder = self._columnar_encoder(subscription)
+            texts = [columnar_encoder.encode(view).text for view in views]
+            metadata["table_version"] = columnar_encoder.dictionary_version
+            metadata["needs_keyframe"] = False
+            return [columnar_encoder.dictionary_message(), *texts]
+
+        return [
+            self.snapshot_encoder.encode(view, variant=subscription).sensor_data_text
+            for view in views
+        ]
+
+    def _delta_encoder(self, subscription: Subscription) -> DeltaEncoder:
+        encoder = self._delta_encoders.get(subscription)
+        if encoder is None:
+            encoder = DeltaEncoder(keyframe_interval=self.keyframe_interval)
+            self._delta_encoders[subscription] = encoder
+        return encoder
+
+    def _binary_encoder(self, subscription: Subscription) -> BinaryEncoder:
+        encoder = self._binary_encoders.get(subscription)
+        if encoder is None:
+            encoder = BinaryEncoder()
+            self._binary_encoders[subscription] = encoder
+        return encoder
+
+    def _columnar_encoder(self, subscription: Subscription) -> ColumnarEncoder:
+        encoder = self._columnar_encoders.get(subscription)
+        if encoder is None:
+            encoder = ColumnarEncoder(self.sensor_manager.get_sensor_definition_map())
+            self._columnar_encoders[subscription] = encoder
+        return encoder
+
+    def _delta_sends(
+        self,
+        view: SensorSnapshot,
+        encoded: EncodedSnapshot,
+        subscription: Subscription,
+        clients: List[WebSocket],
+    ) -> list:
+        """Sends of the next delta-stream frame for one subscription group."""
+        delta_encoder = self._delta_encoder(subscription)
+        frame = delta_encoder.encode(view, encoded)
+        metadata = self.websocket_manager.connection_metadata
+        catching_up = [ws for ws in clients if metadata.get(ws, {}).get("needs_keyframe")]
+        for ws in catching_up:
+            metadata[ws]["needs_keyframe"] = False
+
+        if frame.keyframe or not catching_up:
+            return [self.websocket_manager.broadcast(frame.text, clients)]
+
+        keyframe = delta_encoder.keyframe(view, encoded)
+        in_sync = [ws for ws in clients if ws not in catching_up]
+        return [
+            self.websocket_manager.broadcast(keyframe.text, catching_up),
+            self.websocket_manager.broadcast(frame.text, in_sync),
+        ]
+
+    def _table_stream_sends(
+        self,
+        frame_format: str,
+        view: SensorSnapshot,
+        subscription: Subscription,
+        clients: List[WebSocket],
+    ) -> list:
+        """
+        Sends of the next binary or columnar frame. Both formats rely on a
+        table sent once per session (the binary sensor index or the columnar
+        sensor dictionary), which precedes the frame for clients lacking it.
+        """
+        if frame_format == "binary":
+            binary_encoder = self._binary_encoder(subscription)
+            frame = binary_encoder.encode(view)
+            message, table_version = frame.payload, frame.index_version
+            table_message = binary_encoder.index_message
+        else:
+            columnar_encoder = self._columnar_encoder(subscription)
+            frame = columnar_encoder.encode(view)
+            message, table_version = frame.text, frame.dictionary_version
+            table_message = columnar_encoder.dictionary_message
+
+        metadata = self.websocket_manager.connection_metadata
+        needs_table = []
+        for ws in clients:
+            client = metadata.get(ws)
+            if client is None:
+                continue
+            if client.get("needs_keyframe") or client.get("table_version") != table_version:
+                client["needs_keyframe"] = False
+                client["table_version"] = table_version
+                needs_table.append(ws)
+
+        sends = []
+        if needs_table:
+            # Control messages are written before queued frames and never dropped
+            sends.append(
+                self.websocket_manager.broadcast(table_message(), needs_table, control=True)
+            )
+        sends.append(self.websocket_manager.broadcast(message, clients))
+        return sends
 
     def get_stats(self) -> Dict[str, Any]:
         """Get real-time service statistics."""
         return {
             "is_running": self.is_running,
-            "broadcast_interval": self.broadcast_interval,
             "broadcasts_sent": self.broadcasts_sent,
+            "snapshots_skipped": self.snapshots_skipped,
+            "snapshots_dropped": self._subscription.dropped
+            if self._subscription
+            else 0,
+            "last_broadcast_version": self.last_broadcast_version,
+            "initial_snapshots_sent": self.initial_snapshots_sent,
+            "initial_snapshots_missed": self.initial_snapshots_missed,
+            "replay": {
+                "buffered": len(self.replay_buffer),
+                "capacity": self.replay_buffer.capacity,
+                "oldest_sequence": self.replay_buffer.oldest_version,
+                "latest_sequence": self.replay_buffer.latest_version,
+                "resumes_succeeded": self.resumes_succeeded,
+                "resumes_failed": self.resumes_failed,
+                "frames_replayed": self.frames_replayed,
+            },
+            "latency_ms": {
+                "last": round(self.last_latency_ms, 3),
+                "average": round(self.average_latency_ms, 3),
+                "max": round(self.max_latency_ms, 3),
+            },
             "last_broadcast_time": self.last_broadcast_time.isoformat()
             if self.last_broadcast_time
             else None,
             "errors_count": self.errors_count,
+            "encoding": self.snapshot_encoder.get_stats(),
+            "delta_streams": [
+                {"subscription": subscription.to_dict(), **encoder.get_stats()}
+                for subscription, encoder in self._delta_encoders.items()
+            ],
+            "binary_streams": [
+                {"subscription": subscription.to_dict(), **encoder.get_stats()}
+                for subscription, encoder in self._binary_encoders.items()
+            ],
+            "columnar_streams": [
+                {"subscription": subscription.to_dict(), **encoder.get_stats()}
+                for subscription, encoder in self._columnar_encoders.items()
+            ],
             "connected_clients": len(self.websocket_manager.active_connections),
             "active_connections": [
                 {
@@ -187,44 +515,15 @@ class RealTimeService:
                 self.logger.info("No WebSocket clients connected for force broadcast")
                 return False
 
-            self.logger.info("Getting sensor data...")
-            sensor_data = await self.sensor_manager.get_all_sensor_data()
-            self.logger.info(f"   Retrieved data from {len(sensor_data)} sources")
-
-            if sensor_data:
-                # Convert SensorReading objects to dictionaries for JSON serialization
-                self.logger.info(
-                    "Converting sensor data to JSON-serializable format..."
-                )
-                serializable_data = {}
-                for source_id, readings in sensor_data.items():
-                    serializable_data[source_id] = [
-                        reading.model_dump(mode="json")
-                        if hasattr(reading, "model_dump")
-                        else reading.dict()
-                        for reading in readings
-                    ]
-                    self.logger.info(
-                        f"   Converted {len(readings)} readings from {source_id}"
-                    )
-
-                total_sensors = sum(len(readings) for readings in sensor_data.values())
-                active_sources = len(
-                    [source for source, readings in sensor_data.items() if readings]
-                )
-
-                broadcast_data = {
-                    "sources": serializable_data,
-                    "timestamp": datetime.now().isoformat(),
-                    "total_sensors": total_sensors,
-                    "active_sources": active_sources,
-                    "forced": True,
-                }
+            snapshot = await self.sensor_manager.get_latest_snapshot()
 
+            if snapshot and snapshot.readings:
                 self.logger.info(
-                    f"Broadcasting {total_sensors} sensors from {active_sources} sources..."
+                    f"Broadcasting {snapshot.total_sensors} sensors from "
+                    f"{snapshot.active_sources} sources..."
                 )
-                await self.websocket_manager.broadcast_sensor_data(broadcast_data)
+                # Same cached frames as the regular broadcast of this version
+                await self._send_snapshot(snapshot)
                 self.logger.info(f"[OK] Force broadcast completed successfully!")
                 return True
             else:
@@ -247,43 +546,55 @@ class RealTimeService:
         Current implementation supports a minimal protocol:
 
         {"event": "force_broadcast"}   -> triggers immediate sensor broadcast
+        {"event": "resync"}            -> next delta frame is replaced by a keyframe
+        {"event": "subscribe", "sensor_ids": [...], "categories": [...],
+         "hardware_types": [...]}      -> receive only the selected sensors
+        {"event": "unsubscribe", ...}  -> drop selectors; {"all": true} for everything
         Any other message will be acknowledged back to the sender.
         """
         try:
             payload = json.loads(message_text)
             event = payload.get("event")
 
-            if event == "force_broadcast":
+            if event in ("subscribe", "unsubscribe"):
+                try:
+                    subscription = Subscription.from_command(
+                        self.websocket_manager.get_subscription(websocket),
+                        payload,
+                        subscribe=event == "subscribe",
+                    )
+                except ValueError as e:
+                    await self._reply(websocket, "error", {"message": str(e)})
+                    return
+                self.websocket_manager.set_subscription(websocket, subscription)
+                self._sync_subscriptions()
+                await self._reply(websocket, f"{event}_ack", subscription.to_dict())
+            elif event == "resync":
+                self.websocket_manager.request_keyframe(websocket)
+                await self._reply(websocket, "resync_ack", {"success": True})
+            elif event == "force_broadcast":
                 success = await self.force_broadcast()
-                await self.websocket_manager.send_to_client(
-                    websocket,
-                    WebSocketMessage(
-                        event="force_broadcast_ack",
-                        data={"success": success},
-                    ),
-                )
+                await self._reply(websocket, "force_broadcast_ack", {"success": success})
             else:
                 # Generic echo/ack for unsupported events
-                await self.websocket_manager.send_to_client(
-                    websocket,
-                    WebSocketMessage(
-                        event="ack",
-                        data={"received": True, "echo": payload},
-                    ),
-                )
+                await self._reply(websocket, "ack", {"received": True, "echo": payload})
 
         except json.JSONDecodeError:
-            # Non-JSON message: just echo raw text
-            await self.websocket_manager.send_to_client(
-                websocket,
-                WebSocketMessage(event="ack", data={"received": True}),
-            )
+            # Non-JSON message: just acknowledge receipt
+            await self._reply(websocket, "ack", {"received": True})
         except Exception as e:
             self.logger.error("Error handling WS message: %s", e, exc_info=True)
-            await self.websocket_manager.send_to_client(
-                websocket,
-                WebSocketMessage(
-                    event="error",
-                    data={"message": "Error processing message"},
-                ),
+            await self._reply(
+                websocket, "error", {"message": "Error processing message"}
             )
+
+    async def _reply(self, websocket: WebSocket, event: str, data: Dict[str, Any]) -> None:
+        """Send a reply to the client that sent a command."""
+        message = {
+            "event": event,
+            "data": data,
+            "timestamp": datetime.now().isoformat(),
+        }
+        await self.websocket_manager.send_personal_message(
+            json.dumps(message), websocket
+        )
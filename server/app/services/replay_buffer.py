@@ -0,0 +1,56 @@
+"""
+Bounded buffer of recently broadcast snapshots for resumable streams.
+A reconnecting client names the last sequence number it received; if that
+snapshot is still buffered, only the snapshots after it are replayed.
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from .snapshot_channel import SensorSnapshot
+
+
+class ReplayBuffer:
+    """The most recent `capacity` snapshots, oldest first, keyed by version."""
+
+    def __init__(self, capacity: int = 120):
+        self.capacity = max(1, capacity)
+        self._snapshots: Deque[SensorSnapshot] = deque()
+        self._by_version: Dict[int, SensorSnapshot] = {}
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    @property
+    def oldest_version(self) -> Optional[int]:
+        return self._snapshots[0].version if self._snapshots else None
+
+    @property
+    def latest_version(self) -> Optional[int]:
+        return self._snapshots[-1].version if self._snapshots else None
+
+    def record(self, snapshot: SensorSnapshot) -> None:
+        """Add a snapshot; versions must arrive in increasing order."""
+        if self._snapshots and snapshot.version <= self._snapshots[-1].version:
+            return
+        self._snapshots.append(snapshot)
+        self._by_version[snapshot.version] = snapshot
+        if len(self._snapshots) > self.capacity:
+            evicted = self._snapshots.popleft()
+            del self._by_version[evicted.version]
+
+    def get(self, version: int) -> Optional[SensorSnapshot]:
+        return self._by_version.get(version)
+
+    def since(self, sequence: int) -> Optional[List[SensorSnapshot]]:
+        """
+        Snapshots newer than `sequence`, or None when the gap cannot be
+        replayed because that snapshot is no longer (or was never) buffered.
+        """
+        if sequence not in self._by_version:
+            return None
+        return [s for s in self._snapshots if s.version > sequence]
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+        self._by_version.clear()
@@ -0,0 +1,63 @@
+"""
+Drift-free periodic scheduling on the event loop's monotonic clock.
+"""
+
+import asyncio
+import math
+from typing import Optional
+
+
+class MonotonicTicker:
+    """
+    Sleeps until fixed deadlines `start + k * interval` rather than for a fixed
+    duration after the work finishes, so the cadence does not drift by the time
+    the work itself takes. Deadlines that were overrun are skipped, not queued.
+    """
+
+    def __init__(self, interval: float):
+        if interval <= 0:
+            raise ValueError("Ticker interval must be positive")
+        self.interval = interval
+        self._next_deadline: Optional[float] = None
+        self.missed_ticks = 0
+
+    def reset(self) -> None:
+        """Restart the schedule from the current time on the next wait()."""
+        self._next_deadline = None
+
+    def set_interval(self, interval: float) -> None:
+        """Change the cadence; takes effect from the next deadline."""
+        if interval <= 0:
+            raise ValueError("Ticker interval must be positive")
+        if interval != self.interval:
+            self.interval = interval
+            self.reset()
+
+    async def wait(self, wakeup: Optional[asyncio.Event] = None) -> bool:
+        """
+        Sleep until the next deadline on the schedule. If `wakeup` is set
+        first, return early (clearing it) and restart the schedule from now.
+        Returns True when woken early.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._next_deadline is None:
+            self._next_deadline = now
+        self._next_deadline += self.interval
+
+        if self._next_deadline < now:
+            missed = math.ceil((now - self._next_deadline) / self.interval)
+            self.missed_ticks += missed
+            self._next_deadline += missed * self.interval
+
+        delay = self._next_deadline - now
+        if wakeup is None:
+            await asyncio.sleep(delay)
+            return False
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            return False
+        wakeup.clear()
+        self.reset()
+        return True
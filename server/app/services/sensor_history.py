@@ -0,0 +1,113 @@
+"""
+Bounded per-sensor reading history.
+Stores recent samples in preallocated float64 ring buffers instead of model lists.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..models.reading import AnyReading, to_model
+from ..models.sensor import SensorReading
+
+
+class SensorRingBuffer:
+    """Fixed-capacity ring buffer of (timestamp, value) samples for one sensor."""
+
+    __slots__ = ("capacity", "_timestamps", "_values", "_head", "_size")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("Ring buffer capacity must be at least 1")
+        self.capacity = capacity
+        # Both columns are allocated once up front and overwritten in place
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._head = 0  # Index of the next slot to write
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Store a sample, overwriting the oldest one when full."""
+        head = self._head
+        self._timestamps[head] = timestamp
+        self._values[head] = value
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def latest(self, limit: int) -> List[Tuple[float, float]]:
+        """Return up to `limit` samples, newest first."""
+        count = min(limit, self._size)
+        samples: List[Tuple[float, float]] = []
+        index = self._head
+        for _ in range(count):
+            index = (index - 1) % self.capacity
+            samples.append((self._timestamps[index], self._values[index]))
+        return samples
+
+    def clear(self) -> None:
+        """Forget all samples without releasing the preallocated storage."""
+        self._head = 0
+        self._size = 0
+
+
+class SensorHistoryStore:
+    """Keeps the last `capacity` samples of every sensor fed to it."""
+
+    def __init__(self, capacity: int = 300):
+        self.capacity = capacity
+        self._buffers: Dict[str, SensorRingBuffer] = {}
+        # Latest reading per sensor; used as a template for the static fields
+        # (name, unit, category...) when history is turned back into models.
+        self._templates: Dict[str, AnyReading] = {}
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def record(self, readings: Iterable[AnyReading]) -> None:
+        """Append one sample per reading to the matching ring buffer."""
+        last_timestamp = epoch = None
+        for reading in readings:
+            buffer = self._buffers.get(reading.sensor_id)
+            if buffer is None:
+                buffer = SensorRingBuffer(self.capacity)
+                self._buffers[reading.sensor_id] = buffer
+            if reading.timestamp is not last_timestamp:
+                # Readings of one poll share a timestamp
+                last_timestamp = reading.timestamp
+                epoch = last_timestamp.timestamp()
+            buffer.append(epoch, float(reading.value))
+            self._templates[reading.sensor_id] = reading
+
+    def get_samples(self, sensor_id: str, limit: int) -> List[Tuple[float, float]]:
+        """Return raw (epoch seconds, value) samples for a sensor, newest first."""
+        buffer = self._buffers.get(sensor_id)
+        if buffer is None:
+            return []
+        return buffer.latest(limit)
+
+    def get_history(self, sensor_id: str, limit: int) -> List[SensorReading]:
+        """Return up to `limit` readings for a sensor, newest first."""
+        template: Optional[AnyReading] = self._templates.get(sensor_id)
+        if template is None:
+            return []
+
+        tzinfo = template.timestamp.tzinfo
+        model = to_model(template)  # Validated once; samples only swap value and time
+        return [
+            model.model_copy(
+                update={
+                    "value": value,
+                    "timestamp": datetime.fromtimestamp(timestamp, tz=tzinfo),
+                }
+            )
+            for timestamp, value in self.get_samples(sensor_id, limit)
+        ]
+
+    def clear(self) -> None:
+        """Drop all buffered history."""
+        self._buffers.clear()
+        self._templates.clear()
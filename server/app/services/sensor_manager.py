@@ -3,12 +3,21 @@ import logging
 import subprocess
 import sys
 import os
-from typing import List, Dict, Any, Optional, Type
+import time
+from typing import Awaitable, Callable, Iterable, List, Dict, Any, Optional, Set, Type
 
 from app.core.config import AppSettings
 from app.core.logging import get_logger
-from app.models.sensor import SensorDefinition, SensorReading
+from app.models.reading import AnyReading
+from app.models.sensor import SensorDefinition, SensorReading, SourceStatistics
 from app.sensors.base import BaseSensor
+from app.services.collector_process import CollectorProcessClient
+from app.services.polling_schedule import PollingSchedule
+from app.services.provider_watchdog import ProviderWatchdog
+from app.services.subscriptions import Subscription
+from app.services.scheduling import MonotonicTicker
+from app.services.sensor_history import SensorHistoryStore
+from app.services.snapshot_channel import SensorSnapshot, SnapshotChannel
 
 # Import only the mock sensor and base sensor - use dynamic imports for hardware sensors
 from app.sensors.mock_sensor import MockSensor
@@ -23,10 +32,58 @@ class SensorManager:
         self.settings: AppSettings = settings
         self.sensor_providers: List[BaseSensor] = []
         self._active_sensors: Dict[str, SensorDefinition] = {}
-        self._sensor_readings: Dict[str, List[SensorReading]] = {}
+        self._sensor_readings: Dict[str, List[AnyReading]] = {}
+        self._history = SensorHistoryStore(
+            capacity=getattr(settings, "sensor_history_size", 300)
+        )
+        self._source_statistics: Dict[str, SourceStatistics] = {}
+        self.snapshots = SnapshotChannel()
+        self._snapshot_version = 0
         self._collector_task: Optional[asyncio.Task] = None
         self._initialized: bool = False
 
+        # Optional per-category cadences; otherwise everything is polled at once
+        self.polling_schedule: Optional[PollingSchedule] = (
+            PollingSchedule.from_settings(settings)
+            if getattr(settings, "sensor_schedule_enabled", False)
+            else None
+        )
+
+        # Demand-driven cadence: normal with consumers, idle without
+        self._consumers = 0
+        self._demand_wakeup = asyncio.Event()
+        self._inflight_collection: Optional[asyncio.Task] = None
+        self._idle_since: Optional[float] = time.monotonic()
+        self._idle_seconds = 0.0
+        self.collections_total = 0
+        self.collections_idle = 0
+        self.warmup_collections = 0
+        self.on_demand_collections = 0
+        self.unchanged_collections = 0
+        self.average_collection_ms = 0.0
+
+        # Collector process owning the providers, in "process" collector mode
+        self._collector_process: Optional[CollectorProcessClient] = None
+
+        # Restarts providers whose reads hang; status events go to listeners
+        self.watchdog: Optional[ProviderWatchdog] = (
+            ProviderWatchdog.from_settings(self, settings)
+            if getattr(settings, "sensor_watchdog_enabled", True)
+            else None
+        )
+        self.status_listeners: List[Callable[[Dict[str, Any]], Awaitable[None]]] = []
+
+        # Sensors some consumer subscribes to; None means every sensor
+        self._subscriptions: List[Subscription] = []
+        self._interest: Optional[Set[str]] = None
+        # Bumped whenever _active_sensors changes, e.g. to re-encode the catalog
+        self.definitions_version = 0
+        # Provider definitions_version as of its last registration, per source
+        self._registered_versions: Dict[str, int] = {}
+        # When every sensor was last read (monotonic); unsubscribed sensors
+        # are only read by full rounds
+        self._full_collection_at: Optional[float] = None
+
     def _test_hardware_monitor_availability(self) -> bool:
         """Test if HardwareMonitor package is fully functional using subprocess isolation."""
         try:
@@ -92,6 +149,18 @@ except Exception as e:
             from app.sensors.hw_sensor import HWSensor
 
             return HWSensor
+        elif sensor_type == "HWiNFOSensor":
+            from app.sensors.hwinfo_sensor import HWiNFOSensor
+
+            return HWiNFOSensor
+        elif sensor_type == "HwmonSensor":
+            from app.sensors.hwmon_sensor import HwmonSensor
+
+            return HwmonSensor
+        elif sensor_type == "ProcfsSensor":
+            from app.sensors.procfs_sensor import ProcfsSensor
+
+            return ProcfsSensor
         elif sensor_type == "MockSensor":
             return MockSensor
         else:
@@ -104,6 +173,11 @@ except Exception as e:
             return
 
         logger.info("Initializing SensorManager...")
+        if getattr(self.settings, "sensor_collector_mode", "inprocess") == "process":
+            if await self._initialize_collector_process():
+                return
+            logger.warning("Falling back to in-process sensor collection.")
+
         logger.info("🔍 Testing hardware sensor availability in an isolated process...")
 
         hw_sensor_available = self._test_hardware_monitor_availability()
@@ -117,6 +191,12 @@ except Exception as e:
             logger.warning("❌ HardwareMonitor is not available.")
             logger.warning("   Using MockSensor only - no real hardware monitoring.")
             sensor_types = ["MockSensor"]
+        if getattr(self.settings, "hwinfo_enabled", False):
+            sensor_types.insert(0, "HWiNFOSensor")
+        if getattr(self.settings, "hwmon_enabled", False):
+            sensor_types.insert(len(sensor_types) - 1, "HwmonSensor")
+        if getattr(self.settings, "procfs_enabled", False):
+            sensor_types.insert(len(sensor_types) - 1, "ProcfsSensor")
 
         logger.info(f"📋 Selected sensor initialization order:")
         for i, sensor_type in enumerate(sensor_types, 1):
@@ -125,7 +205,14 @@ except Exception as e:
         successful_providers = 0
         failed_providers = []
 
+        # A synthetic sensor count asks for MockSensor alongside real hardware
+        force_mock = getattr(self.settings, "mock_sensor_count", 0) > 0
+
         for sensor_type in sensor_types:
+            # MockSensor is otherwise only a fallback for when no hardware sensor loaded
+            if sensor_type == "MockSensor" and successful_providers and not force_mock:
+                logger.info("   🎯 Hardware sensors initialized, skipping MockSensor")
+                break
             logger.info(f"🔄 Attempting to initialize: {sensor_type}")
 
             try:
@@ -146,27 +233,21 @@ except Exception as e:
                 if await provider_instance.is_available():
                     logger.info(f"✅ SUCCESS: {provider_name} is available and working!")
                     self.sensor_providers.append(provider_instance)
+                    self._source_statistics[
+                        provider_instance.source_id
+                    ] = SourceStatistics()
                     successful_providers += 1
 
                     # Store available sensors from this provider
                     definitions = await provider_instance.get_available_sensors()
-                    sensor_count = len(definitions)
                     logger.info(
-                        f"   📊 Found {sensor_count} sensors from {provider_name}"
+                        f"   📊 Found {len(definitions)} sensors from {provider_name}"
                     )
-
+                    self._register_definitions(provider_instance, definitions)
                     for definition in definitions:
-                        self._active_sensors[definition.sensor_id] = definition
                         logger.debug(
                             f"      • {definition.name} ({definition.category})"
                         )
-
-                    # If we successfully loaded a hardware sensor, skip MockSensor
-                    if sensor_type == "HWSensor":
-                        logger.info(
-                            f"   🎯 Successfully initialized hardware sensor, skipping remaining sensors"
-                        )
-                        break
                 else:
                     logger.warning(
                         f"❌ UNAVAILABLE: {provider_name} initialized but is not available"
@@ -204,58 +285,500 @@ except Exception as e:
         else:
             # Start the data collection task
             self._collector_task = asyncio.create_task(self._run_collector_task())
+            if self.watchdog is not None:
+                self.watchdog.start()
             logger.info(f"🚀 SensorManager initialized successfully!")
 
         logger.info("=" * 60)
         self._initialized = True
 
+    async def _initialize_collector_process(self) -> bool:
+        """Start the collector process and register a proxy per source it runs."""
+        from app.sensors.remote_sensor import RemoteSensor
+
+        logger.info("🔀 Starting the out-of-process sensor collector...")
+        client = CollectorProcessClient(self.settings)
+        client.consumers = self._consumers
+        if not await client.start():
+            return False
+        self._collector_process = client
+
+        for source in client.sources:
+            provider = RemoteSensor(client, source["source_id"], source["display_name"])
+            await provider.initialize(self.settings)
+            definitions = await provider.get_available_sensors()
+            self.sensor_providers.append(provider)
+            self._source_statistics[provider.source_id] = SourceStatistics()
+            self._register_definitions(provider, definitions)
+            logger.info(
+                f"   📊 {provider.display_name}: {len(definitions)} sensors via collector process"
+            )
+
+        self._collector_task = asyncio.create_task(self._run_collector_task())
+        if self.watchdog is not None:
+            self.watchdog.start()
+        self._initialized = True
+        logger.info("🚀 SensorManager initialized with the collector process!")
+        return True
+
+    @property
+    def poll_interval(self) -> float:
+        return getattr(self.settings, "sensor_poll_interval_seconds", 5)
+
+    @property
+    def idle_poll_interval(self) -> float:
+        """Cadence with no consumers; 0 or less pauses polling entirely."""
+        return getattr(self.settings, "sensor_idle_poll_interval_seconds", 60.0)
+
+    @property
+    def is_idle(self) -> bool:
+        return self._consumers == 0
+
+    def set_consumer_count(self, count: int) -> None:
+        """
+        Update the number of live consumers (connected clients). The first
+        consumer triggers an immediate warm-up collection; with none left the
+        collector drops to the idle cadence.
+        """
+        previous, self._consumers = self._consumers, max(0, count)
+        if self._collector_process is not None:
+            self._collector_process.set_consumer_count(self._consumers)
+        now = time.monotonic()
+        if previous == 0 and self._consumers > 0:
+            if self._idle_since is not None:
+                self._idle_seconds += now - self._idle_since
+                self._idle_since = None
+            self._demand_wakeup.set()
+            logger.info("First consumer connected; resuming normal sensor polling.")
+        elif previous > 0 and self._consumers == 0:
+            self._idle_since = now
+            logger.info("No consumers left; switching sensor polling to idle cadence.")
+
+    def set_subscriptions(self, subscriptions: Iterable[Subscription]) -> None:
+        """
+        Restrict background polling to the sensors matched by the consumers'
+        subscriptions. Without consumers, or when one of them wants
+        everything, every sensor is polled.
+        """
+        self._subscriptions = list(subscriptions)
+        self._refresh_interest()
+
+    def _refresh_interest(self) -> None:
+        subscriptions = self._subscriptions
+        if not subscriptions or any(s.everything for s in subscriptions):
+            self._interest = None
+            return
+        self._interest = {
+            sensor_id
+            for sensor_id, definition in self._active_sensors.items()
+            if any(s.matches(definition) for s in subscriptions)
+        }
+
+    def _restrict_to_interest(
+        self, due: Optional[Dict[str, Set[str]]]
+    ) -> Optional[Dict[str, Set[str]]]:
+        """Narrow a round ({source_id: sensor_ids}, None for all) to subscribed sensors."""
+        interest = self._interest
+        if interest is None:
+            return due
+        if due is None:
+            due = {}
+            for sensor_id in interest:
+                source_id = self._active_sensors[sensor_id].source_id
+                due.setdefault(source_id, set()).add(sensor_id)
+            return due
+        restricted = {}
+        for source_id, sensor_ids in due.items():
+            wanted = sensor_ids & interest
+            if wanted:
+                restricted[source_id] = wanted
+        return restricted
+
+    def _active_interval(self) -> float:
+        """Ticker cadence while consumers are connected."""
+        if self.polling_schedule is not None:
+            return self.polling_schedule.tick_interval
+        return self.poll_interval
+
     async def _run_collector_task(self) -> None:
-        """Periodically collects data from all active sensor providers."""
+        """
+        Collects data from all active providers on a drift-free schedule whose
+        cadence follows demand. With a polling schedule, each tick while active
+        only reads the sensors that are due; the first round, warm-ups and idle
+        rounds read everything. While consumers are connected, sensors none of
+        them subscribes to are left to on-demand reads (see
+        `_collect_unsubscribed`).
+        """
         logger.info("Sensor data collector task started.")
+        loop = asyncio.get_running_loop()
+        ticker = MonotonicTicker(self.poll_interval)
+        full_round = True
         while self._initialized:
             try:
-                await self._collect_data_once()
-
-                # Use configured poll interval or default to 5 seconds
-                poll_interval = getattr(
-                    self.settings, "sensor_poll_interval_seconds", 5
+                schedule = self.polling_schedule
+                if schedule is None or full_round or self.is_idle:
+                    due = None if self.is_idle else self._restrict_to_interest(None)
+                    if due is None or due:
+                        await self._collect_coalesced(due)
+                    if schedule is not None:
+                        schedule.mark_all_polled(loop.time())
+                else:
+                    due = self._restrict_to_interest(schedule.take_due(loop.time()))
+                    if due:
+                        await self._collect_coalesced(due)
+                full_round = False
+
+                if self.is_idle and self.idle_poll_interval <= 0:
+                    # Paused: sleep until a consumer arrives
+                    await self._demand_wakeup.wait()
+                    self._demand_wakeup.clear()
+                    ticker.reset()
+                    self.warmup_collections += 1
+                    full_round = True
+                    continue
+                ticker.set_interval(
+                    self.idle_poll_interval if self.is_idle else self._active_interval()
                 )
-                await asyncio.sleep(poll_interval)
+                if await ticker.wait(self._demand_wakeup):
+                    self.warmup_collections += 1
+                    full_round = True
             except asyncio.CancelledError:
                 logger.info("Sensor data collector task cancelled.")
                 break
             except Exception as e:
                 logger.error(f"Error in sensor data collector task: {e}", exc_info=True)
                 await asyncio.sleep(10)  # Wait longer after an error
+                ticker.reset()
+
+    async def _collect_coalesced(
+        self, due: Optional[Dict[str, Set[str]]] = None
+    ) -> None:
+        """Run a collection round, or join the one already in progress."""
+        if self._inflight_collection is None:
+            self._inflight_collection = asyncio.create_task(self._collect_data_once(due))
+            self._inflight_collection.add_done_callback(self._collection_done)
+        await asyncio.shield(self._inflight_collection)
+
+    def _collection_done(self, task: asyncio.Task) -> None:
+        self._inflight_collection = None
+
+    async def _collect_data_once(
+        self, due: Optional[Dict[str, Set[str]]] = None
+    ) -> None:
+        """Performs a single round of data collection from all active providers.
+
+        Providers are polled concurrently, each with its own deadline, so a slow
+        or hung provider cannot delay the others. With `due` ({source_id:
+        sensor_ids}) only those sensors are read, and providers with nothing
+        due are not touched at all.
+        """
+        client = self._collector_process
+        if (
+            client is not None
+            and client.is_alive
+            and not client.is_overdue
+            and not client.has_new_snapshot()
+        ):
+            # The collector process published nothing new; republishing its
+            # last readings would only broadcast a duplicate snapshot
+            self.unchanged_collections += 1
+            return
+
+        timeout = getattr(self.settings, "sensor_provider_timeout_seconds", 3.0)
+        started = time.perf_counter()
+        if due is None:
+            self._full_collection_at = time.monotonic()
+        await asyncio.gather(
+            *(
+                self._collect_from_provider(
+                    provider,
+                    timeout,
+                    None if due is None else due[provider.source_id],
+                )
+                for provider in self.sensor_providers
+                if due is None or provider.source_id in due
+            )
+        )
+        self._publish_snapshot(started)
+
+        self.collections_total += 1
+        if self.is_idle:
+            self.collections_idle += 1
+        duration_ms = (time.perf_counter() - started) * 1000
+        self.average_collection_ms += (
+            duration_ms - self.average_collection_ms
+        ) / self.collections_total
+
+    def get_collection_stats(self) -> Dict[str, Any]:
+        """Collection cadence and the polling avoided while nobody was watching."""
+        idle_seconds = self._idle_seconds
+        if self._idle_since is not None:
+            idle_seconds += time.monotonic() - self._idle_since
+        # Polls the normal cadence would have made while idle, minus those made
+        polls_saved = max(0, int(idle_seconds / self.poll_interval) - self.collections_idle)
+        return {
+            "mode": "idle" if self.is_idle else "active",
+            "consumers": self._consumers,
+            "poll_interval_seconds": self.poll_interval,
+            "idle_poll_interval_seconds": self.idle_poll_interval,
+            "collections_total": self.collections_total,
+            "collections_idle": self.collections_idle,
+            "warmup_collections": self.warmup_collections,
+            "on_demand_collections": self.on_demand_collections,
+            "unchanged_collections": self.unchanged_collections,
+            "average_collection_ms": round(self.average_collection_ms, 3),
+            "subscribed_sensors": None if self._interest is None else len(self._interest),
+            "watchdog": self.watchdog.get_stats() if self.watchdog is not None else None,
+            "idle_seconds": round(idle_seconds, 3),
+            "polls_saved": polls_saved,
+            "polling_time_saved_ms": round(polls_saved * self.average_collection_ms, 3),
+            "schedule": self.polling_schedule.get_stats()
+            if self.polling_schedule is not None
+            else None,
+        }
+
+    def _publish_snapshot(self, collection_started: float) -> SensorSnapshot:
+        """Publish the readings of the round that just finished to subscribers."""
+        self._snapshot_version += 1
+        snapshot = SensorSnapshot(
+            version=self._snapshot_version,
+            readings=dict(self._sensor_readings),
+            stale_sources=[
+                source_id
+                for source_id in self._sensor_readings
+                if self.is_source_stale(source_id)
+            ],
+            collection_started=collection_started,
+            collection_finished=time.perf_counter(),
+        )
+        self.snapshots.publish(snapshot)
+        return snapshot
+
+    async def _collect_from_provider(
+        self,
+        provider: BaseSensor,
+        timeout: float,
+        sensor_ids: Optional[Set[str]] = None,
+    ) -> None:
+        """
+        Collect from one provider, keeping its last good snapshot on failure.
+        With `sensor_ids`, only those readings are refreshed and merged into
+        the provider's last snapshot.
+        """
+        stats = self._source_statistics.setdefault(
+            provider.source_id, SourceStatistics()
+        )
+        watchdog = self.watchdog
+        started = time.perf_counter()
+        if watchdog is not None:
+            watchdog.read_started(provider.source_id)
+        try:
+            if not await provider.is_available():
+                self.mark_source_stale(provider.source_id, "Provider unavailable")
+                if watchdog is not None:
+                    await watchdog.read_finished(provider.source_id, False)
+                return
+            if sensor_ids is None:
+                request = provider.get_current_data()
+            else:
+                request = provider.get_current_data_for(sensor_ids)
+            readings = await asyncio.wait_for(request, timeout)
+        except asyncio.TimeoutError:
+            stats.timeout_count += 1
+            stats.stale = True
+            stats.last_error = f"Collection timed out after {timeout}s"
+            logger.warning(
+                f"{provider.display_name} did not respond within {timeout}s; "
+                f"serving its last snapshot as stale"
+            )
+            if watchdog is not None:
+                await watchdog.read_finished(provider.source_id, False)
+            return
+        except Exception as e:
+            stats.error_count += 1
+            stats.stale = True
+            stats.last_error = str(e)
+            logger.error(
+                f"Failed to collect data from {provider.display_name}: {e}",
+                exc_info=True,
+            )
+            if watchdog is not None:
+                await watchdog.read_finished(provider.source_id, False)
+            return
 
-    async def _collect_data_once(self) -> None:
-        """Performs a single round of data collection from all active providers."""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stats.update_count += 1
+        stats.average_update_time += (
+            elapsed_ms - stats.average_update_time
+        ) / stats.update_count
+        stale_reason = getattr(provider, "stale_reason", None)
+        stats.stale = stale_reason is not None
+        if stale_reason is not None:
+            stats.last_error = stale_reason
+        if watchdog is not None:
+            await watchdog.read_finished(provider.source_id, True)
+        version = getattr(provider, "definitions_version", None)
+        if version is not None and version != self._registered_versions.get(provider.source_id):
+            logger.info(f"{provider.display_name} reports new sensor definitions")
+            self._register_definitions(provider, await provider.get_available_sensors())
+        get_update_timings = getattr(provider, "get_update_timings", None)
+        if get_update_timings is not None:
+            stats.hardware_update_times = get_update_timings()
+
+        current = readings
+        if sensor_ids is not None:
+            merged = {
+                reading.sensor_id: reading
+                for reading in self._sensor_readings.get(provider.source_id, [])
+            }
+            for reading in readings:
+                merged[reading.sensor_id] = reading
+            current = list(merged.values())
+        stats.active_sensors = len(current)
+
+        self._sensor_readings[provider.source_id] = current
+        self._history.record(readings)
+        if self.polling_schedule is not None:
+            self.polling_schedule.observe(readings)
+        logger.debug(
+            f"Collected {len(readings)} readings from {provider.display_name}"
+        )
+
+    def get_source_statistics(self) -> Dict[str, SourceStatistics]:
+        """Return collection statistics for every provider, keyed by source ID."""
+        return dict(self._source_statistics)
+
+    def get_provider(self, source_id: str) -> Optional[BaseSensor]:
         for provider in self.sensor_providers:
+            if provider.source_id == source_id:
+                return provider
+        return None
+
+    def mark_source_stale(self, source_id: str, reason: str) -> None:
+        """Keep serving a provider's last readings, flagged as stale."""
+        stats = self._source_statistics.setdefault(source_id, SourceStatistics())
+        stats.stale = True
+        stats.last_error = reason
+
+    async def emit_status(self, event: Dict[str, Any]) -> None:
+        """Pass a provider status event to every status listener."""
+        for listener in list(self.status_listeners):
             try:
-                if await provider.is_available():
-                    readings = await provider.get_current_data()
-                    self._sensor_readings[provider.source_id] = readings
-                    logger.debug(
-                        f"Collected {len(readings)} readings from {provider.display_name}"
-                    )
+                await listener(event)
             except Exception as e:
-                logger.error(
-                    f"Failed to collect data from {provider.display_name}: {e}",
-                    exc_info=True,
-                )
+                logger.error(f"Status listener failed: {e}")
 
-    async def get_all_sensor_data(self) -> Dict[str, List[SensorReading]]:
-        """Return all current sensor readings, aggregated from providers."""
+    async def restart_provider(self, provider: BaseSensor) -> bool:
+        """Restart a provider in place and refresh its sensor definitions."""
+        if not await provider.restart(self.settings):
+            return False
+        self._register_definitions(provider, await provider.get_available_sensors())
+        return True
+
+    def _register_definitions(
+        self, provider: BaseSensor, definitions: List[SensorDefinition]
+    ) -> None:
+        """Make a provider's definitions the active ones for its sensors."""
+        source_id = provider.source_id
+        self._registered_versions[source_id] = getattr(provider, "definitions_version", 0)
+        current = {definition.sensor_id for definition in definitions}
+        for sensor_id in [
+            sensor_id
+            for sensor_id, definition in self._active_sensors.items()
+            if definition.source_id == source_id and sensor_id not in current
+        ]:
+            del self._active_sensors[sensor_id]  # e.g. a core went offline
+        self._source_statistics.setdefault(
+            source_id, SourceStatistics()
+        ).total_sensors = len(definitions)
+        if self.polling_schedule is not None:
+            self.polling_schedule.register_definitions(definitions)
+        for definition in definitions:
+            self._active_sensors[definition.sensor_id] = definition
+        self.definitions_version += 1
+        self._refresh_interest()
+
+    def get_provider_diagnostics(self) -> Dict[str, Any]:
+        """Per-provider source info (including update profiles) and statistics."""
+        diagnostics = {}
+        for provider in self.sensor_providers:
+            stats = self._source_statistics.get(provider.source_id)
+            diagnostics[provider.source_id] = {
+                **provider.get_source_info(),
+                "statistics": stats.model_dump(mode="json") if stats else None,
+            }
+        return diagnostics
+
+    def is_source_stale(self, source_id: str) -> bool:
+        """Whether a provider's current readings are a stale, last-good snapshot."""
+        stats = self._source_statistics.get(source_id)
+        return bool(stats and stats.stale)
+
+    async def get_all_sensor_data(self) -> Dict[str, List[AnyReading]]:
+        """
+        Return all current sensor readings, aggregated from providers. These
+        are the internal readings; `models.reading.to_model` builds the
+        SensorReading model of one where a response needs it.
+        """
         # If readings are empty on first call, perform an immediate collection
         if not self._sensor_readings:
             logger.info("Initial sensor data request; performing immediate collection.")
-            await self._collect_data_once()
+            await self._collect_coalesced()
+        else:
+            await self._collect_unsubscribed()
         return self._sensor_readings
 
+    async def _collect_unsubscribed(self) -> None:
+        """
+        Read every sensor if the consumers' subscriptions have kept some from
+        being read for longer than the poll interval, so REST reads and
+        history never serve values frozen by somebody else's subscription.
+        """
+        if self._interest is None or not self.sensor_providers:
+            return
+        last = self._full_collection_at
+        if last is not None and time.monotonic() - last <= self.poll_interval:
+            return
+        self.on_demand_collections += 1
+        if self._inflight_collection is not None:
+            # A subscribed-only round would not cover them; wait it out
+            await asyncio.shield(self._inflight_collection)
+        await self._collect_coalesced()
+
+    async def get_latest_snapshot(self) -> Optional[SensorSnapshot]:
+        """
+        Return the most recently published snapshot. A snapshot is collected
+        first if none exists, if polling is idle and the latest one is older
+        than the normal poll interval, or if subscriptions have left sensors
+        unread for longer than that.
+        """
+        latest = self.snapshots.latest
+        if self.sensor_providers and (
+            latest is None
+            or (self.is_idle and latest.age_ms() > self.poll_interval * 1000)
+        ):
+            if latest is not None:
+                self.on_demand_collections += 1
+            await self._collect_coalesced()
+        else:
+            await self._collect_unsubscribed()
+        return self.snapshots.latest
+
+    async def get_sensor_history(
+        self, sensor_id: str, limit: int
+    ) -> List[SensorReading]:
+        """Return up to `limit` recent readings for a sensor, newest first."""
+        await self.get_all_sensor_data()
+        return self._history.get_history(sensor_id, limit)
+
     async def get_sensor_definitions(self) -> List[SensorDefinition]:
         """Return definitions of all active sensors."""
         return list(self._active_sensors.values())
 
+    def get_sensor_definition_map(self) -> Dict[str, SensorDefinition]:
+        """Live mapping of sensor_id to definition for all active sensors."""
+        return self._active_sensors
+
     def get_available_sources(self) -> List[Dict[str, Any]]:
         """Return status information for all discovered sensor providers."""
         sources = []
@@ -268,6 +791,7 @@ except Exception as e:
                     "name": provider.display_name,
                     "source_id": provider.source_id,
                     "available": True,  # Assumed available if it's in the list
+                    "stale": self.is_source_stale(provider.source_id),
                     "sensor_count": len(self._active_sensors)
                     # This is not ideal as it returns total sensors, not per provider
                     # A proper implementation would map sensors to providers.
@@ -281,6 +805,8 @@ except Exception as e:
             return
 
         logger.info("Shutting down SensorManager...")
+        if self.watchdog is not None:
+            await self.watchdog.stop()
         if self._collector_task:
             self._collector_task.cancel()
             try:
@@ -302,17 +828,23 @@ except Exception as e:
                     exc_info=True,
                 )
 
+        if self._collector_process is not None:
+            await self._collector_process.stop()
+            self._collector_process = None
+
         self.sensor_providers.clear()
         self._active_sensors.clear()
         self._sensor_readings.clear()
+        self._history.clear()
+        self._source_statistics.clear()
         self._initialized = False
         logger.info("SensorManager shut down complete.")
 
     # Alias methods for compatibility
-    async def get_sensor_readings(self) -> Dict[str, List[SensorReading]]:
+    async def get_sensor_readings(self) -> Dict[str, List[AnyReading]]:
         """Alias for get_all_sensor_data for compatibility."""
         return await self.get_all_sensor_data()
     
-    async def get_readings(self) -> Dict[str, List[SensorReading]]:
+    async def get_readings(self) -> Dict[str, List[AnyReading]]:
         """Another alias for get_all_sensor_data for compatibility."""
         return await self.get_all_sensor_data()
@@ -0,0 +1,229 @@
+"""
+Shared-memory snapshot buffer between the collector process and the web
+process. The segment holds a small header and two value buffers; the writer
+always fills the buffer that is not the latest and then publishes it, so a
+reader never waits on the writer:
+
+    header   <8sIIQ   magic, layout version, capacity, publish count
+    buffer   <QQdII   lock, snapshot sequence, timestamp (epoch s),
+                      definitions version, value count
+             <d       float64 per sensor in definition order, NaN when absent
+             <d       observed minimum per sensor, NaN when not reported
+             <d       observed maximum per sensor, NaN when not reported
+             <B       flags per sensor: FLAG_STALE, status code << STATUS_SHIFT
+
+Each buffer's lock is odd while it is being written. A reader copies the
+latest buffer and retries if the lock moved meanwhile (a seqlock), which can
+only happen when the writer laps it twice during one read.
+"""
+
+import struct
+from array import array
+from multiprocessing import shared_memory
+from typing import Optional, Sequence
+
+HEADER = struct.Struct("<8sIIQ")
+BUFFER_HEADER = struct.Struct("<QQdII")
+MAGIC = b"USMPSNAP"
+LAYOUT_VERSION = 2
+
+FLAG_STALE = 0x01
+STATUS_SHIFT = 1  # Bits 1-2 hold a status code chosen by the writer
+STATUS_MASK = 0x06
+
+_PUBLISHED_OFFSET = 16  # Offset of the publish count within the header
+_READ_RETRIES = 16
+
+
+def _buffer_size(capacity: int) -> int:
+    size = BUFFER_HEADER.size + 25 * capacity
+    return (size + 7) & ~7
+
+
+class SharedSnapshot:
+    """One snapshot as read from the shared buffer."""
+
+    __slots__ = (
+        "sequence",
+        "timestamp",
+        "definitions_version",
+        "values",
+        "minimums",
+        "maximums",
+        "flags",
+    )
+
+    def __init__(
+        self,
+        sequence: int,
+        timestamp: float,
+        definitions_version: int,
+        values: array,
+        minimums: array,
+        maximums: array,
+        flags: bytes,
+    ):
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.definitions_version = definitions_version
+        self.values = values
+        self.minimums = minimums
+        self.maximums = maximums
+        self.flags = flags
+
+
+class SharedSnapshotBuffer:
+    """
+    Double-buffered snapshot segment. The creating side owns the segment and
+    unlinks it; the other side attaches by name. There must be exactly one
+    writer.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self.owner = owner
+        magic, layout, capacity, _ = HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or layout != LAYOUT_VERSION:
+            raise ValueError(f"{shm.name} is not a snapshot buffer (layout {layout})")
+        self.capacity = capacity
+        self._buffer_size = _buffer_size(capacity)
+
+        # Statistics
+        self.writes = 0
+        self.reads = 0
+        self.read_retries = 0
+
+    @classmethod
+    def create(cls, capacity: int) -> "SharedSnapshotBuffer":
+        size = HEADER.size + 2 * _buffer_size(capacity)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        HEADER.pack_into(shm.buf, 0, MAGIC, LAYOUT_VERSION, capacity, 0)
+        for index in range(2):
+            BUFFER_HEADER.pack_into(
+                shm.buf, HEADER.size + index * _buffer_size(capacity), 0, 0, 0.0, 0, 0
+            )
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedSnapshotBuffer":
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def published(self) -> int:
+        """Number of snapshots published so far."""
+        return struct.unpack_from("<Q", self._shm.buf, _PUBLISHED_OFFSET)[0]
+
+    @property
+    def latest_sequence(self) -> Optional[int]:
+        """
+        Sequence of the latest snapshot, from its header alone; None before
+        the first publish. Not locked, so only a hint for whether to read().
+        """
+        published = self.published
+        if published == 0:
+            return None
+        offset = self._offset((published - 1) % 2)
+        return BUFFER_HEADER.unpack_from(self._shm.buf, offset)[1]
+
+    def _offset(self, index: int) -> int:
+        return HEADER.size + index * self._buffer_size
+
+    def write(
+        self,
+        sequence: int,
+        timestamp: float,
+        definitions_version: int,
+        values: array,
+        flags: Optional[Sequence[int]] = None,
+        minimums: Optional[array] = None,
+        maximums: Optional[array] = None,
+    ) -> None:
+        """
+        Publish a snapshot; `values`, `minimums` and `maximums` are
+        array('d') in definition order, the latter two NaN-filled if omitted.
+        """
+        count = len(values)
+        if count > self.capacity:
+            raise ValueError(f"{count} values exceed buffer capacity {self.capacity}")
+        if minimums is None:
+            minimums = array("d", [float("nan")]) * count
+        if maximums is None:
+            maximums = array("d", [float("nan")]) * count
+        buf = self._shm.buf
+        published = self.published
+        offset = self._offset(published % 2)
+
+        lock = struct.unpack_from("<Q", buf, offset)[0]
+        struct.pack_into("<Q", buf, offset, lock + 1)  # Odd: being written
+        start = offset + BUFFER_HEADER.size
+        for column, data in enumerate((values, minimums, maximums)):
+            column_start = start + column * 8 * self.capacity
+            buf[column_start : column_start + 8 * count] = memoryview(data).cast("B")
+        flags_start = start + 24 * self.capacity
+        buf[flags_start : flags_start + count] = bytes(flags) if flags else bytes(count)
+        BUFFER_HEADER.pack_into(
+            buf, offset, lock + 2, sequence, timestamp, definitions_version, count
+        )
+        struct.pack_into("<Q", buf, _PUBLISHED_OFFSET, published + 1)
+        self.writes += 1
+
+    def read(self, after_sequence: Optional[int] = None) -> Optional[SharedSnapshot]:
+        """
+        Copy out the latest snapshot. Returns None before the first publish,
+        or when the latest snapshot's sequence is not newer than
+        `after_sequence` (checked from the header alone, without copying).
+        """
+        buf = self._shm.buf
+        for _ in range(_READ_RETRIES):
+            published = self.published
+            if published == 0:
+                return None
+            offset = self._offset((published - 1) % 2)
+            lock, sequence, timestamp, definitions_version, count = (
+                BUFFER_HEADER.unpack_from(buf, offset)
+            )
+            if lock & 1:
+                self.read_retries += 1
+                continue
+            if after_sequence is not None and sequence <= after_sequence:
+                return None
+            start = offset + BUFFER_HEADER.size
+            columns = []
+            for column in range(3):
+                column_start = start + column * 8 * self.capacity
+                data = array("d")
+                data.frombytes(buf[column_start : column_start + 8 * count])
+                columns.append(data)
+            values, minimums, maximums = columns
+            flags_start = start + 24 * self.capacity
+            flags = bytes(buf[flags_start : flags_start + count])
+            if struct.unpack_from("<Q", buf, offset)[0] != lock:
+                self.read_retries += 1  # Overwritten while copying
+                continue
+            self.reads += 1
+            return SharedSnapshot(
+                sequence, timestamp, definitions_version, values, minimums, maximums, flags
+            )
+        return None
+
+    def close(self) -> None:
+        self._shm.close()
+        if self.owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def get_stats(self) -> dict:
+        return {
+            "name": self.name,
+            "capacity": self.capacity,
+            "published": self.published,
+            "writes": self.writes,
+            "reads": self.reads,
+            "read_retries": self.read_retries,
+        }
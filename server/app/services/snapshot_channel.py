@@ -0,0 +1,107 @@
+"""
+Internal pub/sub channel for collected sensor snapshots.
+The collector publishes one snapshot per collection round; consumers such as
+the realtime broadcaster await new snapshots instead of polling on a timer.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from ..models.reading import AnyReading
+
+
+class SensorSnapshot:
+    """Immutable result of one collection round across all providers."""
+
+    __slots__ = (
+        "version",
+        "readings",
+        "stale_sources",
+        "timestamp",
+        "collection_started",
+        "collection_finished",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        readings: Dict[str, List[AnyReading]],
+        stale_sources: List[str],
+        collection_started: float,
+        collection_finished: float,
+    ):
+        self.version = version
+        self.readings = readings
+        self.stale_sources = stale_sources
+        self.timestamp = datetime.now()
+        # time.perf_counter() values, used for sensor-to-wire latency
+        self.collection_started = collection_started
+        self.collection_finished = collection_finished
+
+    @property
+    def total_sensors(self) -> int:
+        return sum(len(readings) for readings in self.readings.values())
+
+    @property
+    def active_sources(self) -> int:
+        return sum(1 for readings in self.readings.values() if readings)
+
+    def age_ms(self) -> float:
+        """Milliseconds since the collection round that produced this snapshot began."""
+        return (time.perf_counter() - self.collection_started) * 1000
+
+
+class SnapshotSubscription:
+    """One consumer's view of the channel; only the newest snapshot is kept."""
+
+    def __init__(self, channel: "SnapshotChannel"):
+        self._channel = channel
+        self._queue: "asyncio.Queue[SensorSnapshot]" = asyncio.Queue(maxsize=1)
+        self.dropped = 0  # Snapshots replaced before the consumer got to them
+
+    def _offer(self, snapshot: SensorSnapshot) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(snapshot)
+
+    async def get(self) -> SensorSnapshot:
+        """Wait for the next snapshot published after the previous one was taken."""
+        return await self._queue.get()
+
+    def close(self) -> None:
+        self._channel.unsubscribe(self)
+
+
+class SnapshotChannel:
+    """Fan-out of published snapshots to all current subscribers."""
+
+    def __init__(self):
+        # Versions are only comparable within one channel; clients resuming a
+        # stream must present the same stream_id
+        self.stream_id = uuid.uuid4().hex[:16]
+        self._subscribers: Set[SnapshotSubscription] = set()
+        self.latest: Optional[SensorSnapshot] = None
+        self.published = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> SnapshotSubscription:
+        subscription = SnapshotSubscription(self)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: SnapshotSubscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def publish(self, snapshot: SensorSnapshot) -> None:
+        """Hand a new snapshot to every subscriber without waiting on any of them."""
+        self.latest = snapshot
+        self.published += 1
+        for subscription in self._subscribers:
+            subscription._offer(snapshot)
@@ -0,0 +1,153 @@
+"""
+Per-client sensor subscriptions.
+A subscription selects sensors by ID, category and hardware type. Clients with
+equal subscriptions share one encoded frame per snapshot.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable
+
+from ..models.reading import AnyReading
+from ..models.sensor import HardwareType, SensorCategory
+from .snapshot_channel import SensorSnapshot
+
+
+class Subscription:
+    """Immutable, hashable selection of sensors."""
+
+    __slots__ = ("everything", "sensor_ids", "categories", "hardware_types", "_key")
+
+    def __init__(
+        self,
+        everything: bool = False,
+        sensor_ids: Iterable[str] = (),
+        categories: Iterable[str] = (),
+        hardware_types: Iterable[str] = (),
+    ):
+        self.everything = everything
+        self.sensor_ids: FrozenSet[str] = frozenset(sensor_ids)
+        # Stored as enum values, which is how readings carry them
+        self.categories: FrozenSet[str] = frozenset(
+            SensorCategory(category).value for category in categories
+        )
+        self.hardware_types: FrozenSet[str] = frozenset(
+            HardwareType(hardware_type).value for hardware_type in hardware_types
+        )
+        self._key = (
+            everything,
+            self.sensor_ids,
+            self.categories,
+            self.hardware_types,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Subscription) and self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        return f"Subscription({self.to_dict()})"
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.everything or self.sensor_ids or self.categories or self.hardware_types
+        )
+
+    def matches(self, reading: AnyReading) -> bool:
+        return (
+            self.everything
+            or reading.sensor_id in self.sensor_ids
+            or reading.category in self.categories
+            or reading.hardware_type in self.hardware_types
+        )
+
+    def apply(self, snapshot: SensorSnapshot) -> SensorSnapshot:
+        """Return a view of the snapshot holding only the matching readings."""
+        if self.everything:
+            return snapshot
+        readings = {}
+        for source_id, source_readings in snapshot.readings.items():
+            selected = [reading for reading in source_readings if self.matches(reading)]
+            if selected:
+                readings[source_id] = selected
+        view = SensorSnapshot(
+            version=snapshot.version,
+            readings=readings,
+            stale_sources=[s for s in snapshot.stale_sources if s in readings],
+            collection_started=snapshot.collection_started,
+            collection_finished=snapshot.collection_finished,
+        )
+        view.timestamp = snapshot.timestamp
+        return view
+
+    def add(
+        self,
+        sensor_ids: Iterable[str] = (),
+        categories: Iterable[str] = (),
+        hardware_types: Iterable[str] = (),
+    ) -> "Subscription":
+        """Subscription with the given selectors added (leaves "everything" mode)."""
+        return Subscription(
+            everything=False,
+            sensor_ids=self.sensor_ids | frozenset(sensor_ids),
+            categories=self.categories | frozenset(categories),
+            hardware_types=self.hardware_types | frozenset(hardware_types),
+        )
+
+    def remove(
+        self,
+        sensor_ids: Iterable[str] = (),
+        categories: Iterable[str] = (),
+        hardware_types: Iterable[str] = (),
+    ) -> "Subscription":
+        """
+        Subscription with the given selectors removed. Raises ValueError for
+        selectors on an "everything" subscription, which has none to remove.
+        """
+        if self.everything and (sensor_ids or categories or hardware_types):
+            raise ValueError(
+                "Cannot unsubscribe selectors from an 'all' subscription; "
+                "subscribe to the sensors to keep instead"
+            )
+        return Subscription(
+            everything=self.everything,
+            sensor_ids=self.sensor_ids - frozenset(sensor_ids),
+            categories=self.categories
+            - frozenset(SensorCategory(c).value for c in categories),
+            hardware_types=self.hardware_types
+            - frozenset(HardwareType(h).value for h in hardware_types),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "all": self.everything,
+            "sensor_ids": sorted(self.sensor_ids),
+            "categories": sorted(self.categories),
+            "hardware_types": sorted(self.hardware_types),
+        }
+
+    @classmethod
+    def from_command(
+        cls, current: "Subscription", payload: Dict[str, Any], subscribe: bool
+    ) -> "Subscription":
+        """
+        Apply a subscribe/unsubscribe command payload to a subscription.
+        Raises ValueError for unknown categories or hardware types, and for
+        unsubscribing selectors from an "all" subscription.
+        """
+        if payload.get("all"):
+            return ALL if subscribe else Subscription()
+        selectors = {
+            "sensor_ids": payload.get("sensor_ids") or (),
+            "categories": payload.get("categories") or (),
+            "hardware_types": payload.get("hardware_types") or (),
+        }
+        if subscribe:
+            return current.add(**selectors)
+        return current.remove(**selectors)
+
+
+# Default for new connections: every sensor, as before subscriptions existed
+ALL = Subscription(everything=True)
+
@@ -4,25 +4,171 @@ Handles real-time communication with frontend clients.
 """
 
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Iterable, Optional, Tuple, Union
 import json
 import logging
 import asyncio
+import time
+from collections import deque
 from datetime import datetime
 
+from app.services.subscriptions import ALL, Subscription
+
 logger = logging.getLogger(__name__)
 
+# Wire formats a client can ask for with /ws?format=...
+FRAME_FORMATS = ("full", "delta", "binary", "columnar")
+
+Message = Union[str, bytes]
+
+
+class ConnectionWriter:
+    """
+    Owns all sends to one WebSocket. Messages are queued and written by a
+    dedicated task, so a slow client only ever delays itself.
+
+    Control messages are queued without limit and never dropped. Sensor frames
+    go to a small bounded outbox; when it is full the oldest frame is dropped
+    in favour of the newest. A client that keeps dropping frames for longer
+    than `max_lag_seconds` is disconnected.
+    """
+
+    def __init__(
+        self,
+        manager: "WebSocketManager",
+        websocket: WebSocket,
+        metadata: Dict[str, Any],
+        outbox_size: int = 2,
+        max_lag_seconds: float = 30.0,
+    ):
+        self.manager = manager
+        self.websocket = websocket
+        self.metadata = metadata
+        self.max_lag_seconds = max_lag_seconds
+        self._control: "deque[Message]" = deque()
+        self._frames: "deque[Message]" = deque(maxlen=max(1, outbox_size))
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.lagging_since: Optional[float] = None
+        self.dropped_frames = 0
+        # Set once a server-side close has been scheduled for a lagging client
+        self.closing = False
+        self._close_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._control) + len(self._frames)
+
+    def send_control(self, message: Message) -> None:
+        self._control.append(message)
+        self._wakeup.set()
+
+    def send_frame(self, message: Message) -> None:
+        if self.closing:
+            return
+        if len(self._frames) == self._frames.maxlen:
+            # deque(maxlen) discards the oldest frame on append
+            self.dropped_frames += 1
+            # A dropped delta breaks the client's chain; restart from a keyframe
+            if self.metadata.get("format") == "delta":
+                self.metadata["needs_keyframe"] = True
+            if self.lagging_since is None:
+                self.lagging_since = time.monotonic()
+            elif time.monotonic() - self.lagging_since > self.max_lag_seconds:
+                self.closing = True
+                self._close_task = asyncio.create_task(
+                    self.manager.close_connection(self.websocket, reason="client too slow")
+                )
+                self._close_task.add_done_callback(self._close_done)
+                return
+        self._frames.append(message)
+        self._wakeup.set()
+
+    def _close_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Error closing lagging WebSocket: {task.exception()}")
+
+    def _next_message(self) -> Optional[Message]:
+        if self._control:
+            return self._control.popleft()
+        if self._frames:
+            return self._frames.popleft()
+        return None
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                message = self._next_message()
+                while message is not None:
+                    if isinstance(message, bytes):
+                        await self.websocket.send_bytes(message)
+                    else:
+                        await self.websocket.send_text(message)
+                    self.metadata["messages_sent"] += 1
+                    self.metadata["last_activity"] = datetime.now()
+                    message = self._next_message()
+                # Fully drained: the client has caught up
+                self.lagging_since = None
+        except asyncio.CancelledError:
+            pass
+        except WebSocketDisconnect:
+            self.manager.disconnect(self.websocket)
+        except Exception as e:
+            logger.warning(f"Error sending message to WebSocket: {e}")
+            self.manager.disconnect(self.websocket)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.queue_depth,
+            "control_queued": len(self._control),
+            "frames_queued": len(self._frames),
+            "dropped_frames": self.dropped_frames,
+            "lagging_seconds": round(time.monotonic() - self.lagging_since, 3)
+            if self.lagging_since is not None
+            else 0.0,
+        }
+
 
 class WebSocketManager:
     """Manages WebSocket connections and broadcasting."""
 
-    def __init__(self):
+    def __init__(self, outbox_size: int = 2, max_lag_seconds: float = 30.0):
         self.active_connections: List[WebSocket] = []
         self.connection_metadata: Dict[WebSocket, Dict[str, Any]] = {}
+        self._writers: Dict[WebSocket, ConnectionWriter] = {}
+        self.outbox_size = outbox_size
+        self.max_lag_seconds = max_lag_seconds
         self._cleanup_task: asyncio.Task = None
+        # Called with the new connection count whenever a client comes or goes
+        self.connection_listeners: List[Callable[[int], None]] = []
+
+    def _notify_connection_change(self) -> None:
+        count = len(self.active_connections)
+        for listener in list(self.connection_listeners):
+            try:
+                listener(count)
+            except Exception as e:
+                logger.error(f"Connection listener failed: {e}")
 
-    async def connect(self, websocket: WebSocket, client_id: str = None):
+    async def connect(
+        self,
+        websocket: WebSocket,
+        client_id: str = None,
+        frame_format: str = "full",
+        stream_id: Optional[str] = None,
+    ):
         """Accept a new WebSocket connection."""
+        if frame_format not in FRAME_FORMATS:
+            frame_format = "full"
         try:
             await websocket.accept()
             self.active_connections.append(websocket)
@@ -31,7 +177,12 @@ class WebSocketManager:
                 "connected_at": datetime.now(),
                 "messages_sent": 0,
                 "last_activity": datetime.now(),
+                "format": frame_format,
+                # Delta clients must start from a full keyframe
+                "needs_keyframe": True,
+                "subscription": ALL,
             }
+            self._notify_connection_change()
             logger.info(
                 f"New WebSocket connection established for client {client_id}. Total connections: {len(self.active_connections)}"
             )
@@ -41,10 +192,25 @@ class WebSocketManager:
                 "type": "connection_established",
                 "timestamp": datetime.now().isoformat(),
                 "client_id": client_id,
+                "format": frame_format,
                 "message": "Connected to Ultimate Sensor Monitor",
             }
+            if stream_id is not None:
+                # Clients present this with resume_from when reconnecting
+                welcome_message["stream_id"] = stream_id
             await websocket.send_text(json.dumps(welcome_message))
 
+            # All further sends go through the connection's own writer task
+            writer = ConnectionWriter(
+                self,
+                websocket,
+                self.connection_metadata[websocket],
+                outbox_size=self.outbox_size,
+                max_lag_seconds=self.max_lag_seconds,
+            )
+            self._writers[websocket] = writer
+            writer.start()
+
         except Exception as e:
             logger.error(f"Error accepting WebSocket connection: {e}")
             if websocket in self.active_connections:
@@ -56,8 +222,12 @@ class WebSocketManager:
         """Remove a WebSocket connection."""
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+            self._notify_connection_change()
         if websocket in self.connection_metadata:
             del self.connection_metadata[websocket]
+        writer = self._writers.pop(websocket, None)
+        if writer is not None:
+            writer.stop()
 
         disconnect_msg = (
             f"WebSocket connection closed for client {client_id or 'unknown'}"
@@ -67,48 +237,44 @@ class WebSocketManager:
         disconnect_msg += f". Total connections: {len(self.active_connections)}"
         logger.info(disconnect_msg)
 
-    async def send_personal_message(self, message: str, websocket: WebSocket):
-        """Send a message to a specific WebSocket connection."""
+    async def close_connection(self, websocket: WebSocket, reason: str) -> None:
+        """Disconnect a client from the server side."""
+        client_id = self.connection_metadata.get(websocket, {}).get("client_id")
+        self.disconnect(websocket, client_id, reason=reason)
         try:
-            await websocket.send_text(message)
-            if websocket in self.connection_metadata:
-                self.connection_metadata[websocket]["messages_sent"] += 1
-                self.connection_metadata[websocket]["last_activity"] = datetime.now()
-        except WebSocketDisconnect:
-            self.disconnect(websocket)
-        except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
-            self.disconnect(websocket)
+            await websocket.close(code=1013, reason=reason)  # 1013: try again later
+        except Exception:
+            pass  # Connection might already be closed
+
+    async def send_personal_message(self, message: Message, websocket: WebSocket):
+        """Queue a control message for a specific WebSocket connection."""
+        writer = self._writers.get(websocket)
+        if writer is not None:
+            writer.send_control(message)
 
-    async def broadcast(self, message: str):
-        """Broadcast a message to all connected WebSocket clients."""
+    async def broadcast(
+        self,
+        message: Message,
+        connections: Optional[Iterable[WebSocket]] = None,
+        control: bool = False,
+    ):
+        """
+        Queue a message for all (or the given) connected WebSocket clients.
+        Sensor frames may be superseded by newer ones if a client falls behind;
+        control messages are always delivered.
+        """
         if not self.active_connections:
             return
 
-        # Send to all connections concurrently
-        tasks = []
-        for (
-            connection
-        ) in (
-            self.active_connections.copy()
-        ):  # Copy to avoid modification during iteration
-            tasks.append(self._safe_send(connection, message))
-
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-    async def _safe_send(self, websocket: WebSocket, message: str):
-        """Safely send a message to a WebSocket, handling disconnections."""
-        try:
-            await websocket.send_text(message)
-            if websocket in self.connection_metadata:
-                self.connection_metadata[websocket]["messages_sent"] += 1
-                self.connection_metadata[websocket]["last_activity"] = datetime.now()
-        except WebSocketDisconnect:
-            self.disconnect(websocket)
-        except Exception as e:
-            logger.warning(f"Error sending message to WebSocket: {e}")
-            self.disconnect(websocket)
+        targets = connections if connections is not None else self.active_connections
+        for connection in list(targets):
+            writer = self._writers.get(connection)
+            if writer is None:
+                continue
+            if control:
+                writer.send_control(message)
+            else:
+                writer.send_frame(message)
 
     async def broadcast_sensor_data(self, sensor_data: Dict[str, Any]):
         """Broadcast sensor data to all connected clients."""
@@ -128,7 +294,7 @@ class WebSocketManager:
             "timestamp": datetime.now().isoformat(),
             "content": content,
         }
-        await self.broadcast(json.dumps(message))
+        await self.broadcast(json.dumps(message), control=True)
 
     async def send_to_client(self, client_id: str, message: Dict[str, Any]):
         """Send a message to a specific client by ID."""
@@ -143,6 +309,32 @@ class WebSocketManager:
         else:
             logger.warning(f"Client {client_id} not found for targeted message")
 
+    def connection_groups(self) -> Dict[Tuple[str, Subscription], List[WebSocket]]:
+        """
+        Group active connections by (wire format, subscription). Each group
+        receives the same bytes, so every distinct frame is encoded once.
+        """
+        groups: Dict[Tuple[str, Subscription], List[WebSocket]] = {}
+        for websocket in self.active_connections:
+            metadata = self.connection_metadata.get(websocket, {})
+            key = (metadata.get("format", "full"), metadata.get("subscription", ALL))
+            groups.setdefault(key, []).append(websocket)
+        return groups
+
+    def get_subscription(self, websocket: WebSocket) -> Subscription:
+        return self.connection_metadata.get(websocket, {}).get("subscription", ALL)
+
+    def set_subscription(self, websocket: WebSocket, subscription: Subscription) -> None:
+        """Change which sensors a client receives; it restarts from a keyframe."""
+        if websocket in self.connection_metadata:
+            self.connection_metadata[websocket]["subscription"] = subscription
+            self.connection_metadata[websocket]["needs_keyframe"] = True
+
+    def request_keyframe(self, websocket: WebSocket) -> None:
+        """Send this client a full keyframe instead of its next delta."""
+        if websocket in self.connection_metadata:
+            self.connection_metadata[websocket]["needs_keyframe"] = True
+
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get statistics about current connections."""
         total_connections = len(self.active_connections)
@@ -150,17 +342,29 @@ class WebSocketManager:
             metadata.get("messages_sent", 0)
             for metadata in self.connection_metadata.values()
         )
+        total_dropped_frames = sum(
+            writer.dropped_frames for writer in self._writers.values()
+        )
 
         return {
             "total_connections": total_connections,
             "total_messages_sent": total_messages_sent,
+            "total_dropped_frames": total_dropped_frames,
             "connections": [
                 {
+                    "client_id": metadata.get("client_id", "unknown"),
+                    "format": metadata.get("format", "full"),
+                    "subscription": metadata.get("subscription", ALL).to_dict(),
                     "connected_at": metadata["connected_at"].isoformat(),
                     "messages_sent": metadata["messages_sent"],
                     "last_activity": metadata["last_activity"].isoformat(),
+                    **(
+                        self._writers[websocket].get_stats()
+                        if websocket in self._writers
+                        else {}
+                    ),
                 }
-                for metadata in self.connection_metadata.values()
+                for websocket, metadata in self.connection_metadata.items()
             ],
         }
 
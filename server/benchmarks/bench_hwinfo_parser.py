@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Compare HWiNFO shared-memory parsing: a per-reading struct.unpack/decode loop
+(how the segment used to be parsed) versus the NumPy structured-dtype reader,
+and the reader plus building SensorReadings, for 100, 1,000 and 5,000
+readings in an emulated segment.
+
+Usage (from the server directory):
+    python benchmarks/bench_hwinfo_parser.py [--repeat N]
+"""
+
+import argparse
+import asyncio
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.config import AppSettings  # noqa: E402
+from app.sensors.hwinfo_emulator import HWiNFOEmulator  # noqa: E402
+from app.sensors.hwinfo_sensor import HWiNFOSensor  # noqa: E402
+from app.sensors.hwinfo_shm import HEADER, HWiNFOSharedMemory  # noqa: E402
+
+SIZES = (100, 1_000, 5_000)
+READING = struct.Struct("<III128s128s16sdddd")
+
+
+def legacy_parse(mm: mmap.mmap) -> list:
+    """Unpack and decode every reading on every poll."""
+    header = HEADER.unpack_from(mm, 0)
+    reading_offset, reading_size, reading_count = header[7:10]
+    parsed = []
+    for i in range(reading_count):
+        fields = READING.unpack_from(mm, reading_offset + i * reading_size)
+        parsed.append(
+            (
+                fields[4].split(b"\0", 1)[0].decode("latin-1"),
+                fields[5].split(b"\0", 1)[0].decode("latin-1"),
+                fields[6],
+                fields[7],
+                fields[8],
+            )
+        )
+    return parsed
+
+
+def bench(fn, repeat: int) -> float:
+    """Mean microseconds per call."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+async def bench_readings(sensor: HWiNFOSensor, repeat: int) -> float:
+    """Mean microseconds per get_current_data() call."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await sensor.get_current_data()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50, help="Polls per size")
+    args = parser.parse_args()
+
+    print(f"{'readings':>8} | {'legacy us':>10} | {'numpy us':>9} | {'readings us':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            path = os.path.join(directory, f"hwinfo_{size}.bin")
+            emulator = HWiNFOEmulator.synthetic(path, size)
+
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            legacy_us = bench(lambda: legacy_parse(mm), args.repeat)
+            mm.close()
+
+            reader = HWiNFOSharedMemory(path)
+            reader.open()
+            numpy_us = bench(reader.read, args.repeat)
+            reader.close()
+
+            sensor = HWiNFOSensor()
+            asyncio.run(sensor.initialize(AppSettings(hwinfo_shm_path=path)))
+            readings_us = asyncio.run(bench_readings(sensor, max(1, args.repeat // 5)))
+            asyncio.run(sensor.close())
+            emulator.close()
+
+            print(f"{size:>8} | {legacy_us:>10.1f} | {numpy_us:>9.1f} | {readings_us:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
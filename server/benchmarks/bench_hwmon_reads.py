@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Compare hwmon polling: opening, reading and closing every sysfs attribute per
+poll versus HwmonSensor's persistent descriptors re-read with os.preadv, for
+fake sysfs trees of 50, 500 and 5,000 sensors.
+
+Usage (from the server directory):
+    python benchmarks/bench_hwmon_reads.py [--repeat N] [--sysfs-root /sys]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.config import AppSettings  # noqa: E402
+from app.sensors.hwmon_sensor import HwmonSensor  # noqa: E402
+
+SIZES = (50, 500, 5_000)
+PER_CHIP = 50
+
+
+def make_tree(root: str, sensor_count: int) -> None:
+    for start in range(0, sensor_count, PER_CHIP):
+        device = os.path.join(root, "class", "hwmon", f"hwmon{start // PER_CHIP}")
+        os.makedirs(device)
+        with open(os.path.join(device, "name"), "w") as f:
+            f.write(f"chip{start // PER_CHIP}\n")
+        for index in range(1, min(PER_CHIP, sensor_count - start) + 1):
+            with open(os.path.join(device, f"temp{index}_input"), "w") as f:
+                f.write(f"{40000 + index * 100}\n")
+
+
+def reopen_each_poll(paths) -> list:
+    values = []
+    for path in paths:
+        with open(path, "rb") as f:
+            values.append(int(f.read()) / 1000)
+    return values
+
+
+async def bench_sensor(sensor: HwmonSensor, repeat: int):
+    """Mean microseconds per poll: raw descriptor reads, and full readings."""
+    channels = sensor._channels
+    started = time.perf_counter()
+    for _ in range(repeat):
+        sensor._read_values(channels)
+    raw_us = (time.perf_counter() - started) / repeat * 1e6
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await sensor.get_current_data()
+    readings_us = (time.perf_counter() - started) / repeat * 1e6
+    return raw_us, readings_us
+
+
+def run(root: str, repeat: int, label) -> None:
+    sensor = HwmonSensor()
+    asyncio.run(sensor.initialize(AppSettings(hwmon_sysfs_root=root)))
+    paths = [channel.path for channel in sensor._channels]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        reopen_each_poll(paths)
+    reopen_us = (time.perf_counter() - started) / repeat * 1e6
+    raw_us, readings_us = asyncio.run(bench_sensor(sensor, repeat))
+    asyncio.run(sensor.close())
+    print(f"{label:>8} | {reopen_us:>10.1f} | {raw_us:>9.1f} | {readings_us:>11.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50, help="Polls per size")
+    parser.add_argument("--sysfs-root", help="Benchmark a real sysfs tree instead")
+    args = parser.parse_args()
+
+    print(f"{'sensors':>8} | {'reopen us':>10} | {'pread us':>9} | {'readings us':>11}")
+    if args.sysfs_root:
+        run(args.sysfs_root, args.repeat, "host")
+        return
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as root:
+            make_tree(root, size)
+            run(root, args.repeat, size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Measure MockSensor's synthetic load mode: value generation alone and full
+get_current_data() polls for 1,000 and 10,000 synthetic sensors.
+
+Usage (from the server directory):
+    python benchmarks/bench_mock_sensor.py [--repeat N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.config import AppSettings  # noqa: E402
+from app.sensors.mock_sensor import NUMPY_AVAILABLE, MockSensor  # noqa: E402
+
+SIZES = (1_000, 10_000)
+
+
+async def bench(size: int, repeat: int):
+    """Mean microseconds per tick: generation only, and a full poll."""
+    mock = MockSensor()
+    await mock.initialize(AppSettings(mock_sensor_count=size))
+    positions = list(range(size))
+
+    started = time.perf_counter()
+    for tick in range(repeat):
+        mock._generate_values(positions, float(tick))
+    generate_us = (time.perf_counter() - started) / repeat * 1e6
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await mock.get_current_data()
+    poll_us = (time.perf_counter() - started) / repeat * 1e6
+    return generate_us, poll_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10, help="Ticks per size")
+    args = parser.parse_args()
+
+    print(f"Value generation: {'numpy' if NUMPY_AVAILABLE else 'pure Python'}")
+    print(f"{'sensors':>8} | {'generate us':>11} | {'poll us':>10}")
+    for size in SIZES:
+        generate_us, poll_us = asyncio.run(bench(size, args.repeat))
+        print(f"{size:>8} | {generate_us:>11.1f} | {poll_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
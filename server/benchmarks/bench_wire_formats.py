@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Compare sensor_data wire formats: encode time and frame size of the JSON
+frame versus the columnar and binary frames for snapshots of 100, 1,000 and
+10,000 sensors.
+
+Usage (from the server directory):
+    python benchmarks/bench_wire_formats.py [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.models.reading import Reading  # noqa: E402
+from app.models.sensor import HardwareType, SensorCategory, SensorDefinition  # noqa: E402
+from app.services.binary_codec import BinaryEncoder  # noqa: E402
+from app.services.columnar_encoder import ColumnarEncoder  # noqa: E402
+from app.services.frame_encoder import ORJSON_AVAILABLE, SnapshotEncoder  # noqa: E402
+from app.services.snapshot_channel import SensorSnapshot  # noqa: E402
+
+SIZES = (100, 1_000, 10_000)
+
+
+_DEFINITIONS: Dict[int, List[SensorDefinition]] = {}
+
+
+def make_snapshot(version: int, sensor_count: int) -> SensorSnapshot:
+    definitions = _DEFINITIONS.get(sensor_count)
+    if definitions is None:
+        # Providers keep their definitions across polls
+        definitions = _DEFINITIONS[sensor_count] = [
+            SensorDefinition(
+                sensor_id=f"sensor_{i}",
+                name=f"Sensor {i}",
+                unit="°C",
+                source_id="bench",
+                category=SensorCategory.TEMPERATURE,
+                hardware_type=HardwareType.CPU,
+            )
+            for i in range(sensor_count)
+        ]
+    now = datetime.now()
+    readings = [
+        Reading(definition, round(random.uniform(20, 90), 2), now)
+        for definition in definitions
+    ]
+    return SensorSnapshot(
+        version=version,
+        readings={"bench": readings},
+        stale_sources=[],
+        collection_started=0.0,
+        collection_finished=0.0,
+    )
+
+
+def bench(encode, snapshots) -> float:
+    """Mean microseconds per encode; each snapshot is a new version."""
+    started = time.perf_counter()
+    for snapshot in snapshots:
+        encode(snapshot)
+    return (time.perf_counter() - started) / len(snapshots) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="Snapshots per size")
+    args = parser.parse_args()
+
+    print(f"JSON encoder: {'orjson' if ORJSON_AVAILABLE else 'json'}")
+    print(
+        f"{'sensors':>8} | {'json us':>10} {'json bytes':>11} | "
+        f"{'columnar us':>11} {'columnar bytes':>14} | "
+        f"{'binary us':>10} {'binary bytes':>12}"
+    )
+    for size in SIZES:
+        snapshots = [make_snapshot(version, size) for version in range(1, args.repeat + 1)]
+
+        json_encoder = SnapshotEncoder()
+        json_us = bench(json_encoder.encode, snapshots)
+        json_bytes = len(json_encoder.encode(snapshots[-1]).sensor_data)
+
+        columnar_encoder = ColumnarEncoder()
+        columnar_encoder.encode(snapshots[0])  # Dictionary is built once per stream
+        columnar_us = bench(columnar_encoder.encode, snapshots[1:] or snapshots)
+        columnar_bytes = len(columnar_encoder.encode(snapshots[-1]).text.encode("utf-8"))
+
+        binary_encoder = BinaryEncoder()
+        binary_encoder.encode(snapshots[0])  # Index table is built once per stream
+        binary_us = bench(binary_encoder.encode, snapshots[1:] or snapshots)
+        binary_bytes = len(binary_encoder.encode(snapshots[-1]).payload)
+
+        print(
+            f"{size:>8} | {json_us:>10.1f} {json_bytes:>11} | "
+            f"{columnar_us:>11.1f} {columnar_bytes:>14} | "
+            f"{binary_us:>10.1f} {binary_bytes:>12}"
+        )
+    dictionary_bytes = len(columnar_encoder.dictionary_message().encode("utf-8"))
+    index_bytes = len(binary_encoder.index_message().encode("utf-8"))
+    print(
+        f"One-off tables at {SIZES[-1]} sensors: sensor_dictionary "
+        f"{dictionary_bytes} bytes, sensor_index {index_bytes} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
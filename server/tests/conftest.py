@@ -1,7 +1,47 @@
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
 import pytest
 from httpx import AsyncClient, ASGITransport
 
 from app.main import app
+from app.models.reading import AnyReading
+from app.models.sensor import HardwareType, SensorCategory, SensorReading
+from app.services.snapshot_channel import SensorSnapshot
+
+TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_reading(sensor_id: str = "cpu_temp", value: float = 42.5, **fields) -> SensorReading:
+    """A CPU temperature reading from the mock source; `fields` override any field."""
+    fields = {
+        "name": sensor_id.upper(),
+        "unit": "°C",
+        "source": "mock",
+        "category": SensorCategory.TEMPERATURE,
+        "hardware_type": HardwareType.CPU,
+        "timestamp": TIMESTAMP,
+        **fields,
+    }
+    return SensorReading(sensor_id=sensor_id, value=value, **fields)
+
+
+def make_snapshot(
+    version: int,
+    readings: Sequence[AnyReading] = (),
+    timestamp: Optional[datetime] = None,
+) -> SensorSnapshot:
+    """A snapshot holding `readings` under the mock source."""
+    snapshot = SensorSnapshot(
+        version=version,
+        readings={"mock": list(readings)} if readings else {},
+        stale_sources=[],
+        collection_started=0.0,
+        collection_finished=0.0,
+    )
+    if timestamp is not None:
+        snapshot.timestamp = timestamp
+    return snapshot
 
 
 @pytest.fixture
@@ -9,3 +49,8 @@ async def async_client():
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
@@ -0,0 +1,44 @@
+"""Tests for the binary sensor_data codec."""
+
+import json
+import math
+from datetime import datetime, timezone
+
+from conftest import make_reading, make_snapshot
+
+from app.services.binary_codec import FRAME_HEADER, BinaryEncoder, decode_frame
+from app.services.snapshot_channel import SensorSnapshot
+
+
+def _snapshot(version: int, readings) -> SensorSnapshot:
+    return make_snapshot(
+        version, readings, timestamp=datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    )
+
+
+def test_frame_round_trips_values_in_index_order():
+    encoder = BinaryEncoder()
+    frame = encoder.encode(_snapshot(7, [make_reading("a", 1.5), make_reading("b", -2.25)]))
+
+    assert len(frame.payload) == FRAME_HEADER.size + 2 * 4
+    decoded = decode_frame(frame.payload)
+    assert decoded["sequence"] == 7
+    assert decoded["timestamp_ms"] == 1704110400000
+    assert decoded["values"] == [1.5, -2.25]
+
+    index = json.loads(encoder.index_message())
+    assert index["type"] == "sensor_index"
+    assert index["sensor_ids"] == ["a", "b"]
+    assert index["index_version"] == decoded["index_version"]
+
+
+def test_new_sensor_bumps_index_version_and_missing_values_are_nan():
+    encoder = BinaryEncoder()
+    first = encoder.encode(_snapshot(1, [make_reading("a", 1.0)]))
+    second = encoder.encode(_snapshot(2, [make_reading("b", 3.0)]))
+
+    assert second.index_version > first.index_version
+    values = decode_frame(second.payload)["values"]
+    assert math.isnan(values[0])
+    assert values[1] == 3.0
+    assert json.loads(encoder.index_message())["sensor_ids"] == ["a", "b"]
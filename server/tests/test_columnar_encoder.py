@@ -0,0 +1,55 @@
+"""Tests for the columnar JSON frame encoder."""
+
+import json
+
+from conftest import make_reading, make_snapshot
+
+from app.models.sensor import DataQuality, HardwareType, SensorCategory, SensorDefinition
+from app.services.columnar_encoder import ColumnarEncoder
+
+
+def test_ticks_carry_only_ids_and_values():
+    encoder = ColumnarEncoder()
+    frame = json.loads(
+        encoder.encode(make_snapshot(3, [make_reading("a", 1.5), make_reading("b", 2)])).text
+    )
+
+    assert frame["type"] == "sensor_columns"
+    assert frame["sequence"] == 3
+    assert frame["ids"] == ["a", "b"]
+    assert frame["values"] == [1.5, 2]
+    assert "status" not in frame and "quality" not in frame
+
+    dictionary = json.loads(encoder.dictionary_message())
+    assert dictionary["dictionary_version"] == frame["dictionary_version"]
+    assert dictionary["sensors"]["a"]["unit"] == "°C"
+    assert dictionary["sensors"]["a"]["category"] == "temperature"
+
+
+def test_dictionary_prefers_definitions_and_flags_degraded_readings():
+    definitions = {
+        "a": SensorDefinition(
+            sensor_id="a",
+            name="Package",
+            unit="°C",
+            category=SensorCategory.TEMPERATURE,
+            hardware_type=HardwareType.CPU,
+            source_id="mock",
+            description="CPU package temperature",
+            max_value=105.0,
+        )
+    }
+    encoder = ColumnarEncoder(definitions)
+    first = encoder.encode(make_snapshot(1, [make_reading("a", 40.0)]))
+    second = encoder.encode(
+        make_snapshot(
+            2, [make_reading("a", 41.0), make_reading("b", 1.0, quality=DataQuality.POOR)]
+        )
+    )
+
+    assert second.dictionary_version > first.dictionary_version
+    assert json.loads(second.text)["quality"] == {"b": "poor"}
+    entry = json.loads(encoder.dictionary_message())["sensors"]["a"]
+    assert entry["name"] == "Package"
+    assert entry["description"] == "CPU package temperature"
+    assert entry["max_value"] == 105.0
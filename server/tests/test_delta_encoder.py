@@ -0,0 +1,45 @@
+"""Tests for the delta-encoded sensor stream."""
+
+import json
+
+from conftest import make_reading, make_snapshot
+
+from app.services.delta_encoder import DeltaEncoder
+from app.services.frame_encoder import SnapshotEncoder
+from app.services.snapshot_channel import SensorSnapshot
+
+
+def _snapshot(version: int, values: dict) -> SensorSnapshot:
+    return make_snapshot(version, [make_reading(s, v) for s, v in values.items()])
+
+
+def _frame(delta: DeltaEncoder, snapshot: SensorSnapshot) -> dict:
+    frame = delta.encode(snapshot, SnapshotEncoder().encode(snapshot))
+    return json.loads(frame.text)
+
+
+def test_keyframe_then_only_changed_values():
+    delta = DeltaEncoder(keyframe_interval=10)
+
+    first = _frame(delta, _snapshot(1, {"a": 1.0, "b": 2.0}))
+    assert first["keyframe"] is True
+    assert first["sensor_index"] == ["a", "b"]
+    assert first["data"]["sources"]["mock"][1]["value"] == 2.0
+
+    second = _frame(delta, _snapshot(2, {"a": 1.0, "b": 3.0}))
+    assert second["type"] == "sensor_delta"
+    assert second["sequence"] == 2
+    assert second["base_sequence"] == 1
+    assert second["values"] == {"1": 3.0}
+
+
+def test_keyframe_interval_and_new_sensors_force_keyframes():
+    delta = DeltaEncoder(keyframe_interval=2)
+    assert _frame(delta, _snapshot(1, {"a": 1.0}))["keyframe"]
+    assert _frame(delta, _snapshot(2, {"a": 2.0}))["type"] == "sensor_delta"
+    assert _frame(delta, _snapshot(3, {"a": 3.0}))["keyframe"]
+
+    # A sensor that was not in the last keyframe's index table
+    frame = _frame(delta, _snapshot(4, {"a": 3.0, "c": 1.0}))
+    assert frame["keyframe"] is True
+    assert frame["sensor_index"] == ["a", "c"]
@@ -0,0 +1,53 @@
+"""Tests for the cached snapshot frame encoder."""
+
+import json
+
+from conftest import make_reading, make_snapshot
+
+from app.models.sensor import SensorDefinition
+from app.services.frame_encoder import SnapshotEncoder
+from app.services.subscriptions import ALL
+
+
+def test_snapshot_is_encoded_once_per_version():
+    encoder = SnapshotEncoder(cache_size=2)
+    snapshot = make_snapshot(1, [make_reading()])
+
+    first = encoder.encode(snapshot)
+    assert encoder.encode(snapshot) is first
+    # Broadcasts to default subscribers name the unfiltered view ALL
+    assert encoder.encode(snapshot, variant=ALL) is first
+    assert encoder.encode_count == 1
+    assert encoder.cache_hits == 2
+
+    encoder.encode(make_snapshot(2, [make_reading()]))
+    encoder.encode(make_snapshot(3, [make_reading()]))
+    assert encoder.get_stats()["cached_versions"] == [2, 3]
+
+
+def test_sensor_data_frame_matches_model_json():
+    snapshot = make_snapshot(7, [make_reading()])
+    encoded = SnapshotEncoder().encode(snapshot)
+
+    message = json.loads(encoded.sensor_data_text)
+    expected = [r.model_dump(mode="json") for r in snapshot.readings["mock"]]
+    assert message["type"] == "sensor_data"
+    assert message["data"]["sources"]["mock"] == expected
+    assert message["data"]["version"] == 7
+    assert message["data"]["total_sensors"] == 1
+    assert json.loads(encoded.sources) == {"mock": expected}
+
+
+def test_catalog_is_re_encoded_when_the_definitions_version_changes():
+    encoder = SnapshotEncoder()
+    definitions = {"cpu_temp": SensorDefinition(sensor_id="cpu_temp", name="CPU", source_id="mock")}
+    first = encoder.encode_catalog(definitions, 1)
+    assert encoder.encode_catalog(definitions, 1) is first
+
+    # Replaced in place, e.g. by a provider restart: same count, new contents
+    definitions["cpu_temp"] = SensorDefinition(
+        sensor_id="cpu_temp", name="CPU Package", source_id="mock"
+    )
+    catalog = json.loads(encoder.encode_catalog(definitions, 2))
+    assert catalog["data"][0]["name"] == "CPU Package"
+    assert encoder.catalog_encodes == 2
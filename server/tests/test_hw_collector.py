@@ -0,0 +1,37 @@
+"""Tests for the single-owner HardwareMonitor collector thread."""
+
+import threading
+
+import pytest
+
+from app.sensors.hw_collector import HardwareCollectorThread
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_requests_run_on_collector_thread():
+    collector = HardwareCollectorThread(name="test-collector")
+    collector.start()
+    try:
+        computer = await collector.open(lambda: {"owner": threading.current_thread().name})
+        assert computer["owner"] == "test-collector"
+
+        thread_name = await collector.submit(lambda _: threading.current_thread().name)
+        assert thread_name == "test-collector"
+        assert collector.get_stats()["requests_served"] == 2
+    finally:
+        await collector.stop()
+    assert not collector.is_running
+
+
+async def test_errors_propagate_to_caller():
+    collector = HardwareCollectorThread()
+    collector.start()
+    try:
+        def _boom(_):
+            raise ValueError("update failed")
+
+        with pytest.raises(ValueError, match="update failed"):
+            await collector.submit(_boom)
+    finally:
+        await collector.stop()
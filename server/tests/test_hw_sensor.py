@@ -0,0 +1,107 @@
+"""HWSensor handle-table tests against a fake LibreHardwareMonitor tree."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.sensors.hw_sensor import HWSensor
+
+
+def _sensor(name, sensor_type, value):
+    return SimpleNamespace(Name=name, SensorType=sensor_type, Value=value, Min=None, Max=None)
+
+
+class FakeHardware(SimpleNamespace):
+    updates = 0
+
+    def Update(self):
+        self.updates += 1
+
+
+class FakeComputer:
+    def __init__(self):
+        self.updates = 0
+        self.cpu_temp = _sensor("Core #1", "Temperature", 40.0)
+        self.cpu_load = _sensor("CPU Total", "Load", None)
+        self.superio = superio = FakeHardware(
+            Name="Nuvoton NCT6798D",
+            HardwareType="SuperIO",
+            Sensors=[_sensor("Fan #1", "Fan", 900.0)],
+            SubHardware=[],
+        )
+        self.Hardware = [
+            FakeHardware(
+                Name="Intel Core i7",
+                HardwareType="CPU",
+                Sensors=[self.cpu_temp, self.cpu_load],
+                SubHardware=[],
+            ),
+            FakeHardware(
+                Name="ASUS Board",
+                HardwareType="Motherboard",
+                Sensors=[],
+                SubHardware=[superio],
+            ),
+        ]
+
+    def Update(self):
+        self.updates += 1
+
+
+def test_discovery_builds_handle_table_once():
+    sensor = HWSensor()
+    computer = FakeComputer()
+
+    definitions = sensor._discover_sensors(computer)
+    assert [d.sensor_id for d in definitions] == [
+        "HardwareMonitor_Intel_Core_i7_Core_#1",
+        "HardwareMonitor_Intel_Core_i7_CPU_Total",
+        "HardwareMonitor_Nuvoton_NCT6798D_Fan_#1",
+    ]
+    assert definitions[0].unit == "°C"
+
+    handles = sensor._handles
+    computer.cpu_temp.Value = 55.0
+    readings = sensor._read_snapshot(computer)
+
+    assert sensor._handles is handles  # Not rebuilt on poll
+    assert [r.value for r in readings] == [55.0, 900.0]  # None values skipped
+    assert readings[0].min_value == 55.0
+    assert readings[1].parent_hardware == "Nuvoton NCT6798D"
+
+
+def test_poll_updates_only_hardware_owning_requested_sensors():
+    sensor = HWSensor()
+    computer = FakeComputer()
+    sensor._discover_sensors(computer)
+    cpu, board = computer.Hardware
+
+    readings = sensor._read_snapshot(computer, {"HardwareMonitor_Intel_Core_i7_Core_#1"})
+
+    assert [r.sensor_id for r in readings] == ["HardwareMonitor_Intel_Core_i7_Core_#1"]
+    assert computer.updates == 1  # Discovery only
+    assert (cpu.updates, board.updates, computer.superio.updates) == (1, 0, 0)
+    assert sensor.hardware_updates == 1
+    assert sensor.hardware_updates_skipped == 2
+
+    sensor._read_snapshot(computer)
+    assert (cpu.updates, board.updates, computer.superio.updates) == (2, 0, 1)
+
+
+class FailingCollector:
+    last_work_ms = 0.0
+
+    async def submit(self, func):
+        raise RuntimeError("Update() failed in the driver")
+
+
+@pytest.mark.anyio
+async def test_failed_poll_raises_and_resets_timings():
+    sensor = HWSensor()
+    sensor._initialized = sensor._available = True
+    sensor._collector = FailingCollector()
+    sensor._last_wait_ms = sensor._last_handoff_ms = 12.0
+
+    with pytest.raises(RuntimeError):
+        await sensor.get_current_data()
+    assert sensor._last_wait_ms == 0.0 and sensor._last_handoff_ms == 0.0
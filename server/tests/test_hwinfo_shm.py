@@ -0,0 +1,96 @@
+"""Tests for the HWiNFO shared-memory reader against an emulated segment."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.core.config import AppSettings  # noqa: E402
+from app.models.sensor import HardwareType, SensorCategory  # noqa: E402
+from app.sensors.hwinfo_emulator import HWiNFOEmulator  # noqa: E402
+from app.sensors.hwinfo_sensor import HWiNFOSensor  # noqa: E402
+from app.sensors.hwinfo_shm import HWiNFOSharedMemory  # noqa: E402
+
+pytestmark = pytest.mark.anyio
+
+SENSORS = [
+    (
+        "CPU [#0]: AMD Ryzen 7 5800X",
+        [("Core Temperature", "°C", 1, 45.0), ("CPU Package Power", "W", 5, 60.0)],
+    ),
+    ("GPU [#0]: NVIDIA GeForce RTX 3080", [("GPU Core Load", "%", 7, 12.0)]),
+]
+
+
+@pytest.fixture
+def segment(tmp_path):
+    path = str(tmp_path / "hwinfo.bin")
+    emulator = HWiNFOEmulator(path, SENSORS)
+    yield path, emulator
+    emulator.close()
+
+
+def test_reader_views_values_and_decodes_labels_once(segment):
+    path, emulator = segment
+    reader = HWiNFOSharedMemory(path)
+    try:
+        assert reader.open()
+        entries = reader.entries
+        assert [e.label for e in entries] == [
+            "Core Temperature",
+            "CPU Package Power",
+            "GPU Core Load",
+        ]
+        assert entries[0].unit == "°C" and entries[0].category == SensorCategory.TEMPERATURE
+        assert entries[2].hardware_type == HardwareType.GPU
+
+        emulator.set_values([50.0, 80.0, math.nan])
+        frame = reader.read()
+        assert frame.values[:2].tolist() == [50.0, 80.0]
+        assert math.isnan(frame.values[2])
+        assert frame.maximums[0] == 50.0 and frame.minimums[0] == 45.0
+        # Values change every poll, the layout does not
+        reader.read()
+        assert reader.get_stats()["layouts_decoded"] == 1
+    finally:
+        reader.close()
+
+
+def test_reader_redecodes_on_layout_change_and_stops_when_dead(segment):
+    path, emulator = segment
+    reader = HWiNFOSharedMemory(path)
+    try:
+        reader.open()
+        version = reader.layout_version
+        emulator.write_layout(SENSORS[:1])
+
+        frame = reader.read()
+        assert len(frame.values) == 2
+        assert reader.layout_version != version
+        assert [e.label for e in reader.entries] == ["Core Temperature", "CPU Package Power"]
+
+        emulator.mark_dead()
+        assert reader.read() is None
+    finally:
+        reader.close()
+
+
+async def test_hwinfo_sensor_reads_subset_from_configured_path(segment):
+    path, emulator = segment
+    sensor = HWiNFOSensor()
+    try:
+        assert await sensor.initialize(AppSettings(hwinfo_shm_path=path))
+        definitions = await sensor.get_available_sensors()
+        assert len(definitions) == 3
+        assert all(d.source_id == "HWiNFO64" for d in definitions)
+
+        emulator.set_values([51.0, 70.0, math.nan])
+        readings = await sensor.get_current_data()
+        assert [r.value for r in readings] == [51.0, 70.0]  # NaN readings are skipped
+
+        wanted = {definitions[1].sensor_id}
+        subset = await sensor.get_current_data_for(wanted)
+        assert [r.sensor_id for r in subset] == [definitions[1].sensor_id]
+    finally:
+        await sensor.close()
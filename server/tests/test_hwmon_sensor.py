@@ -0,0 +1,87 @@
+"""Tests for the Linux hwmon/thermal provider against a fake sysfs tree."""
+
+import os
+
+import pytest
+
+from app.core.config import AppSettings
+from app.models.sensor import HardwareType, SensorCategory
+from app.sensors.hwmon_sensor import HwmonSensor
+
+pytestmark = pytest.mark.anyio
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def sysfs(tmp_path):
+    root = tmp_path / "sys"
+    cpu = root / "class" / "hwmon" / "hwmon0"
+    _write(cpu / "name", "coretemp\n")
+    _write(cpu / "temp1_input", "45000\n")
+    _write(cpu / "temp1_label", "Package id 0\n")
+    _write(cpu / "temp2_input", "43500\n")
+    board = root / "class" / "hwmon" / "hwmon1"
+    _write(board / "name", "nct6775\n")
+    _write(board / "fan1_input", "1200\n")
+    _write(board / "in0_input", "1104\n")
+    _write(board / "power1_average", "65000000\n")
+    _write(board / "pwm1", "255\n")
+    _write(board / "temp1_max", "90000\n")  # Limits are not readings
+    zone = root / "class" / "thermal" / "thermal_zone0"
+    _write(zone / "type", "x86_pkg_temp\n")
+    _write(zone / "temp", "47000\n")
+    return root
+
+
+async def test_discovers_and_scales_sysfs_attributes(sysfs):
+    sensor = HwmonSensor()
+    try:
+        assert await sensor.initialize(AppSettings(hwmon_sysfs_root=str(sysfs)))
+        definitions = {d.sensor_id: d for d in await sensor.get_available_sensors()}
+        assert set(definitions) == {
+            "hwmon_coretemp_temp1",
+            "hwmon_coretemp_temp2",
+            "hwmon_nct6775_fan1",
+            "hwmon_nct6775_in0",
+            "hwmon_nct6775_power1",
+            "hwmon_nct6775_pwm1",
+            "hwmon_thermal_zone0",
+        }
+        assert definitions["hwmon_coretemp_temp1"].name == "Package id 0"
+        assert definitions["hwmon_coretemp_temp1"].hardware_type == HardwareType.CPU
+        assert definitions["hwmon_nct6775_fan1"].category == SensorCategory.FAN
+
+        values = {r.sensor_id: r.value for r in await sensor.get_current_data()}
+        assert values["hwmon_coretemp_temp1"] == 45.0
+        assert values["hwmon_nct6775_in0"] == 1.104
+        assert values["hwmon_nct6775_power1"] == 65.0
+        assert values["hwmon_nct6775_pwm1"] == 100.0
+        assert values["hwmon_thermal_zone0"] == 47.0
+    finally:
+        await sensor.close()
+
+
+async def test_rereads_open_descriptors_and_reads_subsets(sysfs):
+    sensor = HwmonSensor()
+    try:
+        await sensor.initialize(AppSettings(hwmon_sysfs_root=str(sysfs)))
+        # sysfs files are rewritten in place; the open descriptor sees it
+        with open(sysfs / "class" / "hwmon" / "hwmon0" / "temp1_input", "r+") as f:
+            f.write("51250\n")
+
+        readings = await sensor.get_current_data_for({"hwmon_coretemp_temp1", "unknown"})
+        assert [(r.sensor_id, r.value) for r in readings] == [("hwmon_coretemp_temp1", 51.25)]
+        assert sensor.get_source_info()["sysfs"]["open_files"] == 7
+    finally:
+        await sensor.close()
+
+
+async def test_unavailable_without_sensors(tmp_path):
+    sensor = HwmonSensor()
+    assert not await sensor.initialize(AppSettings(hwmon_sysfs_root=str(tmp_path)))
+    assert not await sensor.is_available()
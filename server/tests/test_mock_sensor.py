@@ -0,0 +1,42 @@
+"""Tests for MockSensor's fixed sensors and synthetic load mode."""
+
+import pytest
+
+from app.core.config import AppSettings
+from app.sensors.mock_sensor import MockSensor
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_fixed_sensors_by_default():
+    mock = MockSensor()
+    await mock.initialize(AppSettings())
+    readings = await mock.get_current_data()
+    assert len(readings) == 8
+    assert {r.sensor_id for r in readings} >= {"cpu_temp", "gpu_fan_speed"}
+
+
+async def test_synthetic_mode_generates_n_bounded_sensors():
+    mock = MockSensor()
+    await mock.initialize(AppSettings(mock_sensor_count=2_000))
+    definitions = await mock.get_available_sensors()
+    assert len({d.sensor_id for d in definitions}) == 2_000
+    assert len({d.category for d in definitions}) >= 8
+    assert len({d.hardware_type for d in definitions}) >= 6
+
+    bounds = {d.sensor_id: (d.min_value, d.max_value) for d in definitions}
+    readings = await mock.get_current_data()
+    assert len(readings) == 2_000
+    for reading in readings:
+        low, high = bounds[reading.sensor_id]
+        assert low <= reading.value <= high
+    fans = [r for r in readings if r.sensor_id.startswith("gpu_fan_speed_")]
+    assert fans and all(isinstance(r.value, int) for r in fans)
+
+
+async def test_synthetic_mode_reads_subsets():
+    mock = MockSensor()
+    await mock.initialize(AppSettings(mock_sensor_count=100))
+    wanted = {"cpu_temp_3", "net_throughput_0", "missing"}
+    readings = await mock.get_current_data_for(wanted)
+    assert [r.sensor_id for r in readings] == ["net_throughput_0", "cpu_temp_3"]
@@ -0,0 +1,63 @@
+"""Tests for per-category polling schedules."""
+
+import pytest
+
+from app.models.sensor import SensorCategory, SensorDefinition, SensorReading
+from app.services.polling_schedule import PollingSchedule
+
+
+def _definition(sensor_id: str, category: SensorCategory) -> SensorDefinition:
+    return SensorDefinition(
+        sensor_id=sensor_id, name=sensor_id, source_id="mock", category=category
+    )
+
+
+def _schedule(**kwargs) -> PollingSchedule:
+    schedule = PollingSchedule(default_interval=5, **kwargs)
+    schedule.register_definitions(
+        [
+            _definition("cpu_load", SensorCategory.LOAD),
+            _definition("cpu_temp", SensorCategory.TEMPERATURE),
+        ]
+    )
+    return schedule
+
+
+def test_each_category_is_polled_on_its_own_cadence():
+    schedule = _schedule()
+    assert schedule.tick_interval == 1.0
+
+    polled = {t: schedule.take_due(float(t)).get("mock", set()) for t in range(7)}
+
+    assert [t for t, due in polled.items() if "cpu_load" in due] == list(range(7))
+    assert [t for t, due in polled.items() if "cpu_temp" in due] == [0, 3, 6]
+    assert schedule.get_stats()["sensor_reads_saved"] == 4
+
+
+def test_settings_overrides_take_precedence():
+    schedule = _schedule(
+        category_intervals={"temperature": 10}, sensor_intervals={"cpu_load": 0.5}
+    )
+    assert schedule.interval_for("cpu_temp", "temperature") == 10
+    assert schedule.interval_for("cpu_load", "load") == 0.5
+    assert schedule.interval_for("other", "unknown") == 5
+    assert schedule.tick_interval == 0.5
+
+    with pytest.raises(ValueError):
+        PollingSchedule(default_interval=5, category_intervals={"bogus": 1})
+
+
+def test_adaptive_cadence_stretches_for_quiet_sensors():
+    schedule = _schedule(adaptive=True, max_factor=4.0)
+    for value in (50.0, 50.0, 50.0, 50.0, 50.0):
+        schedule.observe(
+            [SensorReading(sensor_id="cpu_temp", name="t", value=value, source="mock")]
+        )
+    for value in (10.0, 90.0, 10.0, 90.0):
+        schedule.observe(
+            [SensorReading(sensor_id="cpu_load", name="l", value=value, source="mock")]
+        )
+
+    factors = schedule.get_stats()["interval_factor"]
+    assert factors["max"] == 4.0
+    assert factors["min"] == 0.5
@@ -0,0 +1,54 @@
+"""Tests for the background process metrics sampler."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.process_metrics import ProcessMetricsSampler
+from app.services.snapshot_channel import SnapshotChannel
+from app.models.sensor import SourceStatistics
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeSensorManager:
+    def __init__(self):
+        self.snapshots = SnapshotChannel()
+
+    def get_source_statistics(self):
+        return {
+            "a": SourceStatistics(
+                total_sensors=10, active_sensors=8, update_count=9, error_count=1
+            ),
+            "b": SourceStatistics(total_sensors=2, active_sensors=0, stale=True),
+        }
+
+
+async def test_sample_populates_performance_metrics():
+    sampler = ProcessMetricsSampler(sensor_manager=FakeSensorManager())
+    metrics = await sampler.sample()
+
+    assert metrics.memory_usage > 0
+    assert metrics.thread_count >= 1
+    assert metrics.open_files >= 1
+    assert metrics.sensor_count == 12
+    assert metrics.active_sensors == 8
+    assert metrics.error_rate == pytest.approx(10.0)
+    assert metrics.data_quality_score == pytest.approx(50.0)
+    assert sampler.metrics is metrics
+
+
+async def test_loop_lag_probe_detects_blocking():
+    sampler = ProcessMetricsSampler(sample_interval=10.0, lag_interval=0.01)
+    await sampler.start()
+    try:
+        await asyncio.sleep(0.03)
+        time.sleep(0.1)  # Block the event loop
+        await asyncio.sleep(0.03)
+        stats = sampler.get_stats()
+    finally:
+        await sampler.stop()
+
+    assert not sampler.is_running
+    assert stats["rolling"]["event_loop_lag_ms"]["max"] >= 50
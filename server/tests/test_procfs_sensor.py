@@ -0,0 +1,201 @@
+"""Tests for the procfs load provider against fixture files."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.core.config import AppSettings  # noqa: E402
+from app.sensors.procfs_sensor import ProcfsSensor  # noqa: E402
+
+pytestmark = pytest.mark.anyio
+
+NET_HEADER = (
+    "Inter-|   Receive                            |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets\n"
+)
+
+
+def write_proc(root, cpu_rows, disk_sectors, net_bytes, available_kb=4194304):
+    (root / "net").mkdir(parents=True, exist_ok=True)
+    (root / "stat").write_text(
+        "".join(f"{name} {' '.join(map(str, row))} 0 0\n" for name, row in cpu_rows)
+        + "intr 12345\nctxt 678\n"
+    )
+    (root / "meminfo").write_text(
+        f"MemTotal:        8388608 kB\nMemFree:   1000 kB\n"
+        f"MemAvailable:    {available_kb} kB\nSwapTotal:       0 kB\nSwapFree: 0 kB\n"
+    )
+    (root / "diskstats").write_text(
+        "   7       0 loop0 1 0 8 0 0 0 0 0 0 0 0\n"
+        f"   8       0 sda 10 0 {disk_sectors[0]} 5 20 0 {disk_sectors[1]} 9 0 14 14\n"
+        f"   8       1 sda1 10 0 {disk_sectors[0]} 5 20 0 {disk_sectors[1]} 9 0 14 14\n"
+    )
+    (root / "net" / "dev").write_text(
+        NET_HEADER
+        + "    lo: 999 9 0 0 0 0 0 0 999 9 0 0 0 0 0 0\n"
+        + f"  eth0: {net_bytes[0]} 10 0 0 0 0 0 0 {net_bytes[1]} 10 0 0 0 0 0 0\n"
+    )
+
+
+@pytest.fixture
+def proc(tmp_path):
+    write_proc(
+        tmp_path,
+        [
+            ("cpu", [200, 0, 100, 700, 0, 0, 0, 0]),
+            ("cpu0", [100, 0, 50, 350, 0, 0, 0, 0]),
+            ("cpu1", [100, 0, 50, 350, 0, 0, 0, 0]),
+        ],
+        disk_sectors=(1000, 2000),
+        net_bytes=(10_000, 5_000),
+    )
+    return tmp_path
+
+
+async def _sensor(proc, clock):
+    sensor = ProcfsSensor()
+    sensor._clock = lambda: clock[0]
+    settings = AppSettings(procfs_root=str(proc), procfs_sysfs_root=str(proc / "sys"))
+    assert await sensor.initialize(settings)
+    return sensor
+
+
+async def test_definitions_cover_cores_memory_disks_and_interfaces(proc):
+    sensor = await _sensor(proc, [0.0])
+    ids = [d.sensor_id for d in await sensor.get_available_sensors()]
+    assert ids == [
+        "procfs_cpu_total_usage",
+        "procfs_cpu0_usage",
+        "procfs_cpu1_usage",
+        "procfs_memory_usage",
+        "procfs_memory_used",
+        "procfs_memory_available",
+        "procfs_disk_sda_read",  # loop devices and partitions are skipped
+        "procfs_disk_sda_write",
+        "procfs_net_eth0_rx",  # and so is loopback
+        "procfs_net_eth0_tx",
+    ]
+
+
+async def test_counters_become_per_core_load_and_rates(proc):
+    clock = [10.0]
+    sensor = await _sensor(proc, clock)
+    clock[0] = 12.0
+    # cpu0 busy 75 of 100 jiffies, cpu1 busy 25 of 100
+    write_proc(
+        proc,
+        [
+            ("cpu", [300, 0, 100, 800, 0, 0, 0, 0]),
+            ("cpu0", [175, 0, 50, 375, 0, 0, 0, 0]),
+            ("cpu1", [125, 0, 50, 425, 0, 0, 0, 0]),
+        ],
+        disk_sectors=(1000 + 4096, 2000 + 8),
+        net_bytes=(10_000 + 2_000, 5_000 + 600),
+        available_kb=2097152,
+    )
+
+    values = {r.sensor_id: r.value for r in await sensor.get_current_data()}
+    assert values["procfs_cpu0_usage"] == 75.0
+    assert values["procfs_cpu1_usage"] == 25.0
+    assert values["procfs_cpu_total_usage"] == 50.0
+    assert values["procfs_memory_usage"] == 75.0
+    assert values["procfs_memory_available"] == 2.0
+    assert values["procfs_disk_sda_read"] == 4096 * 512 / 2
+    assert values["procfs_disk_sda_write"] == 8 * 512 / 2
+    assert values["procfs_net_eth0_rx"] == 1000.0
+    assert values["procfs_net_eth0_tx"] == 300.0
+
+    subset = await sensor.get_current_data_for({"procfs_cpu1_usage"})
+    assert [r.sensor_id for r in subset] == ["procfs_cpu1_usage"]
+
+
+async def test_back_to_back_reads_reuse_the_last_rates(proc):
+    clock = [0.0]
+    sensor = await _sensor(proc, clock)
+
+    # Straight after the baseline there is no load to report yet
+    clock[0] = 0.003
+    first = {r.sensor_id: r.value for r in await sensor.get_current_data()}
+    assert "procfs_cpu_total_usage" not in first
+    assert first["procfs_memory_usage"] == 50.0
+
+    clock[0] = 2.0
+    write_proc(
+        proc,
+        [
+            ("cpu", [300, 0, 100, 800, 0, 0, 0, 0]),
+            ("cpu0", [175, 0, 50, 375, 0, 0, 0, 0]),
+            ("cpu1", [125, 0, 50, 425, 0, 0, 0, 0]),
+        ],
+        disk_sectors=(1000, 2000),
+        net_bytes=(10_000, 5_000),
+    )
+    rates = {r.sensor_id: r.value for r in await sensor.get_current_data()}
+    assert rates["procfs_cpu_total_usage"] == 50.0
+
+    # Counters move again, but only milliseconds later: same values, same baseline
+    clock[0] = 2.004
+    write_proc(
+        proc,
+        [
+            ("cpu", [302, 0, 100, 800, 0, 0, 0, 0]),
+            ("cpu0", [176, 0, 50, 375, 0, 0, 0, 0]),
+            ("cpu1", [126, 0, 50, 425, 0, 0, 0, 0]),
+        ],
+        disk_sectors=(1000, 2000),
+        net_bytes=(10_000, 5_000),
+    )
+    again = {r.sensor_id: r.value for r in await sensor.get_current_data()}
+    assert again == rates
+    assert sensor._previous.time == 2.0
+
+
+async def test_device_set_change_rebuilds_definitions(proc):
+    clock = [0.0]
+    sensor = await _sensor(proc, clock)
+    clock[0] = 1.0
+    write_proc(
+        proc,
+        [("cpu", [200, 0, 100, 700, 0, 0, 0, 0]), ("cpu0", [100, 0, 50, 350, 0, 0, 0, 0])],
+        disk_sectors=(1000, 2000),
+        net_bytes=(10_000, 5_000),
+    )
+    version = sensor.definitions_version
+    # No previous counters for the new layout: nothing this poll
+    assert await sensor.get_current_data() == []
+    assert sensor.definitions_version == version + 1
+    assert "procfs_cpu1_usage" not in {d.sensor_id for d in await sensor.get_available_sensors()}
+    clock[0] = 2.0
+    assert await sensor.get_current_data()
+
+
+async def test_unavailable_without_procfs(tmp_path):
+    sensor = ProcfsSensor()
+    assert not await sensor.initialize(AppSettings(procfs_root=str(tmp_path)))
+
+
+def _disk_ids(sensor):
+    return [d.sensor_id[len("procfs_disk_"):-len("_read")]
+            for d in sensor._definitions if d.sensor_id.endswith("_read")]
+
+
+async def test_partitions_are_told_apart_by_naming_scheme(proc):
+    names = ["sda", "sda1", "nvme0n1", "nvme0n1p1", "nvme0n10", "dm-1", "dm-10"]
+    (proc / "diskstats").write_text(
+        "".join(f"   8       0 {name} 1 0 8 0 0 0 8 0 0 0 0\n" for name in names)
+    )
+    sensor = await _sensor(proc, [0.0])
+    assert _disk_ids(sensor) == ["sda", "nvme0n1", "nvme0n10", "dm_1", "dm_10"]
+
+
+async def test_sysfs_decides_what_is_a_partition(proc):
+    (proc / "diskstats").write_text(
+        "   8       0 md1 1 0 8 0 0 0 8 0 0 0 0\n"
+        "   8       1 md12 1 0 8 0 0 0 8 0 0 0 0\n"
+    )
+    block = proc / "sys" / "class" / "block"
+    (block / "md1").mkdir(parents=True)
+    (block / "md12").mkdir()
+    (block / "md12" / "partition").write_text("2\n")
+    sensor = await _sensor(proc, [0.0])
+    assert _disk_ids(sensor) == ["md1"]
@@ -0,0 +1,120 @@
+"""Tests for detecting hung providers and restarting them."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.config import AppSettings
+from app.models.sensor import SensorReading
+from app.services.sensor_manager import SensorManager
+
+pytestmark = pytest.mark.anyio
+
+
+class HangingProvider:
+    """Hangs on every read until restarted; fails restarts while `broken`."""
+
+    source_id = "flaky"
+    display_name = "Flaky"
+
+    def __init__(self):
+        self.hung = True
+        self.broken = False
+        self.restarts = 0
+
+    async def is_available(self) -> bool:
+        return True
+
+    async def get_current_data(self):
+        if self.hung:
+            await asyncio.sleep(3600)
+        return [SensorReading(sensor_id="flaky_value", name="Value", value=1.0, source="flaky")]
+
+    async def get_available_sensors(self):
+        return []
+
+    async def restart(self, settings) -> bool:
+        self.restarts += 1
+        self.hung = self.broken
+        return not self.broken
+
+
+def _manager(provider) -> SensorManager:
+    manager = SensorManager(
+        AppSettings(
+            sensor_provider_timeout_seconds=0.01,
+            sensor_watchdog_deadline_seconds=0.05,
+            sensor_watchdog_backoff_seconds=0.2,
+        )
+    )
+    manager.sensor_providers.append(provider)
+    return manager
+
+
+async def test_hung_provider_is_restarted_and_reported():
+    provider = HangingProvider()
+    manager = _manager(provider)
+    events = []
+
+    async def listener(event):
+        events.append(event)
+
+    manager.status_listeners.append(listener)
+    watchdog = manager.watchdog
+
+    await manager._collect_data_once()
+    assert manager.is_source_stale("flaky")
+    assert watchdog.hung_providers(time.monotonic()) == []
+    await asyncio.sleep(0.06)
+    await manager._collect_data_once()
+    assert watchdog.hung_providers(time.monotonic()) == ["flaky"]
+
+    assert await watchdog.restart(provider)
+    await manager._collect_data_once()
+
+    assert provider.restarts == 1
+    assert not manager.is_source_stale("flaky")
+    assert [e["status"] for e in events] == ["restarting", "restarted", "recovered"]
+    assert watchdog.get_stats()["providers"]["flaky"]["attempt"] == 0
+
+
+async def test_failed_restarts_back_off_exponentially():
+    provider = HangingProvider()
+    provider.broken = True
+    manager = _manager(provider)
+    watchdog = manager.watchdog
+
+    await manager._collect_data_once()
+    assert not await watchdog.restart(provider)
+    first = watchdog.get_stats()["providers"]["flaky"]["next_attempt_in_seconds"]
+    assert not await watchdog.restart(provider)
+    second = watchdog.get_stats()["providers"]["flaky"]["next_attempt_in_seconds"]
+
+    assert first == pytest.approx(0.2, abs=0.05)
+    assert second == pytest.approx(0.4, abs=0.05)
+    # Still inside the backoff window, even though it is past the deadline
+    await asyncio.sleep(0.06)
+    assert watchdog.hung_providers(time.monotonic()) == []
+    assert manager.is_source_stale("flaky")
+
+
+async def test_restarted_provider_is_not_restarted_again_without_reads():
+    provider = HangingProvider()
+    manager = _manager(provider)
+    watchdog = manager.watchdog
+
+    await manager._collect_data_once()
+    await asyncio.sleep(0.06)
+    assert watchdog.hung_providers(time.monotonic()) == ["flaky"]
+    assert await watchdog.restart(provider)
+
+    # No reads while idle or paused: past deadline and backoff, still left alone
+    await asyncio.sleep(0.3)
+    assert watchdog.hung_providers(time.monotonic()) == []
+
+    # A read that fails again re-arms detection
+    provider.hung = True
+    await manager._collect_data_once()
+    await asyncio.sleep(0.06)
+    assert watchdog.hung_providers(time.monotonic()) == ["flaky"]
@@ -0,0 +1,66 @@
+"""Tests for the lightweight Reading and its model/wire equivalence."""
+
+import json
+from datetime import datetime, timezone
+
+from app.models.reading import Reading, to_model
+from app.models.sensor import SensorDefinition, SensorReading, SensorStatus
+from app.services.frame_encoder import SnapshotEncoder
+from app.services.sensor_history import SensorHistoryStore
+from app.services.snapshot_channel import SensorSnapshot
+
+DEFINITION = SensorDefinition(
+    sensor_id="cpu_temp",
+    name="CPU Temp",
+    unit="°C",
+    category="temperature",
+    hardware_type="cpu",
+    source_id="mock",
+    min_value=20.0,
+    max_value=95.0,
+    metadata={"hardware_name": "CPU Package", "hardware_id": "not a metadata field"},
+)
+TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def test_reading_reads_static_fields_through_its_definition():
+    reading = Reading(DEFINITION, 42.5, TIMESTAMP, max_value=61.0)
+    assert (reading.sensor_id, reading.name, reading.unit, reading.source) == (
+        "cpu_temp",
+        "CPU Temp",
+        "°C",
+        "mock",
+    )
+    assert (reading.min_value, reading.max_value) == (20.0, 61.0)
+
+    model = to_model(reading)
+    assert isinstance(model, SensorReading)
+    assert model.value == 42.5 and model.category == "temperature"
+    assert model.metadata.hardware_name == "CPU Package"
+
+
+def test_encoded_readings_match_their_models():
+    readings = [
+        Reading(DEFINITION, 42.5, TIMESTAMP, parent_hardware="CPU Package"),
+        Reading(DEFINITION, 43.0, TIMESTAMP, SensorStatus.ERROR),
+    ]
+    snapshot = SensorSnapshot(
+        version=1,
+        readings={"mock": readings},
+        stale_sources=[],
+        collection_started=0.0,
+        collection_finished=0.0,
+    )
+    sources = json.loads(SnapshotEncoder().encode(snapshot).sources)
+    assert sources == {"mock": [r.to_model().model_dump(mode="json") for r in readings]}
+
+
+def test_history_builds_models_from_readings():
+    store = SensorHistoryStore(capacity=4)
+    store.record([Reading(DEFINITION, 40.0, TIMESTAMP)])
+    store.record([Reading(DEFINITION, 41.0, TIMESTAMP.replace(second=1))])
+
+    history = store.get_history("cpu_temp", limit=5)
+    assert all(isinstance(r, SensorReading) for r in history)
+    assert [r.value for r in history] == [41.0, 40.0]
+    assert history[0].timestamp == TIMESTAMP.replace(second=1)
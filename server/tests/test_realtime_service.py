@@ -0,0 +1,166 @@
+"""Tests for the initial state and stream resumption for connecting clients."""
+
+import asyncio
+import json
+
+import pytest
+
+from conftest import make_reading, make_snapshot
+
+from app.models.sensor import SensorDefinition
+from app.services.realtime_service import RealTimeService
+from app.services.replay_buffer import ReplayBuffer
+from app.services.snapshot_channel import SnapshotChannel
+from app.services.subscriptions import ALL
+from app.websocket_manager import WebSocketManager
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        self.sent.append(json.loads(message))
+
+    async def send_bytes(self, message):
+        self.sent.append(message)
+
+
+class FakeSensorManager:
+    def __init__(self):
+        self.snapshots = SnapshotChannel()
+        self.definitions_version = 1
+        self.definitions = {
+            "cpu_temp": SensorDefinition(
+                sensor_id="cpu_temp", name="CPU Temp", unit="°C", source_id="mock"
+            )
+        }
+
+    def get_sensor_definition_map(self):
+        return self.definitions
+
+    async def get_latest_snapshot(self):
+        raise AssertionError("connecting must not trigger a collection")
+
+
+async def _connect(service, frame_format="full", resume_from=None, stream_id=None):
+    websocket = RecordingWebSocket()
+    await service.websocket_manager.connect(websocket, "client", frame_format=frame_format)
+    await service.send_initial_state(websocket, resume_from, stream_id)
+    await asyncio.sleep(0)
+    return websocket
+
+
+async def test_new_client_gets_catalog_and_cached_latest_snapshot():
+    sensor_manager = FakeSensorManager()
+    service = RealTimeService(sensor_manager, WebSocketManager())
+    sensor_manager.snapshots.publish(make_snapshot(5, [make_reading()]))
+
+    first = await _connect(service)
+    second = await _connect(service)
+
+    types = [message["type"] for message in first.sent]
+    assert types == ["connection_established", "sensor_definitions", "sensor_data"]
+    assert first.sent[1]["data"][0]["sensor_id"] == "cpu_temp"
+    assert first.sent[2]["data"]["version"] == 5
+    assert second.sent[1:] == first.sent[1:]
+
+    stats = service.snapshot_encoder.get_stats()
+    assert stats["encode_count"] == 1 and stats["catalog_encodes"] == 1
+    assert service.initial_snapshots_sent == 2
+
+
+async def test_delta_client_starts_from_keyframe_without_a_snapshot_yet():
+    sensor_manager = FakeSensorManager()
+    service = RealTimeService(sensor_manager, WebSocketManager())
+
+    client = await _connect(service, frame_format="delta")
+    assert [message["type"] for message in client.sent] == [
+        "connection_established",
+        "sensor_definitions",
+    ]
+    assert service.initial_snapshots_missed == 1
+
+    sensor_manager.snapshots.publish(make_snapshot(1, [make_reading()]))
+    second = await _connect(service, frame_format="delta")
+    assert second.sent[-1]["keyframe"] is True
+
+
+def _service_with_history(versions, capacity=120):
+    sensor_manager = FakeSensorManager()
+    service = RealTimeService(sensor_manager, WebSocketManager())
+    service.replay_buffer = ReplayBuffer(capacity)
+    for version in versions:
+        snapshot = make_snapshot(version, [make_reading(value=float(version))])
+        sensor_manager.snapshots.publish(snapshot)
+        service.replay_buffer.record(snapshot)
+    return service
+
+
+async def test_resume_replays_only_missed_frames():
+    service = _service_with_history(range(1, 6))
+    client = await _connect(service, resume_from=2)
+
+    resume = client.sent[2]
+    assert resume["event"] == "resume"
+    assert resume["data"]["resumed"] is True
+    assert resume["data"]["replayed"] == 3
+    assert [m["sequence_number"] for m in client.sent[3:]] == [3, 4, 5]
+
+
+async def test_resume_past_the_buffer_falls_back_to_latest_snapshot():
+    service = _service_with_history(range(1, 6), capacity=2)
+    stream_id = service.sensor_manager.snapshots.stream_id
+
+    stale = await _connect(service, resume_from=1, stream_id=stream_id)
+    other_stream = await _connect(service, resume_from=4, stream_id="restarted")
+
+    for client in (stale, other_stream):
+        assert client.sent[2]["data"]["resumed"] is False
+        assert client.sent[3]["type"] == "sensor_data"
+        assert client.sent[3]["sequence_number"] == 5
+    assert service.resumes_failed == 2
+
+
+async def test_delta_resume_replays_a_chain_of_deltas():
+    service = _service_with_history([1])
+    await _connect(service, frame_format="delta")  # Establishes the sensor index
+    for version in (2, 3):
+        snapshot = make_snapshot(version, [make_reading(value=float(version))])
+        service.sensor_manager.snapshots.publish(snapshot)
+        service.replay_buffer.record(snapshot)
+
+    client = await _connect(service, frame_format="delta", resume_from=1)
+    replayed = client.sent[3:]
+    assert [(m["sequence"], m["base_sequence"]) for m in replayed] == [(2, 1), (3, 2)]
+    assert replayed[-1]["values"] == {"0": 3.0}
+    assert client.sent[2]["data"]["sensor_index"] == ["cpu_temp"]
+
+
+async def test_delta_streams_keep_their_own_sensor_index():
+    service = RealTimeService(FakeSensorManager(), WebSocketManager())
+    gpu = make_reading("gpu_load", 1, hardware_type="gpu")
+
+    def snapshot(version):
+        return make_snapshot(version, [make_reading(value=float(version)), gpu])
+
+    cpu_only = ALL.add(sensor_ids=["cpu_temp"])
+    gpu_only = ALL.add(sensor_ids=["gpu_load"])
+
+    def encode(subscription, version):
+        view = subscription.apply(snapshot(version))
+        encoded = service.snapshot_encoder.encode(view, variant=subscription)
+        return service._delta_encoder(subscription).encode(view, encoded)
+
+    keyframe = json.loads(encode(cpu_only, 1).text)
+    assert keyframe["sensor_index"] == ["cpu_temp"]
+    assert not encode(cpu_only, 2).keyframe
+
+    # A stream for other sensors starting up leaves this one on deltas
+    assert json.loads(encode(gpu_only, 3).text)["sensor_index"] == ["gpu_load"]
+    assert not encode(cpu_only, 3).keyframe
@@ -0,0 +1,33 @@
+"""Unit tests for the ring-buffer backed sensor history store."""
+
+from datetime import datetime, timedelta, timezone
+
+from conftest import make_reading
+
+from app.services.sensor_history import SensorHistoryStore, SensorRingBuffer
+
+
+def test_ring_buffer_wraps_and_returns_newest_first():
+    buffer = SensorRingBuffer(capacity=3)
+    for i in range(5):
+        buffer.append(float(i), float(i * 10))
+
+    assert len(buffer) == 3
+    assert buffer.latest(10) == [(4.0, 40.0), (3.0, 30.0), (2.0, 20.0)]
+    assert buffer.latest(1) == [(4.0, 40.0)]
+
+
+def test_history_store_rebuilds_readings():
+    store = SensorHistoryStore(capacity=2)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(3):
+        reading = make_reading(
+            value=40.0 + i, name="CPU Temp", timestamp=start + timedelta(seconds=i)
+        )
+        store.record([reading])
+
+    history = store.get_history("cpu_temp", limit=10)
+    assert [r.value for r in history] == [42.0, 41.0]
+    assert history[0].timestamp == start + timedelta(seconds=2)
+    assert history[0].name == "CPU Temp"
+    assert store.get_history("missing", limit=5) == []
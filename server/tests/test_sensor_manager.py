@@ -0,0 +1,276 @@
+"""SensorManager collection tests using in-process fake providers."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.config import AppSettings
+from app.models.sensor import SensorDefinition, SensorReading
+from app.sensors.mock_sensor import MockSensor
+from app.sensors.remote_sensor import RemoteSensor
+from app.services.sensor_manager import SensorManager
+from app.services.subscriptions import Subscription
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeProvider:
+    def __init__(self, source_id: str, delay: float = 0.0):
+        self.source_id = source_id
+        self.display_name = source_id
+        self.delay = delay
+        self.value = 1.0
+
+    async def is_available(self) -> bool:
+        return True
+
+    async def get_current_data(self):
+        await asyncio.sleep(self.delay)
+        return [
+            SensorReading(
+                sensor_id=f"{self.source_id}_value",
+                name="Value",
+                value=self.value,
+                source=self.source_id,
+            )
+        ]
+
+
+def _manager(*providers, timeout: float = 0.2, **settings) -> SensorManager:
+    manager = SensorManager(
+        AppSettings(sensor_provider_timeout_seconds=timeout, **settings)
+    )
+    manager.sensor_providers.extend(providers)
+    return manager
+
+
+async def test_providers_are_collected_concurrently():
+    manager = _manager(FakeProvider("a", 0.1), FakeProvider("b", 0.1))
+    started = time.perf_counter()
+    await manager._collect_data_once()
+    assert time.perf_counter() - started < 0.19
+    assert set(manager._sensor_readings) == {"a", "b"}
+
+
+async def test_timed_out_provider_keeps_last_snapshot_as_stale():
+    slow = FakeProvider("slow")
+    manager = _manager(FakeProvider("fast"), slow)
+    await manager._collect_data_once()
+    assert not manager.is_source_stale("slow")
+
+    slow.delay, slow.value = 1.0, 2.0
+    await manager._collect_data_once()
+
+    stats = manager.get_source_statistics()["slow"]
+    assert stats.timeout_count == 1
+    assert stats.stale is True
+    assert manager._sensor_readings["slow"][0].value == 1.0
+    assert manager.get_source_statistics()["fast"].update_count == 2
+
+
+async def test_first_consumer_wakes_a_paused_collector():
+    manager = _manager(FakeProvider("a"), sensor_idle_poll_interval_seconds=0)
+    manager._initialized = True
+    collector = asyncio.create_task(manager._run_collector_task())
+    try:
+        await asyncio.sleep(0.05)
+        assert manager.collections_total == 1  # Startup round, then paused
+
+        manager.set_consumer_count(1)
+        await asyncio.sleep(0.05)
+        assert manager.collections_total == 2
+        assert manager.warmup_collections == 1
+        assert manager.get_collection_stats()["mode"] == "active"
+    finally:
+        manager._initialized = False
+        collector.cancel()
+        await asyncio.gather(collector, return_exceptions=True)
+
+
+async def test_idle_reads_collect_on_demand_once():
+    provider = FakeProvider("a", delay=0.05)
+    manager = _manager(provider)
+    await manager.get_latest_snapshot()
+    manager.snapshots.latest.collection_started -= 60  # Older than the poll interval
+
+    provider.value = 2.0
+    first, second = await asyncio.gather(
+        manager.get_latest_snapshot(), manager.get_latest_snapshot()
+    )
+
+    assert first is second
+    assert first.readings["a"][0].value == 2.0
+    assert manager.collections_total == 2
+
+
+async def test_scheduled_round_refreshes_only_due_sensors():
+    mock = MockSensor()
+    await mock.initialize(AppSettings())
+    manager = _manager(mock)
+    await manager._collect_data_once()
+    before = {r.sensor_id: r for r in manager._sensor_readings["mock"]}
+    due_id = next(iter(before))
+
+    await manager._collect_data_once({"mock": {due_id}})
+
+    after = {r.sensor_id: r for r in manager._sensor_readings["mock"]}
+    assert after.keys() == before.keys()
+    assert [sid for sid in after if after[sid] is not before[sid]] == [due_id]
+    assert manager.snapshots.latest.total_sensors == len(before)
+
+
+async def test_collector_reads_only_subscribed_sensors():
+    mock = MockSensor()
+    await mock.initialize(AppSettings())
+    manager = _manager(mock)
+    for definition in await mock.get_available_sensors():
+        manager._active_sensors[definition.sensor_id] = definition
+    wanted = next(iter(manager._active_sensors))
+
+    manager.set_subscriptions([Subscription(sensor_ids=[wanted])])
+    assert manager._restrict_to_interest(None) == {"mock": {wanted}}
+    assert manager._restrict_to_interest({"mock": {wanted, "other"}}) == {"mock": {wanted}}
+
+    manager.set_consumer_count(1)
+    manager._initialized = True
+    collector = asyncio.create_task(manager._run_collector_task())
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        manager._initialized = False
+        collector.cancel()
+    assert [r.sensor_id for r in manager._sensor_readings["mock"]] == [wanted]
+    assert manager.get_collection_stats()["subscribed_sensors"] == 1
+
+    manager.set_subscriptions([Subscription(sensor_ids=[wanted]), Subscription(everything=True)])
+    assert manager._restrict_to_interest(None) is None
+
+
+async def test_rest_reads_refresh_sensors_outside_the_subscriptions():
+    mock = MockSensor()
+    await mock.initialize(AppSettings())
+    manager = _manager(mock)
+    for definition in await mock.get_available_sensors():
+        manager._active_sensors[definition.sensor_id] = definition
+    wanted, unwanted = list(manager._active_sensors)[:2]
+    manager.set_subscriptions([Subscription(sensor_ids=[wanted])])
+    manager.set_consumer_count(1)
+
+    await manager._collect_data_once(manager._restrict_to_interest(None))
+    assert [r.sensor_id for r in manager._sensor_readings["mock"]] == [wanted]
+
+    snapshot = await manager.get_latest_snapshot()
+    ids = {r.sensor_id for rs in snapshot.readings.values() for r in rs}
+    assert unwanted in ids and len(ids) == len(manager._active_sensors)
+    assert manager._history.get_history(unwanted, 1)
+    assert manager.on_demand_collections == 1
+
+    # Within the poll interval the full read is reused
+    await manager.get_latest_snapshot()
+    assert manager.on_demand_collections == 1
+
+
+class FakeCollectorClient:
+    generation = 1
+    is_alive = True
+    is_overdue = False
+    definitions_version = 1
+
+    def __init__(self):
+        self.stale = set()
+        self.new = True
+
+    def has_new_snapshot(self):
+        return self.new
+
+    def definitions_for(self, source_id):
+        return []
+
+    def read(self):
+        reading = SensorReading(sensor_id="remote_value", name="Value", value=1.0, source="mock")
+        return {"mock": [reading]}, self.stale
+
+
+async def test_stale_remote_source_is_flagged_without_an_error():
+    client = FakeCollectorClient()
+    provider = RemoteSensor(client, "mock", "Mock")
+    await provider.initialize(AppSettings())
+    manager = _manager(provider)
+
+    client.stale = {"mock"}
+    await manager._collect_data_once()
+    stats = manager.get_source_statistics()["mock"]
+    assert stats.stale and stats.error_count == 0
+    assert manager.snapshots.latest.stale_sources == ["mock"]
+    assert manager._sensor_readings["mock"][0].value == 1.0
+
+    client.stale = set()
+    await manager._collect_data_once()
+    assert not manager.is_source_stale("mock")
+
+
+async def test_nothing_new_from_the_collector_process_publishes_nothing():
+    client = FakeCollectorClient()
+    provider = RemoteSensor(client, "mock", "Mock")
+    await provider.initialize(AppSettings())
+    manager = _manager(provider)
+    manager._collector_process = client
+
+    await manager._collect_data_once()
+    client.new = False
+    await manager._collect_data_once()
+
+    assert manager.snapshots.latest.version == 1
+    assert manager.get_collection_stats()["unchanged_collections"] == 1
+
+
+async def test_synthetic_sensor_count_loads_mock_next_to_hardware(tmp_path):
+    (tmp_path / "class" / "hwmon" / "hwmon0").mkdir(parents=True)
+    (tmp_path / "class" / "hwmon" / "hwmon0" / "name").write_text("coretemp\n")
+    (tmp_path / "class" / "hwmon" / "hwmon0" / "temp1_input").write_text("42000\n")
+    manager = SensorManager(
+        AppSettings(
+            hwmon_sysfs_root=str(tmp_path),
+            procfs_enabled=False,
+            mock_sensor_count=5,
+            sensor_watchdog_enabled=False,
+        )
+    )
+    await manager.initialize()
+    try:
+        assert [p.source_id for p in manager.sensor_providers] == ["hwmon", "mock"]
+    finally:
+        await manager.shutdown()
+
+
+class GrowingProvider(FakeProvider):
+    """Reports one more sensor after `grow()`, like a hot-plugged device."""
+
+    def __init__(self):
+        super().__init__("grow")
+        self.ids = ["grow_a"]
+        self.definitions_version = 1
+
+    def grow(self):
+        self.ids = ["grow_b"]
+        self.definitions_version += 1
+
+    async def get_available_sensors(self):
+        return [SensorDefinition(sensor_id=i, name=i, source_id="grow") for i in self.ids]
+
+
+async def test_definition_changes_reported_by_a_provider_are_registered():
+    provider = GrowingProvider()
+    manager = _manager(provider)
+    manager._register_definitions(provider, await provider.get_available_sensors())
+    version = manager.definitions_version
+
+    await manager._collect_data_once()
+    assert manager.definitions_version == version
+
+    provider.grow()
+    await manager._collect_data_once()
+    assert list(manager.get_sensor_definition_map()) == ["grow_b"]
+    assert manager.definitions_version == version + 1
+    assert manager.get_source_statistics()["grow"].total_sensors == 1
@@ -0,0 +1,153 @@
+"""Tests for the shared-memory snapshot buffer and the collector process."""
+
+import asyncio
+import math
+from array import array
+
+import pytest
+
+from app.core.config import AppSettings
+from app.models.sensor import SensorDefinition, SensorStatus
+from app.services.collector_process import CollectorProcessClient, _encode_status
+from app.services.shared_snapshot import FLAG_STALE, SharedSnapshotBuffer
+
+
+@pytest.fixture
+def buffer():
+    writer = SharedSnapshotBuffer.create(capacity=4)
+    yield writer
+    writer.close()
+
+
+def test_reader_sees_latest_published_snapshot(buffer):
+    reader = SharedSnapshotBuffer.attach(buffer.name)
+    try:
+        assert reader.read() is None
+        assert reader.latest_sequence is None
+
+        buffer.write(1, 100.0, 1, array("d", [1.0, 2.0]))
+        buffer.write(2, 101.0, 1, array("d", [3.0, math.nan, 5.0]), [0, 0, FLAG_STALE])
+
+        snapshot = reader.read()
+        assert (snapshot.sequence, snapshot.timestamp, snapshot.definitions_version) == (
+            2,
+            101.0,
+            1,
+        )
+        assert snapshot.values[0] == 3.0 and math.isnan(snapshot.values[1])
+        assert list(snapshot.flags) == [0, 0, FLAG_STALE]
+        # Nothing newer: answered from the header without copying
+        assert reader.read(after_sequence=2) is None
+        assert reader.latest_sequence == 2
+        assert reader.published == 2
+    finally:
+        reader.close()
+
+
+def test_client_decodes_status_and_observed_range(buffer):
+    client = CollectorProcessClient(AppSettings())
+    client._buffer = buffer
+    definitions = [
+        SensorDefinition(sensor_id=sensor_id, name=sensor_id, source_id="mock")
+        for sensor_id in ("cpu_temp", "gpu_temp")
+    ]
+    client._set_definitions(
+        1, [{"source_id": "mock"}], [d.model_dump(mode="json") for d in definitions]
+    )
+    buffer.write(
+        1,
+        100.0,
+        1,
+        array("d", [50.0, 60.0]),
+        [_encode_status(SensorStatus.ERROR) | FLAG_STALE, _encode_status("active")],
+        array("d", [40.0, math.nan]),
+        array("d", [70.0, math.nan]),
+    )
+
+    readings, stale = client.read()
+    cpu, gpu = readings["mock"]
+    assert (cpu.status, cpu.min_value, cpu.max_value) == (SensorStatus.ERROR, 40.0, 70.0)
+    # Not reported: falls back to the definition's range
+    assert (gpu.status, gpu.min_value, gpu.max_value) == (SensorStatus.ACTIVE, None, None)
+    assert stale == {"mock"}
+
+
+def test_write_rejects_more_values_than_capacity(buffer):
+    with pytest.raises(ValueError):
+        buffer.write(1, 0.0, 1, array("d", [0.0] * 5))
+
+
+@pytest.mark.anyio
+async def test_collector_process_publishes_mock_readings():
+    client = CollectorProcessClient(
+        AppSettings(
+            sensor_poll_interval_seconds=1,
+            sensor_collector_start_timeout_seconds=60,
+            # Mock readings even on hosts with real sensors
+            hwmon_enabled=False,
+            procfs_enabled=False,
+        )
+    )
+    assert await client.start()
+    try:
+        assert [s["source_id"] for s in client.sources] == ["mock"]
+        readings = {}
+        for _ in range(50):
+            readings, stale = client.read()
+            if readings:
+                break
+            await asyncio.sleep(0.1)
+        assert {r.sensor_id for r in readings["mock"]} == {
+            d.sensor_id for d in client.definitions_for("mock")
+        }
+        assert not stale
+    finally:
+        await client.stop()
+    assert not client.is_alive
+
+
+def test_collector_process_is_only_overdue_at_its_current_cadence():
+    client = CollectorProcessClient(
+        AppSettings(
+            sensor_poll_interval_seconds=1,
+            sensor_idle_poll_interval_seconds=0,
+            sensor_provider_timeout_seconds=1,
+        )
+    )
+    client._last_new_snapshot -= 3600
+    assert client.stale_after is None and not client.is_overdue  # Paused
+
+    client.set_consumer_count(1)
+    assert client.stale_after == 4
+    assert not client.is_overdue  # Cadence changed just now
+
+
+@pytest.mark.anyio
+async def test_collector_process_follows_the_consumer_count():
+    client = CollectorProcessClient(
+        AppSettings(
+            sensor_poll_interval_seconds=1,
+            sensor_collector_start_timeout_seconds=60,
+            hwmon_enabled=False,
+            procfs_enabled=False,
+        )
+    )
+    assert await client.start()
+    try:
+        for _ in range(50):
+            if client._buffer.published:
+                break
+            await asyncio.sleep(0.1)
+        # No consumers: the startup round, then the 60 s idle cadence
+        await asyncio.sleep(1.5)
+        assert client._buffer.published == 1
+
+        # The first consumer wakes it up straight away
+        client.set_consumer_count(1)
+        for _ in range(10):
+            if client._buffer.published > 1:
+                break
+            await asyncio.sleep(0.1)
+        assert client._buffer.published > 1
+    finally:
+        await client.stop()
@@ -0,0 +1,46 @@
+"""Tests for the snapshot channel and drift-free scheduling."""
+
+import asyncio
+
+import pytest
+
+from conftest import make_snapshot
+
+from app.services.scheduling import MonotonicTicker
+from app.services.snapshot_channel import SnapshotChannel
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_subscriber_gets_latest_snapshot_only():
+    channel = SnapshotChannel()
+    subscription = channel.subscribe()
+
+    for version in (1, 2, 3):
+        channel.publish(make_snapshot(version))
+
+    assert (await subscription.get()).version == 3
+    assert subscription.dropped == 2
+    assert channel.latest.version == 3
+
+    subscription.close()
+    assert channel.subscriber_count == 0
+
+
+async def test_ticker_does_not_drift_with_work_time():
+    loop = asyncio.get_running_loop()
+    ticker = MonotonicTicker(0.05)
+    started = loop.time()
+    for _ in range(4):
+        await asyncio.sleep(0.02)  # Simulated collection work
+        await ticker.wait()
+    # Four ticks of 50ms, not 4 * (50ms + 20ms)
+    assert loop.time() - started == pytest.approx(0.2, abs=0.04)
+
+
+async def test_ticker_skips_overrun_deadlines():
+    ticker = MonotonicTicker(0.01)
+    await ticker.wait()
+    await asyncio.sleep(0.05)
+    await ticker.wait()
+    assert ticker.missed_ticks >= 3
@@ -0,0 +1,54 @@
+"""Tests for per-client sensor subscriptions."""
+
+import pytest
+
+from conftest import make_reading, make_snapshot
+
+from app.services.snapshot_channel import SensorSnapshot
+from app.services.subscriptions import ALL, Subscription
+
+
+def _snapshot() -> SensorSnapshot:
+    readings = [
+        make_reading("cpu_temp", 1),
+        make_reading("gpu_load", 2, category="load", hardware_type="gpu"),
+        make_reading("ssd_temp", 3, hardware_type="storage"),
+    ]
+    return make_snapshot(5, readings)
+
+
+def _ids(snapshot: SensorSnapshot):
+    return [r.sensor_id for rs in snapshot.readings.values() for r in rs]
+
+
+def test_subscribe_narrows_and_unsubscribe_removes():
+    subscription = Subscription.from_command(ALL, {"hardware_types": ["gpu"]}, subscribe=True)
+    subscription = Subscription.from_command(
+        subscription, {"sensor_ids": ["ssd_temp"]}, subscribe=True
+    )
+    view = subscription.apply(_snapshot())
+    assert _ids(view) == ["gpu_load", "ssd_temp"]
+    assert view.version == 5
+
+    subscription = Subscription.from_command(
+        subscription, {"hardware_types": ["gpu"]}, subscribe=False
+    )
+    assert _ids(subscription.apply(_snapshot())) == ["ssd_temp"]
+
+
+def test_equal_subscriptions_share_a_group_key():
+    first = ALL.add(categories=["temperature"], sensor_ids=["a"])
+    second = ALL.add(sensor_ids=["a"]).add(categories=["temperature"])
+    assert first == second and hash(first) == hash(second)
+    assert ALL.apply(_snapshot()) is not None
+
+
+def test_unsubscribing_selectors_from_all_is_rejected():
+    with pytest.raises(ValueError):
+        Subscription.from_command(ALL, {"sensor_ids": ["cpu_temp"]}, subscribe=False)
+    assert Subscription.from_command(ALL, {"all": True}, subscribe=False).is_empty
+
+
+def test_unknown_category_is_rejected():
+    with pytest.raises(ValueError):
+        Subscription.from_command(ALL, {"categories": ["bogus"]}, subscribe=True)
@@ -0,0 +1,48 @@
+"""Tests for per-hardware update timing and backoff."""
+
+from app.sensors.update_profiler import HardwareUpdateProfiler
+
+
+def _poll(profiler, key, cost_ms):
+    if profiler.should_update(key):
+        profiler.record(key, cost_ms)
+        return True
+    return False
+
+
+def test_slow_node_is_backed_off_and_recovers():
+    profiler = HardwareUpdateProfiler(budget_ms=10.0, max_backoff=4)
+    profiler.register("cpu", "Intel Core i7", "Cpu")
+    profiler.register("nvme", "Samsung SSD", "Storage")
+
+    for _ in range(3):
+        _poll(profiler, "cpu", 1.0)
+        _poll(profiler, "nvme", 40.0)
+    stats = profiler.get_stats()
+    assert stats["backed_off"] == ["Samsung SSD"]
+    assert stats["nodes"]["Samsung SSD"]["backoff"] == 2
+
+    updated = [_poll(profiler, "nvme", 40.0) for _ in range(8)]
+    assert updated.count(True) < 8
+    assert profiler.get_stats()["nodes"]["Samsung SSD"]["backoff"] == 4
+    assert all(_poll(profiler, "cpu", 1.0) for _ in range(8))
+
+    # Once the node is cheap again it returns to every poll
+    for _ in range(60):
+        _poll(profiler, "nvme", 0.5)
+    assert profiler.get_stats()["nodes"]["Samsung SSD"]["backoff"] == 1
+
+
+def test_stats_report_percentiles_and_unique_labels():
+    profiler = HardwareUpdateProfiler(budget_ms=0)
+    profiler.register(1, "GeForce RTX", "GpuNvidia")
+    profiler.register(2, "GeForce RTX", "GpuNvidia")
+    for cost in range(1, 101):
+        profiler.record(1, float(cost))
+
+    nodes = profiler.get_stats()["nodes"]
+    assert set(nodes) == {"GeForce RTX", "GeForce RTX #2"}
+    first = nodes["GeForce RTX"]
+    assert (first["p50_ms"], first["p95_ms"], first["max_ms"]) == (50.0, 95.0, 100.0)
+    assert first["backoff"] == 1  # Budget 0 disables backoff
+    assert list(profiler.average_update_times()) == ["GeForce RTX"]
@@ -0,0 +1,97 @@
+"""Backpressure tests for per-connection WebSocket writers."""
+
+import asyncio
+
+import pytest
+
+from app.websocket_manager import WebSocketManager
+
+pytestmark = pytest.mark.anyio
+
+
+class SlowWebSocket:
+    """Fake WebSocket whose sends block until released."""
+
+    def __init__(self):
+        self.sent = []
+        self.release = asyncio.Event()
+        self.closed_with = None
+
+    async def connect_to(self, manager):
+        """Connect, letting the welcome message through, then start blocking."""
+        self.release.set()
+        await manager.connect(self, "slow")
+        await _settle()
+        self.sent.clear()
+        self.release.clear()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        await self.release.wait()
+        self.sent.append(message)
+
+    async def close(self, code=1000, reason=None):
+        self.closed_with = code
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_slow_client_keeps_latest_frames_and_all_control_messages():
+    manager = WebSocketManager(outbox_size=2)
+    slow = SlowWebSocket()
+    await slow.connect_to(manager)
+
+    await manager.broadcast("frame-0")
+    await _settle()  # Writer is now blocked sending frame-0
+    for i in range(1, 6):
+        await manager.broadcast(f"frame-{i}")
+    await manager.send_personal_message("control", slow)
+
+    stats = manager.get_connection_stats()
+    assert stats["total_dropped_frames"] == 3
+    assert stats["connections"][0]["queue_depth"] == 3
+
+    slow.release.set()
+    await _settle()
+    assert slow.sent == ["frame-0", "control", "frame-4", "frame-5"]
+    manager.disconnect(slow)
+
+
+async def test_lagging_client_is_disconnected():
+    manager = WebSocketManager(outbox_size=1, max_lag_seconds=0.0)
+    slow = SlowWebSocket()
+    await slow.connect_to(manager)
+
+    for i in range(4):
+        await manager.broadcast(f"frame-{i}")
+        await asyncio.sleep(0.01)
+    await _settle()
+
+    assert slow not in manager.active_connections
+    assert slow.closed_with == 1013
+
+
+async def test_lagging_client_is_closed_once():
+    manager = WebSocketManager(outbox_size=1, max_lag_seconds=0.0)
+    slow = SlowWebSocket()
+    await slow.connect_to(manager)
+    writer = manager._writers[slow]
+
+    for i in range(4):
+        writer.send_frame(f"frame-{i}")
+        await asyncio.sleep(0.01)
+    close_task = writer._close_task
+    assert writer.closing and close_task is not None
+
+    # Frames still arriving before the close runs schedule nothing new
+    writer.send_frame("frame-4")
+    writer.send_frame("frame-5")
+    assert writer._close_task is close_task
+
+    await close_task
+    assert slow not in manager.active_connections